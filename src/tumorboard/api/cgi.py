@@ -14,6 +14,7 @@ Key Design:
 - Complements FDA label search which uses generic text (e.g., "non-resistant mutations")
 """
 
+import asyncio
 import csv
 import re
 from datetime import datetime, timedelta
@@ -94,14 +95,17 @@ class CGIClient:
     CACHE_FILE = CACHE_DIR / "cgi_biomarkers.tsv"
     CACHE_MAX_AGE = timedelta(days=7)  # Re-download after 7 days
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, client: httpx.AsyncClient | None = None):
         """Initialize the CGI client.
 
         Args:
             timeout: Request timeout in seconds
+            client: Shared HTTP client for async downloads (caller closes it)
         """
         self.timeout = timeout
+        self._client = client
         self._biomarkers: list[dict[str, str]] | None = None
+        self._load_lock = asyncio.Lock()
 
     def _cache_is_valid(self) -> bool:
         """Check if the cached file exists and is recent enough."""
@@ -119,6 +123,25 @@ class CGIClient:
             response.raise_for_status()
             self.CACHE_FILE.write_text(response.text)
 
+    async def _download_biomarkers_async(self) -> None:
+        """Download the biomarkers TSV file without blocking the event loop."""
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+        if self._client is not None:
+            response = await self._client.get(self.BIOMARKERS_URL, timeout=self.timeout)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(self.BIOMARKERS_URL)
+        response.raise_for_status()
+        # The TSV is several MB, so writing it stays off the event loop
+        await asyncio.to_thread(self.CACHE_FILE.write_text, response.text)
+
+    def _read_cache_file(self) -> list[dict[str, str]]:
+        """Parse the cached biomarkers TSV file."""
+        with open(self.CACHE_FILE, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f, delimiter="\t")
+            return list(reader)
+
     def _load_biomarkers(self) -> list[dict[str, str]]:
         """Load and parse the biomarkers TSV file."""
         if not self._cache_is_valid():
@@ -126,12 +149,22 @@ class CGIClient:
                 self._download_biomarkers()
             except Exception as e:
                 if not self.CACHE_FILE.exists():
-                    raise CGIError(f"Failed to download CGI biomarkers: {e}")
+                    raise CGIError(f"Failed to download CGI biomarkers: {e}") from e
                 # Use stale cache if download fails
 
-        with open(self.CACHE_FILE, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-            return list(reader)
+        return self._read_cache_file()
+
+    async def _load_biomarkers_async(self) -> list[dict[str, str]]:
+        """Async counterpart of _load_biomarkers for use inside the event loop."""
+        if not self._cache_is_valid():
+            try:
+                await self._download_biomarkers_async()
+            except Exception as e:
+                if not self.CACHE_FILE.exists():
+                    raise CGIError(f"Failed to download CGI biomarkers: {e}") from e
+                # Use stale cache if download fails
+
+        return await asyncio.to_thread(self._read_cache_file)
 
     def _get_biomarkers(self) -> list[dict[str, str]]:
         """Get biomarkers, loading from cache if needed."""
@@ -139,6 +172,14 @@ class CGIClient:
             self._biomarkers = self._load_biomarkers()
         return self._biomarkers
 
+    async def _get_biomarkers_async(self) -> list[dict[str, str]]:
+        """Get biomarkers, loading once even when many variants request them concurrently."""
+        if self._biomarkers is None:
+            async with self._load_lock:
+                if self._biomarkers is None:
+                    self._biomarkers = await self._load_biomarkers_async()
+        return self._biomarkers
+
     def _variant_matches(self, cgi_alteration: str, gene: str, variant: str) -> bool:
         """Check if a CGI alteration pattern matches a specific variant.
 
@@ -254,7 +295,35 @@ class CGIClient:
         Returns:
             List of matching CGIBiomarker objects
         """
-        biomarkers = self._get_biomarkers()
+        return self._match_biomarkers(self._get_biomarkers(), gene, variant, tumor_type)
+
+    async def fetch_biomarkers_async(
+        self, gene: str, variant: str, tumor_type: str | None = None
+    ) -> list[CGIBiomarker]:
+        """Fetch CGI biomarkers from within the event loop.
+
+        Same results as fetch_biomarkers, but the one-time TSV download uses
+        httpx.AsyncClient instead of occupying a worker thread.
+
+        Args:
+            gene: Gene symbol (e.g., "EGFR")
+            variant: Variant notation (e.g., "G719S")
+            tumor_type: Optional tumor type to filter results
+
+        Returns:
+            List of matching CGIBiomarker objects
+        """
+        biomarkers = await self._get_biomarkers_async()
+        return self._match_biomarkers(biomarkers, gene, variant, tumor_type)
+
+    def _match_biomarkers(
+        self,
+        biomarkers: list[dict[str, str]],
+        gene: str,
+        variant: str,
+        tumor_type: str | None = None,
+    ) -> list[CGIBiomarker]:
+        """Select biomarker rows matching a gene/variant and optional tumor type."""
         matches = []
         gene_upper = gene.upper()
 
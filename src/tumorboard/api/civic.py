@@ -19,6 +19,7 @@ Key Design:
 from typing import Any
 
 import httpx
+import orjson
 
 from tumorboard.constants import TUMOR_TYPE_MAPPINGS
 
@@ -177,23 +178,26 @@ class CIViCClient:
     }
     """
 
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, client: httpx.AsyncClient | None = None):
         """Initialize the CIViC client.
 
         Args:
             timeout: Request timeout in seconds
+            client: Shared HTTP client to use instead of creating one (caller closes it)
         """
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
 
     async def __aenter__(self):
         """Initialize HTTP client session."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Close HTTP client session."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -324,7 +328,7 @@ class CIViCClient:
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
         except httpx.HTTPError as e:
             raise CIViCError(f"CIViC API request failed: {e}")
         except Exception as e:
@@ -404,6 +408,6 @@ class CIViCClient:
 
     async def close(self) -> None:
         """Close the HTTP client."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
@@ -16,6 +16,7 @@ import re
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -25,6 +26,7 @@ from tenacity import (
 
 from tumorboard.api.myvariant_models import MyVariantHit, MyVariantResponse
 
+from tumorboard.models.evidence._validate import validated
 from tumorboard.models.evidence.civic import  CIViCEvidence
 from tumorboard.models.evidence.clinvar import ClinVarEvidence
 from tumorboard.models.evidence.cosmic import COSMICEvidence
@@ -55,25 +57,29 @@ class MyVariantClient:
         self,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 3,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the MyVariant client.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            client: Shared HTTP client to use instead of creating one (caller closes it)
         """
         self.timeout = timeout
         self.max_retries = max_retries
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
 
     async def __aenter__(self) -> "MyVariantClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -109,7 +115,7 @@ class MyVariantClient:
 
         response = await client.get(f"{self.BASE_URL}/query", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if "error" in data:
             raise MyVariantAPIError(f"API error: {data['error']}")
@@ -128,7 +134,7 @@ class MyVariantClient:
         client = self._get_client()
         response = await client.get(f"{self.BASE_URL}/variant/{variant_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def _parse_civic_evidence(self, civic_data: dict[str, Any] | list[Any]) -> list[CIViCEvidence]:
         """Parse CIViC data into evidence objects.
@@ -165,7 +171,8 @@ class MyVariantClient:
                         drugs = [t.get("name", "") for t in therapies if isinstance(t, dict)]
 
                         evidence_list.append(
-                            CIViCEvidence(
+                            validated(
+                                CIViCEvidence,
                                 evidence_type=ev_item.get("evidenceType"),  # camelCase in new API
                                 evidence_level=ev_item.get("evidenceLevel"),  # camelCase in new API
                                 evidence_direction=ev_item.get("evidenceDirection"),
@@ -183,7 +190,8 @@ class MyVariantClient:
             elif "evidence_items" in item:
                 for ev_item in item.get("evidence_items", []):
                     evidence_list.append(
-                        CIViCEvidence(
+                        validated(
+                            CIViCEvidence,
                             evidence_type=ev_item.get("evidence_type"),
                             evidence_level=ev_item.get("evidence_level"),
                             evidence_direction=ev_item.get("evidence_direction"),
@@ -206,7 +214,8 @@ class MyVariantClient:
             else:
                 # Direct evidence object (legacy format)
                 evidence_list.append(
-                    CIViCEvidence(
+                    validated(
+                        CIViCEvidence,
                         evidence_type=item.get("evidence_type"),
                         evidence_level=item.get("evidence_level"),
                         evidence_direction=item.get("evidence_direction"),
@@ -260,7 +269,8 @@ class MyVariantClient:
                     conditions.append(cond_data.get("name", ""))
 
             evidence_list.append(
-                ClinVarEvidence(
+                validated(
+                    ClinVarEvidence,
                     clinical_significance=str(clin_sig) if clin_sig else None,
                     review_status=item.get("review_status"),
                     conditions=conditions,
@@ -292,7 +302,8 @@ class MyVariantClient:
                 continue
 
             evidence_list.append(
-                COSMICEvidence(
+                validated(
+                    COSMICEvidence,
                     mutation_id=item.get("mutation_id"),
                     primary_site=item.get("primary_site"),
                     site_subtype=item.get("site_subtype"),
@@ -542,7 +553,7 @@ class MyVariantClient:
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             profiles = data.get("data", {}).get("molecularProfiles", {}).get("nodes", [])
 
             # Extract unique disease names
@@ -591,7 +602,7 @@ class MyVariantClient:
             if search_response.status_code != 200:
                 return None
 
-            search_data = search_response.json()
+            search_data = orjson.loads(search_response.content)
             id_list = search_data.get("esearchresult", {}).get("idlist", [])
 
             if not id_list:
@@ -610,7 +621,7 @@ class MyVariantClient:
             if summary_response.status_code != 200:
                 return None
 
-            summary_data = summary_response.json()
+            summary_data = orjson.loads(summary_response.content)
             result = summary_data.get("result", {}).get(variant_id, {})
 
             # Extract relevant fields
@@ -722,7 +733,7 @@ class MyVariantClient:
                 if response.status_code != 200:
                     continue
 
-                data = response.json()
+                data = orjson.loads(response.content)
                 profiles = data.get("data", {}).get("molecularProfiles", {}).get("nodes", [])
 
                 if not profiles:
@@ -743,7 +754,8 @@ class MyVariantClient:
 
                         # Map GraphQL field names to Evidence model fields
                         all_civic_evidence.append(
-                            CIViCEvidence(
+                            validated(
+                                CIViCEvidence,
                                 evidence_type=item.get("evidenceType"),  # camelCase in GraphQL
                                 evidence_level=item.get("evidenceLevel"),
                                 evidence_direction=item.get("evidenceDirection"),
@@ -891,6 +903,6 @@ class MyVariantClient:
 
     async def close(self) -> None:
         """Close the HTTP client."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
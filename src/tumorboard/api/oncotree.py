@@ -16,6 +16,7 @@ Key Design:
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -51,26 +52,30 @@ class OncoTreeClient:
         self,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 3,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the OncoTree client.
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            client: Shared HTTP client to use instead of creating one (caller closes it)
         """
         self.timeout = timeout
         self.max_retries = max_retries
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
         self._cache: dict[str, Any] = {}  # Simple in-memory cache
 
     async def __aenter__(self) -> "OncoTreeClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -104,7 +109,7 @@ class OncoTreeClient:
         try:
             response = await client.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Cache the result
             self._cache["all_tumor_types"] = data
@@ -288,6 +293,6 @@ class OncoTreeClient:
 
     async def close(self) -> None:
         """Close the HTTP client."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
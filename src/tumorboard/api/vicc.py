@@ -19,9 +19,11 @@ Key Design:
 - Sources attributed to original KB for provenance tracking
 """
 
+import re
 from typing import Any
 
 import httpx
+import orjson
 
 from tumorboard.constants import TUMOR_TYPE_MAPPINGS
 
@@ -39,6 +41,10 @@ class VICCAssociation:
     clinical significance and evidence level.
     """
 
+    # OncoKB uses levels like 1A, 1B, 2A, 2B, 3A, 3B, 4, R1, R2
+    ONCOKB_LEVEL_PATTERN = re.compile(r'^([1234][AB]?|R[12])$')
+    SENSITIVITY_TERMS = ("SENSITIV", "RESPONSE", "RESPONSIVE")
+
     def __init__(
         self,
         description: str,
@@ -68,7 +74,7 @@ class VICCAssociation:
         if not self.response_type:
             return False
         rt_upper = self.response_type.upper()
-        return any(term in rt_upper for term in ["SENSITIV", "RESPONSE", "RESPONSIVE"])
+        return any(term in rt_upper for term in self.SENSITIVITY_TERMS)
 
     def is_resistance(self) -> bool:
         """Check if this represents a resistance association."""
@@ -80,9 +86,7 @@ class VICCAssociation:
         """Extract OncoKB-style level if present (1A, 1B, 2A, 2B, 3A, 3B, 4, R1, R2)."""
         if not self.response_type:
             return None
-        # OncoKB uses levels like 1A, 1B, 2A, 2B, 3A, 3B, 4, R1, R2
-        import re
-        match = re.match(r'^([1234][AB]?|R[12])$', self.response_type.upper())
+        match = self.ONCOKB_LEVEL_PATTERN.match(self.response_type.upper())
         if match:
             return match.group(1)
         return None
@@ -120,23 +124,26 @@ class VICCClient:
     DEFAULT_TIMEOUT = 30.0
     DEFAULT_SIZE = 50  # Number of results per query
 
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, client: httpx.AsyncClient | None = None):
         """Initialize the VICC client.
 
         Args:
             timeout: Request timeout in seconds
+            client: Shared HTTP client to use instead of creating one (caller closes it)
         """
         self.timeout = timeout
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = client
+        self._owns_client = client is None
 
     async def __aenter__(self):
         """Initialize HTTP client session."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._owns_client:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Close HTTP client session."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -339,7 +346,7 @@ class VICCClient:
         try:
             response = await client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
         except httpx.HTTPError as e:
             raise VICCError(f"VICC API request failed: {e}")
         except Exception as e:
@@ -19,6 +19,7 @@ from typing import Optional
 import typer
 from dotenv import load_dotenv
 from tumorboard.engine import AssessmentEngine
+from tumorboard.models.assessment import TIER_ORDER
 from tumorboard.models.variant import VariantInput
 from tumorboard.validation.validator import Validator
 
@@ -44,6 +45,7 @@ def assess(
     temperature: float = typer.Option(0.1, "--temperature", help="LLM temperature (0.0-1.0)"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output JSON file"),
     log: bool = typer.Option(True, "--log/--no-log", help="Enable LLM decision logging"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached LLM assessments for identical prompts"),
     vicc: bool = typer.Option(True, "--vicc/--no-vicc", help="Enable VICC MetaKB integration"),
 ) -> None:
     """Assess clinical actionability of a single variant."""
@@ -56,7 +58,7 @@ def assess(
         else:
             print(f"\nAssessing {gene} {variant}...")
 
-        async with AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_logging=log, enable_vicc=vicc) as engine:
+        async with AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_logging=log, enable_vicc=vicc, enable_llm_cache=cache) as engine:
             assessment = await engine.assess_variant(variant_input)
 
             print(assessment.to_report())
@@ -77,6 +79,8 @@ def batch(
     model: str = typer.Option("gpt-4o-mini", "--model", "-m", help="LLM model"),
     temperature: float = typer.Option(0.1, "--temperature", help="LLM temperature (0.0-1.0)"),
     log: bool = typer.Option(True, "--log/--no-log", help="Enable LLM decision logging"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached LLM assessments for identical prompts"),
+    llm_batch_size: int = typer.Option(1, "--llm-batch-size", min=1, help="Variants packed into each LLM call (1 = one call per variant; capped by the model's output token limit)"),
 ) -> None:
     """Batch process multiple variants."""
 
@@ -91,7 +95,7 @@ def batch(
         variants = [VariantInput(**item) for item in data]
         print(f"\nLoaded {len(variants)} variants from {input_file}")
 
-        async with AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_logging=log) as engine:
+        async with AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_logging=log, enable_llm_cache=cache, llm_batch_size=llm_batch_size) as engine:
             print(f"Assessing {len(variants)} variants...")
             assessments = await engine.batch_assess(variants)
 
@@ -105,12 +109,12 @@ def batch(
             # Simple tier counts
             tier_counts = {}
             for assessment in assessments:
-                tier = assessment.tier.value
-                tier_counts[tier] = tier_counts.get(tier, 0) + 1
+                tier_counts[assessment.tier] = tier_counts.get(assessment.tier, 0) + 1
 
             print("\nTier Distribution:")
-            for tier, count in sorted(tier_counts.items()):
-                print(f"  {tier}: {count}")
+            # Clinical order, with UNKNOWN last
+            for tier in sorted(tier_counts, key=lambda t: TIER_ORDER.get(t, len(TIER_ORDER))):
+                print(f"  {tier}: {tier_counts[tier]}")
 
     asyncio.run(run_batch())
 
@@ -123,6 +127,7 @@ def validate(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
     max_concurrent: int = typer.Option(3, "--max-concurrent", "-c", help="Max concurrent"),
     log: bool = typer.Option(True, "--log/--no-log", help="Enable LLM decision logging"),
+    cache: bool = typer.Option(False, "--cache/--no-cache", help="Reuse cached LLM assessments for identical prompts (off by default so each run scores fresh model output)"),
     vicc: bool = typer.Option(True, "--vicc/--no-vicc", help="Enable VICC MetaKB integration"),
 ) -> None:
     """Validate LLM assessments against gold standard."""
@@ -132,7 +137,7 @@ def validate(
         raise typer.Exit(1)
 
     async def run_validation() -> None:
-        async with AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_logging=log, enable_vicc=vicc) as engine:
+        async with AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_logging=log, enable_vicc=vicc, enable_llm_cache=cache) as engine:
             validator = Validator(engine)
 
             entries = validator.load_gold_standard(gold_standard)
@@ -9,7 +9,9 @@ Key Design:
 - Async context manager for HTTP session lifecycle
 - Sequential per-variant, parallel across variants (asyncio.gather)
 - Batch exceptions captured, not raised
-- Stateless with no shared state
+- State is per engine instance, shared by its concurrent tasks: memoized tumor type
+  resolutions, in-flight assessments for duplicate coalescing and per-source API
+  semaphores (no module-level state)
 - Variant normalization before API calls for better evidence matching
 - FDA drug approval data fetched in parallel with MyVariant data
 - CGI biomarkers provide explicit FDA/NCCN approval status
@@ -17,6 +19,14 @@ Key Design:
 """
 
 import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import cached_property
+from typing import Any, TypeVar
+
+import httpx
+
 from tumorboard.api.myvariant import MyVariantClient
 from tumorboard.api.fda import FDAClient
 from tumorboard.api.cgi import CGIClient
@@ -24,13 +34,55 @@ from tumorboard.api.oncotree import OncoTreeClient
 from tumorboard.api.vicc import VICCClient
 from tumorboard.api.civic import CIViCClient
 from tumorboard.llm.service import LLMService
-from tumorboard.models.assessment import ActionabilityAssessment
+from tumorboard.models.assessment import ActionabilityAssessment, ActionabilityTier
 from tumorboard.models.evidence.cgi import CGIBiomarkerEvidence
 from tumorboard.models.evidence.civic import CIViCAssertionEvidence
+from tumorboard.models.evidence.evidence import Evidence
 from tumorboard.models.evidence.fda import FDAApproval
 from tumorboard.models.evidence.vicc import VICCEvidence
 from tumorboard.models.variant import VariantInput
-from tumorboard.utils import normalize_variant
+from tumorboard.utils import VariantNormalizer, normalize_variant
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_ALLOWED_TYPES = frozenset(VariantNormalizer.ALLOWED_VARIANT_TYPES)
+
+
+def _or_default(result: T | BaseException, source: str, default: Callable[[], T]) -> T:
+    """Return a gathered result, or log the failure and fall back to ``default()``."""
+    if isinstance(result, BaseException):
+        logger.warning("%s failed: %s", source, result)
+        return default()
+    return result
+
+
+# Evidence sources in the order _fetch_all_evidence gathers them
+_EVIDENCE_SOURCES = ("MyVariant API", "FDA API", "CGI biomarkers", "VICC MetaKB API", "CIViC Assertions API")
+
+
+# Stock LLM output for variants with no evidence or annotation signal from any source
+_NO_EVIDENCE_RESPONSE = {
+    "tier": ActionabilityTier.TIER_III,
+    "confidence_score": 0.5,
+    "summary": "No clinical evidence found for this variant in any queried source.",
+    "rationale": (
+        "MyVariant, FDA, CGI, VICC and CIViC returned no evidence and no functional "
+        "annotations, so the variant is of unknown clinical significance (Tier III)."
+    ),
+    "evidence_strength": "Weak",
+}
+
+
+def _has_signal(evidence: Evidence) -> bool:
+    """Whether the evidence gives the LLM anything to reason about."""
+    return bool(
+        evidence.has_evidence()
+        or evidence.clinvar_id
+        or evidence.cadd_score is not None
+        or evidence.alphamissense_score is not None
+    )
 
 
 class AssessmentEngine:
@@ -41,41 +93,119 @@ class AssessmentEngine:
     significantly improving performance for batch assessments.
     """
 
-    def __init__(self, llm_model: str = "gpt-4o-mini", llm_temperature: float = 0.1, enable_logging: bool = True, enable_vicc: bool = True, enable_civic_assertions: bool = True):
-        self.myvariant_client = MyVariantClient()
-        self.fda_client = FDAClient()
-        self.cgi_client = CGIClient()
-        self.oncotree_client = OncoTreeClient()
-        self.vicc_client = VICCClient() if enable_vicc else None
-        self.civic_client = CIViCClient() if enable_civic_assertions else None
+    HTTP_TIMEOUT = 30.0
+    DEFAULT_API_CONCURRENCY = 10
+    # Lazily created API clients with an async context manager to close on exit
+    _API_CLIENTS = ("myvariant_client", "fda_client", "oncotree_client", "vicc_client", "civic_client")
+
+    def __init__(self, llm_model: str = "gpt-4o-mini", llm_temperature: float = 0.1, enable_logging: bool = True, enable_vicc: bool = True, enable_civic_assertions: bool = True, enable_llm_cache: bool = False, llm_batch_size: int = 1, skip_empty: bool = True, llm_concurrency: int = LLMService.DEFAULT_MAX_CONCURRENCY, api_concurrency: int = DEFAULT_API_CONCURRENCY):
         self.enable_vicc = enable_vicc
         self.enable_civic_assertions = enable_civic_assertions
-        self.llm_service = LLMService(model=llm_model, temperature=llm_temperature, enable_logging=enable_logging)
+        # The on-disk LLM cache is opt-in so validation runs never score stale answers;
+        # interactive assess/batch entry points turn it on
+        self.llm_service = LLMService(model=llm_model, temperature=llm_temperature, enable_logging=enable_logging, enable_cache=enable_llm_cache, max_concurrency=llm_concurrency)
+        # Per-source caps on concurrent requests to the rate-limited MyVariant and FDA APIs
+        self._api_semaphores = {
+            "myvariant": asyncio.Semaphore(api_concurrency),
+            "fda": asyncio.Semaphore(api_concurrency),
+        }
+        # Resolved tumor types keyed by normalized user input, shared across batch tasks
+        self._tumor_type_cache: dict[str, str] = {}
+        self._tumor_type_locks: dict[str, asyncio.Lock] = {}
+        # Variants packed into one LLM completion by batch_assess (1 = one call per variant),
+        # bounded so a group's assessments fit in the model's output token limit
+        if llm_batch_size > self.llm_service.max_batch_size:
+            logger.warning(
+                "llm_batch_size %d exceeds the %d-token output limit of %s; using %d",
+                llm_batch_size, self.llm_service.max_output_tokens, llm_model, self.llm_service.max_batch_size,
+            )
+            llm_batch_size = self.llm_service.max_batch_size
+        self.llm_batch_size = max(1, llm_batch_size)
+        # Return a stock Tier III assessment without an LLM call when no source has evidence
+        self.skip_empty = skip_empty
+        # In-flight assessments keyed by canonical (gene, variant, tumor_type)
+        self._inflight: dict[tuple[str, str, str], asyncio.Task[ActionabilityAssessment]] = {}
+
+    # One pooled HTTP client shared by every API client so keep-alive connections
+    # are reused across sources; opened on first request, closed by __aexit__
+    @cached_property
+    def _http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+
+    # API clients are built on first access, so sources a run never touches
+    # (e.g. OncoTree when no tumor type is given) cost nothing
+    @cached_property
+    def myvariant_client(self) -> MyVariantClient:
+        return MyVariantClient(client=self._http_client)
+
+    @cached_property
+    def fda_client(self) -> FDAClient:
+        return FDAClient(client=self._http_client)
+
+    @cached_property
+    def cgi_client(self) -> CGIClient:
+        return CGIClient(client=self._http_client)
+
+    @cached_property
+    def oncotree_client(self) -> OncoTreeClient:
+        return OncoTreeClient(client=self._http_client)
+
+    @cached_property
+    def vicc_client(self) -> VICCClient | None:
+        return VICCClient(client=self._http_client) if self.enable_vicc else None
+
+    @cached_property
+    def civic_client(self) -> CIViCClient | None:
+        return CIViCClient(client=self._http_client) if self.enable_civic_assertions else None
 
     async def __aenter__(self):
         """
-        Initialize HTTP client session for connection pooling.
+        Enter the engine's HTTP lifecycle.
 
-        Use with 'async with' syntax to ensure proper resource cleanup.
+        API clients share the pooled HTTP client and are created lazily, so there
+        is nothing to open up front. Use with 'async with' syntax to ensure proper
+        resource cleanup.
         """
-        await self.myvariant_client.__aenter__()
-        await self.fda_client.__aenter__()
-        await self.oncotree_client.__aenter__()
-        if self.vicc_client:
-            await self.vicc_client.__aenter__()
-        if self.civic_client:
-            await self.civic_client.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close HTTP client session to prevent resource leaks."""
-        await self.myvariant_client.__aexit__(exc_type, exc_val, exc_tb)
-        await self.fda_client.__aexit__(exc_type, exc_val, exc_tb)
-        await self.oncotree_client.__aexit__(exc_type, exc_val, exc_tb)
-        if self.vicc_client:
-            await self.vicc_client.__aexit__(exc_type, exc_val, exc_tb)
-        if self.civic_client:
-            await self.civic_client.__aexit__(exc_type, exc_val, exc_tb)
+        """Close the API clients that were used and the shared HTTP client."""
+        for name in self._API_CLIENTS:
+            client = self.__dict__.get(name)
+            if client is not None:
+                await client.__aexit__(exc_type, exc_val, exc_tb)
+        http_client = self.__dict__.get("_http_client")
+        if http_client is not None:
+            await http_client.aclose()
+
+    async def _limited(self, source: str, coro: Awaitable[T]) -> T:
+        """Await an API call while holding the concurrency slot for its source."""
+        async with self._api_semaphores[source]:
+            return await coro
+
+    async def _resolve_tumor_type(self, tumor_type: str) -> str:
+        """Resolve a tumor type through OncoTree, memoized per engine instance.
+
+        Concurrent lookups for the same key wait on a per-key lock so only the
+        first one hits the API. Failed lookups are not cached. A key's lock is
+        dropped once its result is cached, since later lookups never reach it.
+        """
+        key = tumor_type.strip().lower()
+        if key in self._tumor_type_cache:
+            return self._tumor_type_cache[key]
+
+        lock = self._tumor_type_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                if key not in self._tumor_type_cache:
+                    self._tumor_type_cache[key] = await self.oncotree_client.resolve_tumor_type(tumor_type)
+                return self._tumor_type_cache[key]
+        finally:
+            if key in self._tumor_type_cache and self._tumor_type_locks.get(key) is lock:
+                del self._tumor_type_locks[key]
 
     async def assess_variant(self, variant_input: VariantInput) -> ActionabilityAssessment:
         """Assess a single variant.
@@ -88,6 +218,49 @@ class AssessmentEngine:
 
         The 'await' keyword yields control during I/O, allowing other tasks to run.
         """
+        evidence, resolved_tumor_type = await self._fetch_all_evidence(variant_input)
+
+        # Step 4: Assess with LLM (must run sequentially since it depends on evidence)
+        # Use original variant notation for display/reporting
+        # Use resolved tumor type for evidence filtering and FDA matching
+        return await self._assess_evidence(variant_input, evidence, resolved_tumor_type)
+
+    async def _assess_evidence(
+        self, variant_input: VariantInput, evidence: Evidence, resolved_tumor_type: str | None
+    ) -> ActionabilityAssessment:
+        """Run the LLM step, or short-circuit when there is no evidence to assess."""
+        stock = self._no_evidence_assessment(variant_input, evidence, resolved_tumor_type)
+        if stock is not None:
+            return stock
+
+        return await self.llm_service.assess_variant(
+            gene=variant_input.gene,
+            variant=variant_input.variant,  # Keep original for display
+            tumor_type=resolved_tumor_type,  # Use resolved tumor type
+            evidence=evidence,
+        )
+
+    def _no_evidence_assessment(
+        self, variant_input: VariantInput, evidence: Evidence, resolved_tumor_type: str | None
+    ) -> ActionabilityAssessment | None:
+        """Build the stock assessment for an evidence-free variant, or None if the LLM is needed.
+
+        Only used when every source answered: an empty result from a failed source
+        says nothing about the variant, so those cases still go to the LLM.
+        """
+        if not self.skip_empty or evidence.failed_sources or _has_signal(evidence):
+            return None
+        logger.debug("No evidence for %s %s, skipping LLM", variant_input.gene, variant_input.variant)
+        return LLMService.build_assessment(
+            _NO_EVIDENCE_RESPONSE, variant_input.gene, variant_input.variant, resolved_tumor_type, evidence
+        )
+
+    async def _fetch_all_evidence(self, variant_input: VariantInput) -> tuple[Evidence, str | None]:
+        """Run steps 1-3 of the pipeline: normalize, validate and gather evidence.
+
+        Returns:
+            Populated Evidence and the OncoTree-resolved tumor type
+        """
         # Step 1: Normalize variant notation for better API matching
         # Converts formats like Val600Glu or p.V600E to canonical V600E
         normalized = normalize_variant(variant_input.gene, variant_input.variant)
@@ -95,8 +268,7 @@ class AssessmentEngine:
         variant_type = normalized['variant_type']
 
         # Step 2: Validate variant type - only SNPs and small indels allowed
-        from tumorboard.utils.variant_normalization import VariantNormalizer
-        if variant_type not in VariantNormalizer.ALLOWED_VARIANT_TYPES:
+        if variant_type not in _ALLOWED_TYPES:
             raise ValueError(
                 f"Variant type '{variant_type}' is not supported. "
                 f"Only SNPs and small indels are allowed (missense, nonsense, insertion, deletion, frameshift). "
@@ -105,19 +277,19 @@ class AssessmentEngine:
 
         # Log normalization if variant was transformed
         if normalized_variant != variant_input.variant:
-            print(f"  Normalized {variant_input.variant} → {normalized_variant} (type: {variant_type})")
+            logger.debug("Normalized %s → %s (type: %s)", variant_input.variant, normalized_variant, variant_type)
 
         # Step 2.5: Resolve tumor type using OncoTree (e.g., NSCLC → Non-Small Cell Lung Cancer)
         # This helps match user input to FDA indication text and CIViC evidence
         resolved_tumor_type = variant_input.tumor_type
         if variant_input.tumor_type:
             try:
-                resolved = await self.oncotree_client.resolve_tumor_type(variant_input.tumor_type)
+                resolved = await self._resolve_tumor_type(variant_input.tumor_type)
                 if resolved != variant_input.tumor_type:
-                    print(f"  Resolved tumor type: {variant_input.tumor_type} → {resolved}")
+                    logger.debug("Resolved tumor type: %s → %s", variant_input.tumor_type, resolved)
                     resolved_tumor_type = resolved
             except Exception as e:
-                print(f"  Warning: OncoTree resolution failed: {str(e)}")
+                logger.warning("OncoTree resolution failed: %s", e)
                 resolved_tumor_type = variant_input.tumor_type
 
         # Step 3: Fetch evidence from MyVariant, FDA, CGI, VICC, and CIViC APIs in parallel
@@ -142,17 +314,16 @@ class AssessmentEngine:
                 )
             return []
 
-        evidence, fda_approvals_raw, cgi_biomarkers_raw, vicc_associations_raw, civic_assertions_raw = await asyncio.gather(
-            self.myvariant_client.fetch_evidence(
+        gathered = await asyncio.gather(
+            self._limited("myvariant", self.myvariant_client.fetch_evidence(
                 gene=variant_input.gene,
                 variant=normalized_variant,  # Use normalized variant for API query
-            ),
-            self.fda_client.fetch_drug_approvals(
+            )),
+            self._limited("fda", self.fda_client.fetch_drug_approvals(
                 gene=variant_input.gene,
                 variant=normalized_variant,
-            ),
-            asyncio.to_thread(
-                self.cgi_client.fetch_biomarkers,
+            )),
+            self.cgi_client.fetch_biomarkers_async(
                 variant_input.gene,
                 normalized_variant,
                 resolved_tumor_type,
@@ -161,47 +332,37 @@ class AssessmentEngine:
             fetch_civic_assertions(),
             return_exceptions=True
         )
-
-        # Handle exceptions from parallel calls
-        if isinstance(evidence, Exception):
-            print(f"  Warning: MyVariant API failed: {str(evidence)}")
-            # Create empty evidence object
-            from tumorboard.models.evidence import Evidence
-            evidence = Evidence(
-                variant_id=f"{variant_input.gene}:{normalized_variant}",
-                gene=variant_input.gene,
-                variant=normalized_variant,
-            )
-
-        if isinstance(fda_approvals_raw, Exception):
-            print(f"  Warning: FDA API failed: {str(fda_approvals_raw)}")
-            fda_approvals_raw = []
-
-        if isinstance(cgi_biomarkers_raw, Exception):
-            print(f"  Warning: CGI biomarkers failed: {str(cgi_biomarkers_raw)}")
-            cgi_biomarkers_raw = []
-
-        if isinstance(vicc_associations_raw, Exception):
-            print(f"  Warning: VICC MetaKB API failed: {str(vicc_associations_raw)}")
-            vicc_associations_raw = []
-
-        if isinstance(civic_assertions_raw, Exception):
-            print(f"  Warning: CIViC Assertions API failed: {str(civic_assertions_raw)}")
-            civic_assertions_raw = []
-
-        # Parse FDA approval data and add to evidence
+        evidence, fda_approvals_raw, cgi_biomarkers_raw, vicc_associations_raw, civic_assertions_raw = gathered
+
+        failed_sources = [
+            source
+            for source, result in zip(_EVIDENCE_SOURCES, gathered, strict=True)
+            if isinstance(result, BaseException)
+        ]
+
+        # Failed sources degrade to empty results instead of failing the assessment
+        # model_validate leaves the optional annotation fields to their defaults
+        evidence = _or_default(evidence, "MyVariant API", lambda: Evidence.model_validate({
+            "variant_id": f"{variant_input.gene}:{normalized_variant}",
+            "gene": variant_input.gene,
+            "variant": normalized_variant,
+        }))
+        fda_approvals_raw = _or_default(fda_approvals_raw, "FDA API", list)
+        cgi_biomarkers_raw = _or_default(cgi_biomarkers_raw, "CGI biomarkers", list)
+        vicc_associations_raw = _or_default(vicc_associations_raw, "VICC MetaKB API", list)
+        civic_assertions_raw = _or_default(civic_assertions_raw, "CIViC Assertions API", list)
+        evidence.failed_sources = failed_sources
+
+        # Parse FDA approval data and add to evidence. Label parsing is regex-heavy
+        # over long label text, so it runs in a worker thread to keep the event loop
+        # free for other variants' API and LLM calls
         if fda_approvals_raw:
-            fda_approvals = []
-            for approval_record in fda_approvals_raw:
-                # Pass variant to extract clinical_studies mentions for variants like G719X
-                parsed = self.fda_client.parse_approval_data(
-                    approval_record, variant_input.gene, normalized_variant
-                )
-                if parsed:
-                    fda_approvals.append(FDAApproval(**parsed))
-            evidence.fda_approvals = fda_approvals
+            evidence.fda_approvals = await asyncio.to_thread(
+                self._parse_fda_approvals, fda_approvals_raw, variant_input.gene, normalized_variant
+            )
 
-        # Add CGI biomarkers to evidence
+        # Add CGI biomarkers to evidence. Fields come from the typed CGI client rows,
+        # so the dataclass is built directly without a validation pass
         if cgi_biomarkers_raw:
             cgi_evidence = []
             for biomarker in cgi_biomarkers_raw:
@@ -239,7 +400,8 @@ class AssessmentEngine:
                 ))
             evidence.vicc = vicc_evidence
 
-        # Add CIViC Assertions to evidence (curated AMP/ASCO/CAP tier classifications)
+        # Add CIViC Assertions to evidence (curated AMP/ASCO/CAP tier classifications).
+        # Like CGI, these copy already-typed client attributes and skip validation
         if civic_assertions_raw:
             civic_assertions_evidence = []
             for assertion in civic_assertions_raw:
@@ -263,17 +425,57 @@ class AssessmentEngine:
                 ))
             evidence.civic_assertions = civic_assertions_evidence
 
-        # Step 4: Assess with LLM (must run sequentially since it depends on evidence)
-        # Use original variant notation for display/reporting
-        # Use resolved tumor type for evidence filtering and FDA matching
-        assessment = await self.llm_service.assess_variant(
-            gene=variant_input.gene,
-            variant=variant_input.variant,  # Keep original for display
-            tumor_type=resolved_tumor_type,  # Use resolved tumor type
-            evidence=evidence,
-        )
+        return evidence, resolved_tumor_type
+
+    def _parse_fda_approvals(
+        self, records: list[dict[str, Any]], gene: str, variant: str
+    ) -> list[FDAApproval]:
+        """Parse raw FDA label records into FDAApproval evidence."""
+        fda_approvals = []
+        for approval_record in records:
+            # Pass variant to extract clinical_studies mentions for variants like G719X
+            parsed = self.fda_client.parse_approval_data(approval_record, gene, variant)
+            if parsed:
+                fda_approvals.append(FDAApproval(**parsed))
+        return fda_approvals
+
+    async def assess_variants_pipelined(
+        self, variants: list[VariantInput], prefetch: int = 2
+    ) -> AsyncIterator[ActionabilityAssessment]:
+        """
+        Assess variants one at a time, overlapping the LLM step with evidence fetches.
 
-        return assessment
+        While the LLM assesses variant i, evidence for the next `prefetch` variants is
+        already being gathered in background tasks, so a sequential consumer sees
+        API latency hidden behind LLM latency. Assessments are yielded in input order;
+        variants that fail are skipped, matching batch_assess.
+        """
+        remaining = iter(variants)
+        pending: deque[tuple[VariantInput, asyncio.Task]] = deque()
+
+        def schedule_next() -> None:
+            variant_input = next(remaining, None)
+            if variant_input is not None:
+                pending.append((variant_input, asyncio.create_task(self._fetch_all_evidence(variant_input))))
+
+        for _ in range(prefetch + 1):
+            schedule_next()
+
+        try:
+            while pending:
+                variant_input, evidence_task = pending.popleft()
+                schedule_next()
+                try:
+                    evidence, resolved_tumor_type = await evidence_task
+                    assessment = await self._assess_evidence(variant_input, evidence, resolved_tumor_type)
+                except Exception as e:
+                    logger.error("Assessment failed for %s %s: %s", variant_input.gene, variant_input.variant, e)
+                    continue
+                yield assessment
+        finally:
+            # Consumer stopped early - don't leave orphaned fetches running
+            for _, evidence_task in pending:
+                evidence_task.cancel()
 
     async def batch_assess(
         self, variants: list[VariantInput]
@@ -283,14 +485,97 @@ class AssessmentEngine:
 
         Uses asyncio.gather() to process all variants in parallel. While waiting for
         I/O (API/LLM calls), the event loop switches between tasks - no threading needed.
+
+        Duplicate inputs (same gene, normalized variant and tumor type) share a single
+        in-flight task, so repeats cost one round of API and LLM calls.
+
+        With llm_batch_size > 1, evidence for all variants is fetched first and the
+        LLM step is packed into one completion per group of llm_batch_size variants.
         """
-        
-        # Create coroutines for each variant
-        tasks = [self.assess_variant(variant) for variant in variants]
+        if self.llm_batch_size > 1:
+            return await self._batch_assess_grouped(variants)
+
+        tasks = [self._get_or_create_task(variant) for variant in variants]
 
         # Run all tasks concurrently, capturing exceptions instead of raising
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter out exceptions and return successful assessments
-        assessments = [r for r in results if not isinstance(r, Exception)]
+        assessments = [r for r in results if not isinstance(r, BaseException)]
         return assessments
+
+    @staticmethod
+    def _dedup_key(variant_input: VariantInput) -> tuple[str, str, str]:
+        """Build the canonical key used to coalesce duplicate assessments."""
+        normalized = normalize_variant(variant_input.gene, variant_input.variant)
+        return (
+            variant_input.gene.upper().strip(),
+            normalized['variant_normalized'],
+            (variant_input.tumor_type or '').strip().lower(),
+        )
+
+    def _get_or_create_task(self, variant_input: VariantInput) -> asyncio.Task[ActionabilityAssessment]:
+        """Return the in-flight task for this variant, creating it if needed."""
+        key = self._dedup_key(variant_input)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self.assess_variant(variant_input))
+            self._inflight[key] = task
+
+            def forget(_: asyncio.Task[ActionabilityAssessment]) -> None:
+                self._inflight.pop(key, None)
+
+            task.add_done_callback(forget)
+        return task
+
+    async def _batch_assess_grouped(
+        self, variants: list[VariantInput]
+    ) -> list[ActionabilityAssessment]:
+        """Fetch evidence per variant, then assess in multi-variant LLM calls."""
+        unique: dict[tuple[str, str, str], VariantInput] = {}
+        for variant in variants:
+            unique.setdefault(self._dedup_key(variant), variant)
+        keys = list(unique)
+
+        fetched = await asyncio.gather(
+            *[self._fetch_all_evidence(unique[key]) for key in keys],
+            return_exceptions=True,
+        )
+
+        by_key: dict[tuple[str, str, str], ActionabilityAssessment | BaseException] = {}
+        ready: list[tuple[tuple[str, str, str], tuple[Evidence, str | None]]] = []
+        for key, fetch in zip(keys, fetched, strict=True):
+            if isinstance(fetch, BaseException):
+                logger.warning(
+                    "Evidence fetch failed for %s %s: %s", unique[key].gene, unique[key].variant, fetch
+                )
+                by_key[key] = fetch
+                continue
+            stock = self._no_evidence_assessment(unique[key], *fetch)
+            if stock is not None:
+                by_key[key] = stock
+            else:
+                ready.append((key, fetch))
+        groups = [ready[i:i + self.llm_batch_size] for i in range(0, len(ready), self.llm_batch_size)]
+
+        group_results = await asyncio.gather(*[
+            self.llm_service.assess_variants_batch([
+                (unique[key].gene, unique[key].variant, resolved_tumor_type, evidence)
+                for key, (evidence, resolved_tumor_type) in group
+            ])
+            for group in groups
+        ], return_exceptions=True)
+
+        # A failed completion only loses its own group
+        for group, outcome in zip(groups, group_results, strict=True):
+            group_outcomes: list[ActionabilityAssessment | Exception] | list[BaseException]
+            if isinstance(outcome, BaseException):
+                logger.error("LLM batch of %d variants failed: %s", len(group), outcome)
+                group_outcomes = [outcome] * len(group)
+            else:
+                group_outcomes = outcome
+            for (key, _), result in zip(group, group_outcomes, strict=True):
+                by_key[key] = result
+
+        results = [by_key.get(self._dedup_key(variant)) for variant in variants]
+        return [r for r in results if isinstance(r, ActionabilityAssessment)]
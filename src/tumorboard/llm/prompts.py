@@ -118,15 +118,60 @@ Evidence Summary:
 Provide your expert assessment as strictly valid JSON only (no markdown, no preamble, no postamble).
 """
 
+BATCH_ACTIONABILITY_USER_PROMPT = """Assess each of the following {count} somatic variants independently.
+
+{variant_blocks}
+
+Return strictly valid JSON (no markdown, no preamble, no postamble) of the form:
+{{"assessments": [<assessment for variant 1>, <assessment for variant 2>, ...]}}
+with exactly {count} entries in the same order as the variants above, each following the RESPONSE FORMAT.
+Every entry must also carry "index", "gene" and "variant" keys copied exactly from its "### Variant" block
+(e.g. {{"index": 1, "gene": "BRAF", "variant": "V600E", "tier": ...}}) so it can be matched to its variant.
+"""
+
+BATCH_VARIANT_BLOCK = """### Variant {index}
+Gene: {gene}
+Variant: {variant}
+Tumor Type: {tumor_type}
+
+Evidence Summary:
+{evidence_summary}
+"""
+
+
+# Shared system messages, built once. When cacheable, the prompt is sent as a
+# content block marked with cache_control so providers with explicit prompt
+# caching (Anthropic) bill the repeated prefix at the cached rate. OpenAI caches
+# the shared prefix automatically, so plain string content is used there.
+_SYSTEM_MSG: dict = {"role": "system", "content": ACTIONABILITY_SYSTEM_PROMPT}
+_CACHEABLE_SYSTEM_MSG: dict = {
+    "role": "system",
+    "content": [
+        {
+            "type": "text",
+            "text": ACTIONABILITY_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ],
+}
+
+
+def _system_message(cacheable: bool = False) -> dict:
+    """Shared system message carrying the static instructions."""
+    return _CACHEABLE_SYSTEM_MSG if cacheable else _SYSTEM_MSG
+
 
 def create_assessment_prompt(
     gene: str,
     variant: str,
     tumor_type: str | None,
-    evidence_summary: str
+    evidence_summary: str,
+    cache_system_prompt: bool = False,
 ) -> list[dict]:
     """
     Returns a properly formatted message list for litellm/openai with system + user roles.
+
+    The system message is a shared module-level dict; callers must not mutate it.
     """
     tumor_display = tumor_type if tumor_type else "Unspecified (pan-cancer assessment)"
 
@@ -138,6 +183,37 @@ def create_assessment_prompt(
     )
 
     return [
-        {"role": "system", "content": ACTIONABILITY_SYSTEM_PROMPT},
+        _system_message(cache_system_prompt),
+        {"role": "user", "content": user_content}
+    ]
+
+
+def create_batch_assessment_prompt(
+    items: list[tuple[str, str, str | None, str]],
+    cache_system_prompt: bool = False,
+) -> list[dict]:
+    """
+    Returns a message list asking for one assessment per (gene, variant, tumor_type, evidence_summary) item.
+
+    The system message is a shared module-level dict; callers must not mutate it.
+    """
+    variant_blocks = "\n".join(
+        BATCH_VARIANT_BLOCK.format(
+            index=idx,
+            gene=gene,
+            variant=variant,
+            tumor_type=tumor_type if tumor_type else "Unspecified (pan-cancer assessment)",
+            evidence_summary=evidence_summary.strip(),
+        )
+        for idx, (gene, variant, tumor_type, evidence_summary) in enumerate(items, 1)
+    )
+
+    user_content = BATCH_ACTIONABILITY_USER_PROMPT.format(
+        count=len(items),
+        variant_blocks=variant_blocks,
+    )
+
+    return [
+        _system_message(cache_system_prompt),
         {"role": "user", "content": user_content}
-    ]
\ No newline at end of file
+    ]
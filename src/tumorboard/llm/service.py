@@ -1,23 +1,283 @@
 """LLM service for variant actionability assessment — 2025 high-performance edition."""
 
+import asyncio
+import hashlib
 import json
-from litellm import acompletion
-from tumorboard.llm.prompts import create_assessment_prompt  # ← now returns messages list!
+import re
+from datetime import datetime, timedelta
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import orjson
+from litellm import acompletion, model_cost
+from pydantic import TypeAdapter
+from tumorboard.llm.prompts import create_assessment_prompt, create_batch_assessment_prompt
 from tumorboard.models import Evidence
 from tumorboard.models.assessment import ActionabilityAssessment, ActionabilityTier
 
 from tumorboard.utils.logging_config import get_logger
 
+# Evidence annotations copied verbatim onto every assessment
+_ANNOTATION_FIELDS = (
+    'cosmic_id', 'ncbi_gene_id', 'dbsnp_id', 'clinvar_id',
+    'clinvar_clinical_significance', 'clinvar_accession',
+    'hgvs_genomic', 'hgvs_protein', 'hgvs_transcript',
+    'snpeff_effect', 'polyphen2_prediction', 'cadd_score', 'gnomad_exome_af',
+    'alphamissense_score', 'alphamissense_prediction',
+    'transcript_id', 'transcript_consequence',
+)
+
+# Fallbacks for fields the LLM omits from its JSON response
+_LLM_DEFAULTS = {
+    "tier": ActionabilityTier.UNKNOWN,
+    "confidence_score": 0.5,
+    "summary": "No summary provided.",
+    "rationale": "No rationale provided.",
+}
+
+# Top-level response keys the assessment is built from; anything else is dropped
+_LLM_FIELDS = (
+    "tier", "confidence_score", "summary", "rationale", "evidence_strength",
+    "recommended_therapies", "references", "clinical_trials_available",
+)
+
+_ASSESSMENT_ADAPTER = TypeAdapter(ActionabilityAssessment)
+
+# Free-text answers the LLM uses to mean "no" (e.g. "No", "false", "None found", "N/A")
+_NEGATIVE_ANSWER_RE = re.compile(r"\s*(?:no|false|none|n/?a|0)\b", re.IGNORECASE)
+
+
+def _lenient_bool(value: Any) -> bool:
+    """Read a yes/no answer the LLM may have written as a bool, number or free text."""
+    if isinstance(value, str):
+        return bool(value.strip()) and not _NEGATIVE_ANSWER_RE.match(value)
+    return bool(value)
+
+
+def _lenient_float(value: Any) -> float:
+    """Read a score the LLM may have written as a number, numeric string or percentage."""
+    if isinstance(value, str) and value.strip().endswith("%"):
+        return float(value.strip()[:-1]) / 100
+    return float(value)
+
+
+# Scalars the LLM often answers loosely, coerced before strict model validation
+_LLM_COERCIONS = {
+    "clinical_trials_available": _lenient_bool,
+    "confidence_score": _lenient_float,
+}
+
+
+def _strip_md_fence(content: str) -> str:
+    """Return the body of a ```json fenced block, or the content unchanged if unfenced."""
+    if not content.startswith("```"):
+        return content
+
+    end = content.rfind("```", 3)
+    body = content[3:end] if end != -1 else content[3:]
+    if body[:4].lower() == "json":
+        body = body[4:]
+    return body.strip()
+
+
+def _batch_outputs_by_index(outputs: list) -> dict[int, list[dict]]:
+    """Group batch response entries by the 1-based "index" each one echoes back."""
+    by_index: dict[int, list[dict]] = {}
+    for output in outputs:
+        if not isinstance(output, dict) or (raw_index := output.get("index")) is None:
+            continue
+        try:
+            index = int(raw_index)
+        except (TypeError, ValueError):
+            continue
+        by_index.setdefault(index, []).append(output)
+    return by_index
+
+
+def _match_batch_output(by_index: dict[int, list[dict]], index: int, gene: str, variant: str) -> dict:
+    """Return the response entry for a batch item, refusing missing or mislabelled entries.
+
+    The entry must echo the item's index, gene and variant; positional assignment
+    would silently hand one variant's tier and therapies to another if the model
+    dropped or reordered entries.
+    """
+    matches = by_index.get(index, [])
+    if len(matches) != 1:
+        raise ValueError(f"LLM returned {len(matches)} assessments for item {index} ({gene} {variant})")
+
+    output = matches[0]
+    echoed = (str(output.get("gene", "")).strip().upper(), str(output.get("variant", "")).strip().upper())
+    if echoed != (gene.strip().upper(), variant.strip().upper()):
+        raise ValueError(
+            f"LLM assessment for item {index} is labelled {output.get('gene')} {output.get('variant')}, "
+            f"expected {gene} {variant}"
+        )
+    return output
+
 
 class LLMService:
     """High-accuracy LLM service for somatic variant actionability."""
 
-    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.0, enable_logging: bool = True):
+    CACHE_DIR = Path.home() / ".cache" / "tumorboard" / "llm"
+    CACHE_TTL = timedelta(days=30)
+    # Concurrent completions allowed per service, to stay under provider rate limits
+    DEFAULT_MAX_CONCURRENCY = 8
+    JSON_MODE_MODELS = ("gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo")
+    # Output tokens budgeted per assessment, and the output ceiling assumed for
+    # models litellm has no limit on record for
+    TOKENS_PER_ASSESSMENT = 2000
+    DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.0,
+        enable_logging: bool = True,
+        enable_cache: bool = True,
+        cache_ttl: timedelta = CACHE_TTL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
         self.model = model
         # ↓↓↓ CRITICAL: temperature=0.0 → deterministic, no hallucinations
         self.temperature = temperature
         self.enable_logging = enable_logging
         self.logger = get_logger() if enable_logging else None
+        self.enable_cache = enable_cache
+        self.cache_ttl = cache_ttl
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Only use response_format for OpenAI models that support JSON mode
+        # Supported: gpt-4-turbo, gpt-4o, gpt-4o-mini, gpt-3.5-turbo-1106+
+        # Not supported: Claude models, open-source models, older OpenAI models
+        model_lower = model.lower()
+        self._supports_json_mode = any(prefix in model_lower for prefix in self.JSON_MODE_MODELS)
+
+    @property
+    def supports_prompt_caching(self) -> bool:
+        """Whether the model needs explicit cache_control markers (Anthropic/Claude)."""
+        model = self.model.lower()
+        return model.startswith(("claude", "anthropic/")) or "/claude" in model
+
+    @cached_property
+    def max_output_tokens(self) -> int:
+        """Largest completion the model can return, per litellm's model map."""
+        for name in (self.model, self.model.split("/", 1)[-1]):
+            limit = (model_cost.get(name) or {}).get("max_output_tokens")
+            if limit:
+                return int(limit)
+        return self.DEFAULT_MAX_OUTPUT_TOKENS
+
+    @property
+    def max_batch_size(self) -> int:
+        """Most variants one batch completion can assess within the output limit."""
+        return max(1, self.max_output_tokens // self.TOKENS_PER_ASSESSMENT)
+
+    def _cache_key(self, messages: list[dict]) -> str:
+        """Content hash of everything that determines the LLM output."""
+        payload = json.dumps([self.model, self.temperature, messages], sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> ActionabilityAssessment | None:
+        """Load a cached assessment if present and not older than cache_ttl."""
+        cache_file = self.CACHE_DIR / f"{key}.json"
+        try:
+            mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
+            if datetime.now() - mtime >= self.cache_ttl:
+                return None
+            return ActionabilityAssessment.model_validate_json(cache_file.read_bytes())
+        except (OSError, ValueError):
+            # Missing or unreadable entries are treated as a miss
+            return None
+
+    def _cache_put(self, key: str, assessment: ActionabilityAssessment) -> None:
+        """Persist an assessment; cache write failures never fail the request."""
+        try:
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (self.CACHE_DIR / f"{key}.json").write_bytes(assessment.to_json())
+        except OSError:
+            pass
+
+    def _completion_kwargs(self, messages: list[dict], max_tokens: int = TOKENS_PER_ASSESSMENT) -> dict:
+        """Build acompletion kwargs - conditionally add response_format for compatible models."""
+        completion_kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            # Requests above the model's output limit are rejected outright
+            "max_tokens": min(max_tokens, self.max_output_tokens),
+        }
+
+        if self._supports_json_mode:
+            completion_kwargs["response_format"] = {"type": "json_object"}
+
+        return completion_kwargs
+
+    @staticmethod
+    def _parse_json_content(raw_content: str) -> dict:
+        """Parse the JSON payload of an LLM response."""
+        data: dict = orjson.loads(_strip_md_fence(raw_content).encode())
+        return data
+
+    @staticmethod
+    def build_assessment(
+        data: dict,
+        gene: str,
+        variant: str,
+        tumor_type: str | None,
+        evidence: Evidence,
+    ) -> ActionabilityAssessment:
+        """Build the final assessment from parsed LLM output, or a canned answer, plus evidence annotations."""
+        # Null answers fall back to the defaults and loose scalars are coerced up
+        # front; pydantic then validates everything in a single pass
+        llm_values = {key: data[key] for key in _LLM_FIELDS if data.get(key) is not None}
+        for key, coerce in _LLM_COERCIONS.items():
+            if key in llm_values:
+                try:
+                    llm_values[key] = coerce(llm_values[key])
+                except (TypeError, ValueError):
+                    del llm_values[key]
+        payload = {
+            **_LLM_DEFAULTS,
+            **llm_values,
+            "gene": gene,
+            "variant": variant,
+            "tumor_type": tumor_type,
+            **{field: getattr(evidence, field, None) for field in _ANNOTATION_FIELDS},
+        }
+        return _ASSESSMENT_ADAPTER.validate_python(payload)
+
+    def _log_response(
+        self, request_id: str | None, assessment: ActionabilityAssessment, raw_content: str
+    ) -> None:
+        """Log a successful assessment and its human-readable decision summary."""
+        if not self.logger:
+            return
+
+        self.logger.log_llm_response(
+            request_id=request_id or "unknown",
+            gene=assessment.gene,
+            variant=assessment.variant,
+            tumor_type=assessment.tumor_type,
+            tier=assessment.tier.value,
+            confidence_score=assessment.confidence_score,
+            summary=assessment.summary,
+            rationale=assessment.rationale,
+            evidence_strength=assessment.evidence_strength,
+            recommended_therapies=[therapy.to_dict() for therapy in assessment.recommended_therapies],
+            references=assessment.references,
+            raw_response=raw_content[:500],  # Log first 500 chars of raw response
+        )
+
+        # Log a human-readable decision summary
+        self.logger.log_decision_summary(
+            gene=assessment.gene,
+            variant=assessment.variant,
+            tumor_type=assessment.tumor_type,
+            tier=assessment.tier.value,
+            confidence_score=assessment.confidence_score,
+            key_evidence=assessment.references[:5],  # Top 5 references
+            decision_rationale=assessment.rationale,
+        )
 
     async def assess_variant(
         self,
@@ -27,20 +287,22 @@ class LLMService:
         evidence: Evidence,
     ) -> ActionabilityAssessment:
         """Assess variant using the new evidence-driven prompt system."""
+        evidence_summary = evidence.format_full_summary(tumor_type)
 
-        # Pre-processed summary header with stats and conflict detection
-        evidence_header = evidence.format_evidence_summary_header(tumor_type=tumor_type)
-
-        # Drug-level aggregation REPLACES detailed VICC/CIViC when we have many entries
-        # This significantly reduces prompt size while preserving key information
-        drug_summary = evidence.format_drug_aggregation_summary(tumor_type=tumor_type)
-
-        # Only include detailed evidence for FDA approvals and CGI biomarkers
-        # (these are compact and contain critical tier-determining info)
-        evidence_details = evidence.summary_compact(tumor_type=tumor_type)
+        # New create_assessment_prompt returns full messages list with system + user roles
+        messages = create_assessment_prompt(
+            gene, variant, tumor_type, evidence_summary,
+            cache_system_prompt=self.supports_prompt_caching,
+        )
 
-        # Combine header + drug summary + compact details
-        evidence_summary = evidence_header + drug_summary + evidence_details
+        # The prompt fully determines the response, so repeat prompts skip the LLM
+        cache_key = None
+        if self.enable_cache:
+            cache_key = self._cache_key(messages)
+            # Disk reads and writes run in a worker thread to keep the event loop free
+            cached = await asyncio.to_thread(self._cache_get, cache_key)
+            if cached is not None:
+                return cached
 
         # Log the request
         request_id = None
@@ -54,101 +316,21 @@ class LLMService:
                 temperature=self.temperature,
             )
 
-        # New create_assessment_prompt returns full messages list with system + user roles
-        messages = create_assessment_prompt(gene, variant, tumor_type, evidence_summary)
-
-        # Build completion kwargs - conditionally add response_format for compatible models
-        completion_kwargs = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": self.temperature,
-            "max_tokens": 2000,
-        }
-
-        # Only use response_format for OpenAI models that support JSON mode
-        # Supported: gpt-4-turbo, gpt-4o, gpt-4o-mini, gpt-3.5-turbo-1106+
-        # Not supported: Claude models, open-source models, older OpenAI models
-        openai_json_models = ["gpt-4o-mini", "gpt-4-turbo", "gpt-3.5-turbo"]
-        if any(model_prefix in self.model.lower() for model_prefix in openai_json_models):
-            try:
-                completion_kwargs["response_format"] = {"type": "json_object"}
-            except Exception:
-                # Fallback to prompt-based JSON if model doesn't support response_format
-                pass
-
         try:
-            response = await acompletion(**completion_kwargs)
+            async with self._semaphore:
+                response = await acompletion(**self._completion_kwargs(messages))
 
             raw_content = response.choices[0].message.content.strip()
-
-            # Robust markdown/code-block handling (your code was already great)
-            content = raw_content
-            if content.startswith("```"):
-                parts = content.split("```")
-                content = parts[1] if len(parts) > 1 else parts[0]
-                if content.lower().startswith("json"):
-                    content = content[4:].lstrip()
-
-            data = json.loads(content)
+            data = self._parse_json_content(raw_content)
 
             # Build final assessment — unchanged from your excellent version
-            assessment = ActionabilityAssessment(
-                gene=gene,
-                variant=variant,
-                tumor_type=tumor_type,
-                tier=ActionabilityTier(data.get("tier", "Unknown")),
-                confidence_score=float(data.get("confidence_score", 0.5)),
-                summary=data.get("summary", "No summary provided."),
-                rationale=data.get("rationale", "No rationale provided."),
-                evidence_strength=data.get("evidence_strength"),
-                clinical_trials_available=bool(data.get("clinical_trials_available", False)),
-                recommended_therapies=data.get("recommended_therapies", []),
-                references=data.get("references", []),
-                **evidence.model_dump(include={
-                    'cosmic_id', 'ncbi_gene_id', 'dbsnp_id', 'clinvar_id',
-                    'clinvar_clinical_significance', 'clinvar_accession',
-                    'hgvs_genomic', 'hgvs_protein', 'hgvs_transcript',
-                    'snpeff_effect', 'polyphen2_prediction', 'cadd_score', 'gnomad_exome_af',
-                    'alphamissense_score', 'alphamissense_prediction',
-                    'transcript_id', 'transcript_consequence'
-                })
-            )
+            assessment = self.build_assessment(data, gene, variant, tumor_type, evidence)
 
-            # Log the successful response
-            if self.logger:
-                self.logger.log_llm_response(
-                    request_id=request_id or "unknown",
-                    gene=gene,
-                    variant=variant,
-                    tumor_type=tumor_type,
-                    tier=assessment.tier.value,
-                    confidence_score=assessment.confidence_score,
-                    summary=assessment.summary,
-                    rationale=assessment.rationale,
-                    evidence_strength=assessment.evidence_strength,
-                    recommended_therapies=[
-                        {
-                            "drug_name": therapy.drug_name,
-                            "evidence_level": therapy.evidence_level,
-                            "approval_status": therapy.approval_status,
-                            "clinical_context": therapy.clinical_context,
-                        }
-                        for therapy in assessment.recommended_therapies
-                    ],
-                    references=assessment.references,
-                    raw_response=raw_content[:500],  # Log first 500 chars of raw response
-                )
+            if cache_key:
+                await asyncio.to_thread(self._cache_put, cache_key, assessment)
 
-                # Log a human-readable decision summary
-                self.logger.log_decision_summary(
-                    gene=gene,
-                    variant=variant,
-                    tumor_type=tumor_type,
-                    tier=assessment.tier.value,
-                    confidence_score=assessment.confidence_score,
-                    key_evidence=assessment.references[:5],  # Top 5 references
-                    decision_rationale=assessment.rationale,
-                )
+            # Log the successful response
+            self._log_response(request_id, assessment, raw_content)
 
             return assessment
 
@@ -162,4 +344,73 @@ class LLMService:
                     error=e,
                 )
             # Re-raise the exception
-            raise
\ No newline at end of file
+            raise
+
+    async def assess_variants_batch(
+        self,
+        items: list[tuple[str, str, str | None, Evidence]],
+    ) -> list[ActionabilityAssessment | Exception]:
+        """Assess several variants with a single LLM completion.
+
+        Packs each (gene, variant, tumor_type, evidence) item into one prompt and
+        parses one assessment per item from the response. Response entries are
+        matched to items by the index, gene and variant they echo back, never by
+        position. Results are returned in input order; an item whose output is
+        missing, mislabelled or invalid gets an Exception in its slot instead of
+        failing the whole batch.
+        """
+        if not items:
+            return []
+
+        prompt_items = [
+            (gene, variant, tumor_type, evidence.format_full_summary(tumor_type))
+            for gene, variant, tumor_type, evidence in items
+        ]
+        messages = create_batch_assessment_prompt(
+            prompt_items, cache_system_prompt=self.supports_prompt_caching
+        )
+
+        request_ids: list[str | None] = [None] * len(items)
+        if self.logger:
+            request_ids = [
+                self.logger.log_llm_request(
+                    gene=gene,
+                    variant=variant,
+                    tumor_type=tumor_type,
+                    evidence_summary=evidence_summary,
+                    model=self.model,
+                    temperature=self.temperature,
+                )
+                for gene, variant, tumor_type, evidence_summary in prompt_items
+            ]
+
+        try:
+            async with self._semaphore:
+                response = await acompletion(
+                    **self._completion_kwargs(messages, max_tokens=self.TOKENS_PER_ASSESSMENT * len(items))
+                )
+            raw_content = response.choices[0].message.content.strip()
+            by_index = _batch_outputs_by_index(self._parse_json_content(raw_content).get("assessments", []))
+        except Exception as e:
+            if self.logger:
+                for request_id, (gene, variant, _, _) in zip(request_ids, items, strict=True):
+                    self.logger.log_llm_error(
+                        request_id=request_id or "unknown", gene=gene, variant=variant, error=e,
+                    )
+            return [e] * len(items)
+
+        results: list[ActionabilityAssessment | Exception] = []
+        for idx, (gene, variant, tumor_type, evidence) in enumerate(items):
+            try:
+                output = _match_batch_output(by_index, idx + 1, gene, variant)
+                assessment = self.build_assessment(output, gene, variant, tumor_type, evidence)
+                self._log_response(request_ids[idx], assessment, raw_content)
+                results.append(assessment)
+            except Exception as e:
+                if self.logger:
+                    self.logger.log_llm_error(
+                        request_id=request_ids[idx] or "unknown", gene=gene, variant=variant, error=e,
+                    )
+                results.append(e)
+
+        return results
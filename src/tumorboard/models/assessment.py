@@ -1,13 +1,50 @@
 """Assessment and actionability models."""
 
-from enum import Enum
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Self, TypeVar
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from tumorboard.models.annotations import VariantAnnotations
 
-
-class ActionabilityTier(str, Enum):
+# (label, attribute) pairs rendered by ActionabilityAssessment.to_report, in display order
+_REPORT_SECTIONS = (
+    ("Identifiers", (
+        ("COSMIC", "cosmic_id"),
+        ("NCBI Gene", "ncbi_gene_id"),
+        ("dbSNP", "dbsnp_id"),
+        ("ClinVar", "clinvar_id"),
+    )),
+    ("HGVS", (
+        ("Protein", "hgvs_protein"),
+        ("Transcript", "hgvs_transcript"),
+        ("Genomic", "hgvs_genomic"),
+    )),
+    ("ClinVar", (
+        ("Significance", "clinvar_clinical_significance"),
+        ("Accession", "clinvar_accession"),
+    )),
+)
+_EFFECT_FIELDS = (("Effect", "snpeff_effect"), ("PolyPhen2", "polyphen2_prediction"))
+_TRANSCRIPT_FIELDS = (("ID", "transcript_id"), ("Consequence", "transcript_consequence"))
+_AM_DECODE: Mapping[str, str] = MappingProxyType({"P": "Pathogenic", "B": "Benign", "A": "Ambiguous"})
+
+# Layout of ActionabilityAssessment.to_report; optional sections are pre-rendered
+_REPORT_TEMPLATE = (
+    "\nVariant: {gene} {variant} | Tumor: {tumor}\n"
+    "Tier: {tier} | Confidence: {confidence:.1%}\n"
+    "{details}"
+    "\n{summary}\n"
+    "{therapies}"
+)
+
+
+class ActionabilityTier(StrEnum):
     """AMP/ASCO/CAP clinical actionability tiers.
 
     Tier I: Variants with strong clinical significance
@@ -23,20 +60,39 @@ class ActionabilityTier(str, Enum):
     UNKNOWN = "Unknown"
 
 
-class RecommendedTherapy(BaseModel):
-    """Recommended therapy based on variant."""
+# Clinical ordering of the concrete tiers, most to least actionable (UNKNOWN is unranked)
+TIER_ORDER: dict[ActionabilityTier, int] = {
+    ActionabilityTier.TIER_I: 0,
+    ActionabilityTier.TIER_II: 1,
+    ActionabilityTier.TIER_III: 2,
+    ActionabilityTier.TIER_IV: 3,
+}
 
-    drug_name: str = Field(..., description="Name of the therapeutic agent")
-    evidence_level: str | None = Field(None, description="Level of supporting evidence")
-    approval_status: str | None = Field(None, description="FDA approval status for this indication")
-    clinical_context: str | None = Field(
-        None, description="Clinical context (e.g., first-line, resistant)"
-    )
+
+@dataclass(slots=True, frozen=True)
+class RecommendedTherapy:
+    """Recommended therapy based on variant.
+
+    A plain dataclass; pydantic still validates it when nested in ActionabilityAssessment.
+    """
+
+    drug_name: str  # Name of the therapeutic agent
+    evidence_level: str | None = None  # Level of supporting evidence
+    approval_status: str | None = None  # FDA approval status for this indication
+    clinical_context: str | None = None  # Clinical context (e.g., first-line, resistant)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON serialization."""
+        return asdict(self)
 
 
 class ActionabilityAssessment(VariantAnnotations):
     """Complete actionability assessment for a variant."""
 
+    # Assessments are shared between duplicate batch inputs and cache hits, so
+    # they are immutable once built
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     gene: str
     variant: str
     tumor_type: str | None
@@ -57,81 +113,80 @@ class ActionabilityAssessment(VariantAnnotations):
         default_factory=list, description="Key references supporting the assessment"
     )
 
+    @classmethod
+    def from_records(cls, records: list[Mapping[str, Any]]) -> list["ActionabilityAssessment"]:
+        """Rebuild assessments from plain dicts (e.g. a saved batch results file).
+
+        The whole list is validated in a single pass rather than one model call per record.
+        """
+        return _list_adapter(cls).validate_python(records)
+
+    def to_json(self) -> bytes:
+        """Compact UTF-8 JSON encoding for caches and result files."""
+        return orjson.dumps(self.model_dump(mode="json"))
+
     def to_report(self) -> str:
         """Simple report output."""
-        tumor_display = self.tumor_type if self.tumor_type else "Not specified"
-        report = f"\nVariant: {self.gene} {self.variant} | Tumor: {tumor_display}\n"
-        report += f"Tier: {self.tier.value} | Confidence: {self.confidence_score:.1%}\n"
-
-        # Add identifiers if available
-        identifiers = []
-        if self.cosmic_id:
-            identifiers.append(f"COSMIC: {self.cosmic_id}")
-        if self.ncbi_gene_id:
-            identifiers.append(f"NCBI Gene: {self.ncbi_gene_id}")
-        if self.dbsnp_id:
-            identifiers.append(f"dbSNP: {self.dbsnp_id}")
-        if self.clinvar_id:
-            identifiers.append(f"ClinVar: {self.clinvar_id}")
-
-        if identifiers:
-            report += f"Identifiers: {' | '.join(identifiers)}\n"
-
-        # Add HGVS notations if available
-        hgvs_notations = []
-        if self.hgvs_protein:
-            hgvs_notations.append(f"Protein: {self.hgvs_protein}")
-        if self.hgvs_transcript:
-            hgvs_notations.append(f"Transcript: {self.hgvs_transcript}")
-        if self.hgvs_genomic:
-            hgvs_notations.append(f"Genomic: {self.hgvs_genomic}")
-
-        if hgvs_notations:
-            report += f"HGVS: {' | '.join(hgvs_notations)}\n"
-
-        # Add ClinVar details if available
-        clinvar_details = []
-        if self.clinvar_clinical_significance:
-            clinvar_details.append(f"Significance: {self.clinvar_clinical_significance}")
-        if self.clinvar_accession:
-            clinvar_details.append(f"Accession: {self.clinvar_accession}")
-
-        if clinvar_details:
-            report += f"ClinVar: {' | '.join(clinvar_details)}\n"
-
-        # Add functional annotations if available
-        annotations = []
-        if self.snpeff_effect:
-            annotations.append(f"Effect: {self.snpeff_effect}")
-        if self.polyphen2_prediction:
-            annotations.append(f"PolyPhen2: {self.polyphen2_prediction}")
+        return self.report
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the assessment, dropping the rendered report if any field changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("report", None)
+        return copied
+
+    def _labelled(self, fields: tuple[tuple[str, str], ...]) -> list[str]:
+        """Format the set attributes among (label, attribute) pairs as "Label: value"."""
+        return [f"{label}: {value}" for label, attr in fields if (value := getattr(self, attr))]
+
+    @cached_property
+    def report(self) -> str:
+        """Rendered report, built once per (immutable) assessment."""
+        # Identifiers, HGVS notations and ClinVar details, when available
+        sections = [(section, self._labelled(fields)) for section, fields in _REPORT_SECTIONS]
+
+        # Functional annotations
+        annotations = self._labelled(_EFFECT_FIELDS)
         if self.alphamissense_prediction:
-            am_display = {"P": "Pathogenic", "B": "Benign", "A": "Ambiguous"}.get(
-                self.alphamissense_prediction, self.alphamissense_prediction
-            )
+            am_display = _AM_DECODE.get(self.alphamissense_prediction, self.alphamissense_prediction)
             score_str = f" ({self.alphamissense_score:.2f})" if self.alphamissense_score else ""
             annotations.append(f"AlphaMissense: {am_display}{score_str}")
         if self.cadd_score is not None:
             annotations.append(f"CADD: {self.cadd_score:.2f}")
         if self.gnomad_exome_af is not None:
             annotations.append(f"gnomAD AF: {self.gnomad_exome_af:.6f}")
+        sections.append(("Annotations", annotations))
 
-        if annotations:
-            report += f"Annotations: {' | '.join(annotations)}\n"
+        # Transcript information
+        sections.append(("Transcript", self._labelled(_TRANSCRIPT_FIELDS)))
 
-        # Add transcript information if available
-        transcript_info = []
-        if self.transcript_id:
-            transcript_info.append(f"ID: {self.transcript_id}")
-        if self.transcript_consequence:
-            transcript_info.append(f"Consequence: {self.transcript_consequence}")
+        therapies = ""
+        if self.recommended_therapies:
+            therapies = f"\nTherapies: {', '.join(t.drug_name for t in self.recommended_therapies)}\n"
 
-        if transcript_info:
-            report += f"Transcript: {' | '.join(transcript_info)}\n"
+        return _REPORT_TEMPLATE.format(
+            gene=self.gene,
+            variant=self.variant,
+            tumor=self.tumor_type if self.tumor_type else "Not specified",
+            tier=self.tier.value,
+            confidence=self.confidence_score,
+            details="".join(f"{name}: {' | '.join(items)}\n" for name, items in sections if items),
+            summary=self.summary,
+            therapies=therapies,
+        )
 
-        report += f"\n{self.summary}\n"
 
-        if self.recommended_therapies:
-            report += f"\nTherapies: {', '.join([t.drug_name for t in self.recommended_therapies])}\n"
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# List validators per model, built on first use
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {}
+
 
-        return report
+def _list_adapter(model: type[ModelT]) -> TypeAdapter[list[ModelT]]:
+    """List validator for a model, built on first use."""
+    adapter = _LIST_ADAPTERS.get(model)
+    if adapter is None:
+        # list[...] over a runtime class is valid for pydantic, though not a static type
+        adapter = _LIST_ADAPTERS[model] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    return adapter
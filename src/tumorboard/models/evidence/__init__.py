@@ -0,0 +1,20 @@
+"""Evidence models from external databases."""
+
+from tumorboard.models.evidence.cgi import CGIBiomarkerEvidence
+from tumorboard.models.evidence.civic import CIViCAssertionEvidence, CIViCEvidence
+from tumorboard.models.evidence.clinvar import ClinVarEvidence
+from tumorboard.models.evidence.cosmic import COSMICEvidence
+from tumorboard.models.evidence.evidence import Evidence
+from tumorboard.models.evidence.fda import FDAApproval
+from tumorboard.models.evidence.vicc import VICCEvidence
+
+__all__ = [
+    "Evidence",
+    "CIViCEvidence",
+    "CIViCAssertionEvidence",
+    "ClinVarEvidence",
+    "COSMICEvidence",
+    "CGIBiomarkerEvidence",
+    "FDAApproval",
+    "VICCEvidence",
+]
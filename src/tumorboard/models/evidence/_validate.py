@@ -0,0 +1,26 @@
+"""Validated construction of leaf evidence dataclasses from raw API payloads."""
+
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+# Validators per leaf evidence dataclass, built on first use
+_ADAPTERS: dict[type, TypeAdapter[Any]] = {}
+
+
+def validated(cls: type[T], **fields: Any) -> T:
+    """Build ``cls`` from external field values, validating and coercing them.
+
+    Leaf evidence dataclasses skip validation when constructed directly, so
+    values taken straight from an API response go through this instead.
+
+    Raises:
+        pydantic.ValidationError: If a value does not fit its field type
+    """
+    adapter = _ADAPTERS.get(cls)
+    if adapter is None:
+        adapter = _ADAPTERS[cls] = TypeAdapter(cls)
+    result: T = adapter.validate_python(fields)
+    return result
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass
+from typing import Any
 
-class CGIBiomarkerEvidence(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class CGIBiomarkerEvidence:
     """Evidence from Cancer Genome Interpreter biomarkers database."""
 
     gene: str | None = None
@@ -12,3 +15,7 @@ class CGIBiomarkerEvidence(BaseModel):
     source: str | None = None
     tumor_type: str | None = None
     fda_approved: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON serialization."""
+        return asdict(self)
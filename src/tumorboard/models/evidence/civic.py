@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
-class CIViCEvidence(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class CIViCEvidence:
     """Evidence from CIViC (Clinical Interpretations of Variants in Cancer)."""
 
     evidence_type: str | None = None
@@ -8,16 +11,18 @@ class CIViCEvidence(BaseModel):
     evidence_direction: str | None = None
     clinical_significance: str | None = None
     disease: str | None = None
-    drugs: list[str] = Field(default_factory=list)
+    drugs: list[str] = field(default_factory=list)
     description: str | None = None
     source: str | None = None
     rating: int | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON serialization."""
+        return asdict(self)
 
 
-
-
-class CIViCAssertionEvidence(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CIViCAssertionEvidence:
     """Evidence from CIViC Assertions (curated AMP/ASCO/CAP classifications)."""
 
     assertion_id: int | None = None
@@ -30,10 +35,13 @@ class CIViCAssertionEvidence(BaseModel):
     status: str | None = None
     molecular_profile: str | None = None
     disease: str | None = None
-    therapies: list[str] = Field(default_factory=list)
+    therapies: list[str] = field(default_factory=list)
     fda_companion_test: bool | None = None
     nccn_guideline: str | None = None
     description: str | None = None
     is_sensitivity: bool = False
     is_resistance: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON serialization."""
+        return asdict(self)
@@ -1,10 +1,17 @@
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
-class ClinVarEvidence(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class ClinVarEvidence:
     """Evidence from ClinVar."""
 
     clinical_significance: str | None = None
     review_status: str | None = None
-    conditions: list[str] = Field(default_factory=list)
+    conditions: list[str] = field(default_factory=list)
     last_evaluated: str | None = None
-    variation_id: str | None = None
\ No newline at end of file
+    variation_id: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON serialization."""
+        return asdict(self)
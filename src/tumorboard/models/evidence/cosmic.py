@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass
+from typing import Any
 
 
-class COSMICEvidence(BaseModel):
+@dataclass(slots=True, frozen=True)
+class COSMICEvidence:
     """Evidence from COSMIC (Catalogue of Somatic Mutations in Cancer)."""
 
     mutation_id: str | None = None
@@ -11,3 +13,7 @@ class COSMICEvidence(BaseModel):
     histology_subtype: str | None = None
     sample_count: int | None = None
     mutation_somatic_status: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict form for JSON serialization."""
+        return asdict(self)
@@ -1,9 +1,13 @@
 """Evidence data models from external databases."""
 
-from typing import Any
+from collections import Counter
+from collections.abc import Callable, Mapping
+from functools import cache, lru_cache
+from typing import Any, Self
 import logging
+import re
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from tumorboard.constants import TUMOR_TYPE_MAPPINGS
 from tumorboard.models.annotations import VariantAnnotations
@@ -16,13 +20,183 @@ from tumorboard.models.evidence.vicc import VICCEvidence
 
 logger = logging.getLogger(__name__)
 
+# Indication phrases that exclude mutant variants from an FDA approval
+_EXCLUSION_TERMS = ('wild-type', 'wild type', 'wildtype', 'without mutations')
+_BRAF_V600_VARIANTS = frozenset({'V600E', 'V600K', 'V600D', 'V600R'})
+_KIT_EXONS = {'V560D': 9, 'V559D': 9, 'D816V': 17, 'D816H': 17, 'D816Y': 17}
+_KIT_BROAD_RE = re.compile(r'kit-positive|kit-mutated|kit mutation|kit \(cd117\)')
+_EGFR_COMMON = frozenset({'L858R', 'EXON19DEL'})
+_EGFR_UNCOMMON = frozenset({'G719A', 'G719C', 'G719S', 'L861Q', 'S768I'})
+_EGFR_RESISTANCE = frozenset({'T790M', 'C797S'})
+_EGFR_TERM_RE = re.compile(
+    r'uncommon|common|exon 19|l858r|g719|t790m|resistance'
+    r'|egfr mutation|egfr-mutated|specific|particular'
+)
+_LEVEL_PRIORITY = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+_HIGH_QUALITY_LEVELS = frozenset({'A', 'B'})
+_LOW_QUALITY_LEVELS = frozenset({'C', 'D'})
+
+# Fixed opening of the pre-processed evidence summary header
+_RULE = "=" * 60
+_SUMMARY_HEADER_LINES = (
+    _RULE,
+    "EVIDENCE SUMMARY (Pre-processed)",
+    _RULE,
+    "",
+    "*** TIER CLASSIFICATION GUIDANCE ***",
+)
+
+# Known investigational-only combinations: gene -> tumor substrings ('*' = any tumor)
+_INVESTIGATIONAL_TUMORS = {
+    'kras': ('pancreatic', 'pancreas'),
+    'nras': ('melanoma',),
+    'tp53': ('*',),
+    'apc': ('colorectal', 'colon'),
+    'vhl': ('renal', 'kidney'),
+    'smad4': ('pancreatic', 'pancreas'),
+    'cdkn2a': ('melanoma',),
+    'arid1a': ('*',),
+}
+
+
+def _phrase_union(phrases: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation regex, so a text is scanned once for any of several literal phrases."""
+    return re.compile('|'.join(map(re.escape, phrases)))
+
+
+@cache
+def _exclusion_re(gene_lower: str) -> re.Pattern[str]:
+    """Phrases that rule a gene's mutants out of an approval."""
+    return _phrase_union((*_EXCLUSION_TERMS, f'{gene_lower}-negative'))
+
+
+@cache
+def _ras_mutated_re(gene_lower: str) -> re.Pattern[str]:
+    """Generic "<gene>-mutated" phrasing for KRAS/NRAS labels."""
+    return _phrase_union((f'{gene_lower} mutation', f'{gene_lower}-mutated', f'{gene_lower}-positive'))
+
+
+@cache
+def _wildtype_required_re(gene_lower: str) -> re.Pattern[str]:
+    """Phrases marking an approval as restricted to wild-type tumors."""
+    return _phrase_union((
+        f'{gene_lower} wild-type',
+        f'{gene_lower}-wild-type',
+        f'wild type {gene_lower}',
+        f'without {gene_lower} mutation',
+        f'{gene_lower}-negative',
+        'ras wild-type',
+        'ras wildtype',
+    ))
+
+
+def _match_braf(gene_lower: str, variant: str, indication_text: str) -> bool:
+    """BRAF inhibitors are V600-specific; generic "BRAF-mutated" is rare and suspicious."""
+    return 'v600' in indication_text and variant.upper() in _BRAF_V600_VARIANTS
+
+
+def _match_ras(gene_lower: str, variant: str, indication_text: str) -> bool:
+    """KRAS/NRAS: G12C labels are variant-specific, otherwise accept generic mutation wording."""
+    if 'g12c' in indication_text:
+        return variant.upper() == 'G12C'
+
+    # Generic "KRAS-mutated" without specifics (wild-type is excluded by the caller)
+    return _ras_mutated_re(gene_lower).search(indication_text) is not None
+
+
+def _match_kit(gene_lower: str, variant: str, indication_text: str) -> bool:
+    """KIT: explicit variant, its exon, or broad KIT-positive wording."""
+    if variant.lower() in indication_text:
+        return True
+
+    # Map variants to exons
+    variant_exon = _KIT_EXONS.get(variant.upper())
+    if variant_exon and f'exon {variant_exon}' in indication_text:
+        return True
+
+    # Broad "KIT-mutated" or "KIT-positive"
+    return _KIT_BROAD_RE.search(indication_text) is not None
+
+
+@lru_cache(maxsize=1024)
+def _egfr_terms(indication_text: str) -> frozenset[str]:
+    """EGFR class keywords present in an indication, found in one regex pass."""
+    terms = set(_EGFR_TERM_RE.findall(indication_text))
+    if 'uncommon' in terms:
+        terms.add('common')  # substring semantics: "uncommon" also contains "common"
+    return frozenset(terms)
 
 
+def _match_egfr(gene_lower: str, variant: str, indication_text: str) -> bool:
+    """EGFR: explicit variant, or the common/uncommon/resistance class it belongs to."""
+    if variant.lower() in indication_text:
+        return True
+
+    terms = _egfr_terms(indication_text)
+    variant_upper = variant.upper()
+    if variant_upper in _EGFR_COMMON or 'DEL19' in variant_upper or 'E746' in variant_upper:
+        if not terms.isdisjoint(('common', 'exon 19', 'l858r')):
+            return True
+
+    if variant_upper in _EGFR_UNCOMMON:
+        if not terms.isdisjoint(('uncommon', 'g719')):
+            return True
+
+    if variant_upper in _EGFR_RESISTANCE:
+        if not terms.isdisjoint(('t790m', 'resistance')):
+            return True
+
+    if not terms.isdisjoint(('egfr mutation', 'egfr-mutated')):
+        if terms.isdisjoint(('specific', 'particular')):
+            return True
+
+    return False
+
+
+# Per-gene approval class rules used by Evidence._variant_matches_approval_class
+_GENE_APPROVAL_MATCHERS: dict[str, Callable[[str, str, str], bool]] = {
+    'braf': _match_braf,
+    'kras': _match_ras,
+    'nras': _match_ras,
+    'kit': _match_kit,
+    'egfr': _match_egfr,
+}
+
+
+@lru_cache(maxsize=256)
+def _tumor_name_groups(tumor_lower: str) -> tuple[tuple[str, ...], ...]:
+    """Full-name lists of the TUMOR_TYPE_MAPPINGS entries a tumor type falls under."""
+    return tuple(
+        tuple(full_names)
+        for abbrev, full_names in TUMOR_TYPE_MAPPINGS.items()
+        if tumor_lower == abbrev or any(tumor_lower in name for name in full_names)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _tumor_disease_match(tumor_lower: str, disease_lower: str) -> bool:
+    """Memoized body of Evidence._tumor_matches for normalized inputs."""
+    if tumor_lower in disease_lower or disease_lower in tumor_lower:
+        return True
+
+    return any(
+        name in disease_lower
+        for full_names in _tumor_name_groups(tumor_lower)
+        for name in full_names
+    )
+
+
+# Evidence lists the memoized Evidence views are derived from
+_EVIDENCE_LISTS = (
+    'civic', 'clinvar', 'cosmic', 'fda_approvals', 'cgi_biomarkers', 'vicc', 'civic_assertions',
+)
 
 
 class Evidence(VariantAnnotations):
     """Aggregated evidence from multiple sources."""
 
+    model_config = ConfigDict(defer_build=True)
+
     variant_id: str
     gene: str
     variant: str
@@ -35,6 +209,56 @@ class Evidence(VariantAnnotations):
     vicc: list[VICCEvidence] = Field(default_factory=list)
     civic_assertions: list[CIViCAssertionEvidence] = Field(default_factory=list)
     raw_data: dict[str, Any] = Field(default_factory=dict)
+    # Sources whose request failed, so empty lists above are not mistaken for "no evidence"
+    failed_sources: list[str] = Field(default_factory=list)
+
+    # Memoized views of the evidence below. Assigning a field clears them, and
+    # _fresh_caches() also drops them if an evidence list grew or shrank in place
+    _cache_stamp: tuple[int, ...] | None = PrivateAttr(default=None)
+    # Rendered LLM evidence blocks keyed by tumor type
+    _summary_cache: dict[str | None, str] = PrivateAttr(default_factory=dict)
+    # compute_evidence_stats results keyed by tumor type (read by the tier hint,
+    # resistance check and summary header for the same variant)
+    _stats_cache: dict[str | None, dict] = PrivateAttr(default_factory=dict)
+    _predictive_scan: dict | None = PrivateAttr(default=None)
+    # parse_indication_for_tumor results keyed by (tumor type, fda_approvals index)
+    _fda_parse_cache: dict[tuple[str, int], dict] = PrivateAttr(default_factory=dict)
+    _fda_for_variant_cache: dict[str, bool] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """Forget every memoized view of this evidence."""
+        self._summary_cache.clear()
+        self._stats_cache.clear()
+        self._predictive_scan = None
+        self._fda_parse_cache.clear()
+        self._fda_for_variant_cache.clear()
+
+    def _fresh_caches(self) -> None:
+        """Drop memoized views built before an evidence list was appended to or trimmed."""
+        stamp = tuple(len(getattr(self, name)) for name in _EVIDENCE_LISTS)
+        if stamp != self._cache_stamp:
+            self._clear_caches()
+            self._cache_stamp = stamp
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the evidence with its own, empty memo caches.
+
+        model_copy shallow-copies private attributes and bypasses __setattr__, so the
+        copy would otherwise share (and serve) the original's memoized views.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied._cache_stamp = None
+        copied._summary_cache = {}
+        copied._stats_cache = {}
+        copied._predictive_scan = None
+        copied._fda_parse_cache = {}
+        copied._fda_for_variant_cache = {}
+        return copied
 
     def has_evidence(self) -> bool:
         """Check if any evidence was found."""
@@ -47,18 +271,7 @@ class Evidence(VariantAnnotations):
         if not tumor_type or not disease:
             return False
 
-        tumor_lower = tumor_type.lower().strip()
-        disease_lower = disease.lower().strip()
-
-        if tumor_lower in disease_lower or disease_lower in tumor_lower:
-            return True
-
-        for abbrev, full_names in TUMOR_TYPE_MAPPINGS.items():
-            if tumor_lower == abbrev or any(tumor_lower in name for name in full_names):
-                if any(name in disease_lower for name in full_names):
-                    return True
-
-        return False
+        return _tumor_disease_match(tumor_type.lower().strip(), disease.lower().strip())
 
     def _variant_matches_approval_class(self, gene: str, variant: str,
                                        indication_text: str, approval: FDAApproval) -> bool:
@@ -70,95 +283,31 @@ class Evidence(VariantAnnotations):
         - Non-specific matches
         """
         gene_lower = gene.lower()
-        variant_upper = variant.upper()
 
         # Check for exclusion patterns
-        exclusion_patterns = [
-            'wild-type', 'wild type', 'wildtype',
-            f'{gene_lower}-negative',
-            'without mutations',
-        ]
-
-        for pattern in exclusion_patterns:
-            if pattern in indication_text:
-                return False
-
-        # Gene-specific validation rules
-        if gene_lower == 'braf':
-            # BRAF inhibitors are V600-specific
-            if 'v600' in indication_text:
-                return variant_upper in ['V600E', 'V600K', 'V600D', 'V600R']
-            else:
-                # Generic "BRAF-mutated" is rare and suspicious
-                return False
-
-        elif gene_lower in ['kras', 'nras']:
-            # Check for specific variant mentions
-            if 'g12c' in indication_text:
-                return variant_upper == 'G12C'
-
-            # Generic "KRAS-mutated" without specifics
-            if any(phrase in indication_text for phrase in [
-                f'{gene_lower} mutation',
-                f'{gene_lower}-mutated',
-                f'{gene_lower}-positive',
-            ]):
-                # Verify not an exclusion
-                return 'wild-type' not in indication_text
-
-            return False
-
-        elif gene_lower == 'kit':
-            # Map variants to exons
-            exon_map = {
-                'V560D': 9, 'V559D': 9,
-                'D816V': 17, 'D816H': 17, 'D816Y': 17,
-            }
-
-            variant_exon = exon_map.get(variant_upper)
-
-            if variant.lower() in indication_text:
-                return True
-
-            if variant_exon and f'exon {variant_exon}' in indication_text:
-                return True
-
-            # Broad "KIT-mutated" or "KIT-positive"
-            if any(phrase in indication_text for phrase in [
-                'kit-positive', 'kit-mutated', 'kit mutation', 'kit (cd117)',
-            ]):
-                return True
-
+        if _exclusion_re(gene_lower).search(indication_text):
             return False
 
-        elif gene_lower == 'egfr':
-            common_mutations = ['L858R', 'EXON19DEL']
-            uncommon_mutations = ['G719A', 'G719C', 'G719S', 'L861Q', 'S768I']
-            resistance_mutations = ['T790M', 'C797S']
-
-            if variant.lower() in indication_text:
-                return True
-
-            if variant_upper in common_mutations or any(v in variant_upper for v in ['DEL19', 'E746']):
-                if 'common' in indication_text or 'exon 19' in indication_text or 'l858r' in indication_text:
-                    return True
-
-            if variant_upper in uncommon_mutations:
-                if 'uncommon' in indication_text or 'g719' in indication_text:
-                    return True
-
-            if variant_upper in resistance_mutations:
-                if 't790m' in indication_text or 'resistance' in indication_text:
-                    return True
-
-            if 'egfr mutation' in indication_text or 'egfr-mutated' in indication_text:
-                if 'specific' not in indication_text and 'particular' not in indication_text:
-                    return True
+        # Gene-specific validation rules
+        handler = _GENE_APPROVAL_MATCHERS.get(gene_lower)
+        if handler is None:
+            # Default for other genes - tentatively approve if mentioned without exclusions
+            return True
+        return handler(gene_lower, variant, indication_text)
 
-            return False
+    def _fda_parse(self, tumor_type: str, index: int) -> dict:
+        """Indication parse of one FDA approval for a tumor type, computed on first use.
 
-        # Default for other genes - tentatively approve if mentioned without exclusions
-        return True
+        Shared by the tier checks, summary header and compact summary; must not be mutated.
+        The tier checks only ask for approvals that pass their cheap text filters.
+        """
+        self._fresh_caches()
+        key = (tumor_type, index)
+        parsed = self._fda_parse_cache.get(key)
+        if parsed is None:
+            parsed = self.fda_approvals[index].parse_indication_for_tumor(tumor_type)
+            self._fda_parse_cache[key] = parsed
+        return parsed
 
     def _check_fda_requires_wildtype(self, tumor_type: str) -> tuple[bool, list[str]]:
         """Check if any FDA drugs in this tumor REQUIRE wild-type (exclude mutants).
@@ -166,26 +315,13 @@ class Evidence(VariantAnnotations):
         Returns: (requires_wildtype, list_of_drugs)
         """
         wildtype_drugs = []
+        wildtype_re = _wildtype_required_re(self.gene.lower())
 
-        for approval in self.fda_approvals:
-            parsed = approval.parse_indication_for_tumor(tumor_type)
-            if not parsed['tumor_match']:
+        for i, approval in enumerate(self.fda_approvals):
+            if not wildtype_re.search(approval.indication_lower):
                 continue
 
-            indication_lower = (approval.indication or '').lower()
-            gene_lower = self.gene.lower()
-
-            wildtype_patterns = [
-                f'{gene_lower} wild-type',
-                f'{gene_lower}-wild-type',
-                f'wild type {gene_lower}',
-                f'without {gene_lower} mutation',
-                f'{gene_lower}-negative',
-                'ras wild-type',
-                'ras wildtype',
-            ]
-
-            if any(pattern in indication_lower for pattern in wildtype_patterns):
+            if self._fda_parse(tumor_type, i)['tumor_match']:
                 drug = approval.brand_name or approval.generic_name
                 if drug:
                     wildtype_drugs.append(drug)
@@ -197,68 +333,65 @@ class Evidence(VariantAnnotations):
 
         Some gene-tumor combinations have NO approved therapies despite active research.
         """
-        gene_lower = self.gene.lower()
-        tumor_lower = (tumor_type or '').lower()
-
-        # Known investigational-only combinations
-        investigational_pairs = {
-            ('kras', 'pancreatic'): True,
-            ('kras', 'pancreas'): True,
-            ('nras', 'melanoma'): True,
-            ('tp53', '*'): True,
-            ('apc', 'colorectal'): True,
-            ('apc', 'colon'): True,
-            ('vhl', 'renal'): True,
-            ('vhl', 'kidney'): True,
-            ('smad4', 'pancreatic'): True,
-            ('smad4', 'pancreas'): True,
-            ('cdkn2a', 'melanoma'): True,
-            ('arid1a', '*'): True,
-        }
-
-        for (gene, tumor), is_investigational in investigational_pairs.items():
-            if gene == gene_lower:
-                if tumor == '*' or tumor in tumor_lower:
-                    return True
+        tumors = _INVESTIGATIONAL_TUMORS.get(self.gene.lower())
+        if not tumors:
+            return False
 
-        return False
+        tumor_lower = (tumor_type or '').lower()
+        return any(tumor == '*' or tumor in tumor_lower for tumor in tumors)
 
     def has_fda_for_variant_in_tumor(self, tumor_type: str | None = None) -> bool:
-        """Check if FDA approval exists FOR this specific variant in this tumor type."""
+        """Check if FDA approval exists FOR this specific variant in this tumor type.
+
+        Memoized per tumor type: the tier hint asks directly and again through the
+        resistance-marker check.
+        """
         if not tumor_type:
             return False
 
+        self._fresh_caches()
+        if tumor_type not in self._fda_for_variant_cache:
+            self._fda_for_variant_cache[tumor_type] = self._find_fda_for_variant(tumor_type)
+        return self._fda_for_variant_cache[tumor_type]
+
+    def _find_fda_for_variant(self, tumor_type: str) -> bool:
+        """Uncached body of has_fda_for_variant_in_tumor."""
         # Check investigational-only FIRST
         if self.is_investigational_only(tumor_type):
             return False
 
         variant_is_approved = False
+        variant_lower = self.variant.lower()
+        gene_lower = self.gene.lower()
 
         # Check FDA labels with variant-specific matching
-        for approval in self.fda_approvals:
-            parsed = approval.parse_indication_for_tumor(tumor_type)
-            if not parsed['tumor_match']:
+        for i, approval in enumerate(self.fda_approvals):
+            indication_lower = approval.indication_lower
+
+            # Labels naming neither the variant nor the gene can't match
+            variant_mentioned = variant_lower in indication_lower
+            if not variant_mentioned and gene_lower not in indication_lower:
                 continue
 
-            indication_lower = (approval.indication or '').lower()
+            if not self._fda_parse(tumor_type, i)['tumor_match']:
+                continue
 
             # Strategy 1: Explicit variant mention
-            if self.variant.lower() in indication_lower:
+            if variant_mentioned:
                 variant_is_approved = True
                 logger.debug(f"FDA approval found via explicit variant mention: {approval.drug_name}")
                 break
 
             # Strategy 2: Gene mention with variant class validation
-            if self.gene.lower() in indication_lower:
-                variant_is_approved = self._variant_matches_approval_class(
-                    gene=self.gene,
-                    variant=self.variant,
-                    indication_text=indication_lower,
-                    approval=approval
-                )
-                if variant_is_approved:
-                    logger.debug(f"FDA approval found via gene+class validation: {approval.drug_name}")
-                    break
+            variant_is_approved = self._variant_matches_approval_class(
+                gene=self.gene,
+                variant=self.variant,
+                indication_text=indication_lower,
+                approval=approval
+            )
+            if variant_is_approved:
+                logger.debug(f"FDA approval found via gene+class validation: {approval.drug_name}")
+                break
 
         if variant_is_approved:
             return True
@@ -271,7 +404,7 @@ class Evidence(VariantAnnotations):
                 sig = (ev.clinical_significance or '').upper()
                 if 'SENSITIVITY' in sig or 'RESPONSE' in sig:
                     desc = (ev.description or '').lower()
-                    if self.variant.lower() in desc or self.gene.lower() in desc:
+                    if variant_lower in desc or gene_lower in desc:
                         logger.debug(f"FDA approval found via CIViC Level A")
                         return True
 
@@ -353,34 +486,21 @@ class Evidence(VariantAnnotations):
                         if self._tumor_matches(tumor_type, ev.disease):
                             drugs_excluded.extend(ev.drugs)
 
-        drugs_excluded = list(set(d for d in drugs_excluded if d))[:5]
+        drugs_excluded = list(dict.fromkeys(d for d in drugs_excluded if d))[:5]
 
         return bool(drugs_excluded), drugs_excluded
 
     def is_prognostic_or_diagnostic_only(self) -> bool:
         """Check if variant is prognostic/diagnostic only with NO therapeutic impact."""
-        has_predictive = False
-
-        for ev in self.civic:
-            if ev.evidence_type == 'PREDICTIVE' and ev.drugs:
-                has_predictive = True
-                break
-
-        for assertion in self.civic_assertions:
-            if assertion.assertion_type == 'PREDICTIVE' and assertion.therapies:
-                has_predictive = True
-                break
-
-        if self.vicc and any(v.drugs and (v.is_sensitivity or v.is_resistance) for v in self.vicc):
-            has_predictive = True
-
-        if self.cgi_biomarkers:
-            has_predictive = True
-
-        if self.fda_approvals:
-            has_predictive = True
+        # Cheapest signals first: any FDA approval or CGI biomarker is therapeutic
+        if self.fda_approvals or self.cgi_biomarkers:
+            return False
 
-        return not has_predictive
+        return not (
+            any(ev.evidence_type == 'PREDICTIVE' and ev.drugs for ev in self.civic)
+            or any(a.assertion_type == 'PREDICTIVE' and a.therapies for a in self.civic_assertions)
+            or any(v.drugs and (v.is_sensitivity or v.is_resistance) for v in self.vicc)
+        )
 
     def get_tier_hint(self, tumor_type: str | None = None) -> str:
         """Generate explicit tier guidance based on evidence structure."""
@@ -433,66 +553,131 @@ class Evidence(VariantAnnotations):
 
         return "TIER III: Investigational/emerging evidence only"
 
-    def compute_evidence_stats(self, tumor_type: str | None = None) -> dict:
-        """Compute summary statistics and detect conflicts in the evidence."""
-        stats = {
-            'sensitivity_count': 0,
-            'resistance_count': 0,
-            'sensitivity_by_level': {},
-            'resistance_by_level': {},
-            'conflicts': [],
-            'dominant_signal': 'none',
-            'has_fda_approved': bool(self.fda_approvals) or any(b.fda_approved for b in self.cgi_biomarkers),
-        }
+    def _scan_predictive(self) -> dict:
+        """Walk VICC and predictive CIViC evidence once for both stats and drug aggregation.
 
-        drug_signals: dict[str, dict] = {}
+        Neither consumer depends on tumor type, so the scan runs once per instance.
+        The two tallies keep their own conventions: stats skip VICC entries that
+        are neither sensitivity nor resistance and let RESISTANCE win on CIViC
+        entries that mention both, while the drug table does the opposite.
+        """
+        self._fresh_caches()
+        if self._predictive_scan is not None:
+            return self._predictive_scan
 
-        def add_drug_signal(drug: str, signal_type: str, level: str | None, disease: str | None):
-            drug_lower = drug.lower().strip()
-            if drug_lower not in drug_signals:
-                drug_signals[drug_lower] = {'sensitivity': [], 'resistance': [], 'drug_name': drug}
-            drug_signals[drug_lower][signal_type].append({'level': level, 'disease': disease})
+        by_level: dict[str, Counter[str]] = {'sensitivity': Counter(), 'resistance': Counter()}
+        drug_signals: dict[str, dict] = {}  # per-drug signal counts for conflict detection
+        drug_data: dict[str, dict] = {}
+
+        def add_signal(signal_type: str | None, level: str, drugs: list[str], disease: str | None) -> None:
+            if signal_type is None:
+                return
+            by_level[signal_type][level] += 1
+            context = disease[:50] if disease else 'unspecified'
+            for drug in drugs:
+                drug_lower = drug.lower().strip()
+                if drug_lower not in drug_signals:
+                    drug_signals[drug_lower] = {
+                        'drug_name': drug,
+                        'sensitivity': 0,
+                        'resistance': 0,
+                        'sensitivity_contexts': [],
+                        'resistance_contexts': [],
+                    }
+                signals = drug_signals[drug_lower]
+                signals[signal_type] += 1
+                # Conflict text only quotes the first three entries per signal
+                if signals[signal_type] <= 3:
+                    signals[f'{signal_type}_contexts'].append(context)
+
+        def add_entry(drug: str, is_sens: bool, level: str | None, disease: str | None) -> None:
+            drug_key = drug.lower().strip()
+            if drug_key not in drug_data:
+                drug_data[drug_key] = {
+                    'drug': drug,
+                    'sensitivity_count': 0,
+                    'resistance_count': 0,
+                    'sensitivity_levels': Counter(),
+                    'resistance_levels': Counter(),
+                    'diseases': {},  # insertion-ordered set
+                    'best_level': 'D',
+                }
+            entry = drug_data[drug_key]
+            if is_sens:
+                entry['sensitivity_count'] += 1
+                entry['sensitivity_levels'][level or 'Unknown'] += 1
+            else:
+                entry['resistance_count'] += 1
+                entry['resistance_levels'][level or 'Unknown'] += 1
+            if disease:
+                entry['diseases'][disease[:50]] = None
+            if level and _LEVEL_PRIORITY.get(level, 99) < _LEVEL_PRIORITY.get(entry['best_level'], 99):
+                entry['best_level'] = level
 
         for ev in self.vicc:
-            level = ev.evidence_level or 'Unknown'
-            if ev.is_sensitivity:
-                stats['sensitivity_count'] += 1
-                stats['sensitivity_by_level'][level] = stats['sensitivity_by_level'].get(level, 0) + 1
-                for drug in ev.drugs:
-                    add_drug_signal(drug, 'sensitivity', level, ev.disease)
-            elif ev.is_resistance:
-                stats['resistance_count'] += 1
-                stats['resistance_by_level'][level] = stats['resistance_by_level'].get(level, 0) + 1
-                for drug in ev.drugs:
-                    add_drug_signal(drug, 'resistance', level, ev.disease)
+            signal_type = 'sensitivity' if ev.is_sensitivity else 'resistance' if ev.is_resistance else None
+            add_signal(signal_type, ev.evidence_level or 'Unknown', ev.drugs, ev.disease)
+            for drug in ev.drugs:
+                add_entry(drug, ev.is_sensitivity, ev.evidence_level, ev.disease)
 
         for ev in self.civic:
             if ev.evidence_type != "PREDICTIVE":
                 continue
-            level = ev.evidence_level or 'Unknown'
             sig = (ev.clinical_significance or '').upper()
-            if 'RESISTANCE' in sig:
-                stats['resistance_count'] += 1
-                stats['resistance_by_level'][level] = stats['resistance_by_level'].get(level, 0) + 1
-                for drug in ev.drugs:
-                    add_drug_signal(drug, 'resistance', level, ev.disease)
-            elif 'SENSITIVITY' in sig or 'RESPONSE' in sig:
-                stats['sensitivity_count'] += 1
-                stats['sensitivity_by_level'][level] = stats['sensitivity_by_level'].get(level, 0) + 1
-                for drug in ev.drugs:
-                    add_drug_signal(drug, 'sensitivity', level, ev.disease)
-
-        for drug_lower, signals in drug_signals.items():
-            if signals['sensitivity'] and signals['resistance']:
-                sens_diseases = list(set(s['disease'][:50] if s['disease'] else 'unspecified' for s in signals['sensitivity'][:3]))
-                res_diseases = list(set(s['disease'][:50] if s['disease'] else 'unspecified' for s in signals['resistance'][:3]))
-                stats['conflicts'].append({
-                    'drug': signals['drug_name'],
-                    'sensitivity_context': ', '.join(sens_diseases),
-                    'resistance_context': ', '.join(res_diseases),
-                    'sensitivity_count': len(signals['sensitivity']),
-                    'resistance_count': len(signals['resistance']),
-                })
+            is_sens = 'SENSITIVITY' in sig or 'RESPONSE' in sig
+            is_res = 'RESISTANCE' in sig
+            if not is_sens and not is_res:
+                continue
+            add_signal('resistance' if is_res else 'sensitivity', ev.evidence_level or 'Unknown', ev.drugs, ev.disease)
+            for drug in ev.drugs:
+                add_entry(drug, is_sens, ev.evidence_level, ev.disease)
+
+        # Freeze per-drug level tallies in level order so the drug table prints them as-is
+        for entry in drug_data.values():
+            entry['sensitivity_levels'] = dict(sorted(entry['sensitivity_levels'].items()))
+            entry['resistance_levels'] = dict(sorted(entry['resistance_levels'].items()))
+
+        conflicts = [
+            {
+                'drug': signals['drug_name'],
+                'sensitivity_context': ', '.join(dict.fromkeys(signals['sensitivity_contexts'])),
+                'resistance_context': ', '.join(dict.fromkeys(signals['resistance_contexts'])),
+                'sensitivity_count': signals['sensitivity'],
+                'resistance_count': signals['resistance'],
+            }
+            for signals in drug_signals.values()
+            if signals['sensitivity'] and signals['resistance']
+        ]
+
+        self._predictive_scan = {
+            'sensitivity_count': by_level['sensitivity'].total(),
+            'resistance_count': by_level['resistance'].total(),
+            'sensitivity_by_level': dict(by_level['sensitivity']),
+            'resistance_by_level': dict(by_level['resistance']),
+            'conflicts': conflicts,
+            'drug_data': drug_data,
+        }
+        return self._predictive_scan
+
+    def compute_evidence_stats(self, tumor_type: str | None = None) -> dict:
+        """Compute summary statistics and detect conflicts in the evidence.
+
+        Memoized per tumor type; the returned dict is shared and must not be mutated.
+        """
+        self._fresh_caches()
+        if tumor_type in self._stats_cache:
+            return self._stats_cache[tumor_type]
+
+        scan = self._scan_predictive()
+        stats = {
+            'sensitivity_count': scan['sensitivity_count'],
+            'resistance_count': scan['resistance_count'],
+            'sensitivity_by_level': scan['sensitivity_by_level'],
+            'resistance_by_level': scan['resistance_by_level'],
+            'conflicts': list(scan['conflicts']),
+            'dominant_signal': 'none',
+            'has_fda_approved': bool(self.fda_approvals) or any(b.fda_approved for b in self.cgi_biomarkers),
+        }
 
         total = stats['sensitivity_count'] + stats['resistance_count']
         if total == 0:
@@ -508,23 +693,13 @@ class Evidence(VariantAnnotations):
         else:
             stats['dominant_signal'] = 'mixed'
 
+        self._stats_cache[tumor_type] = stats
         return stats
 
     def format_evidence_summary_header(self, tumor_type: str | None = None) -> str:
         """Generate a pre-processed summary header with stats and conflicts."""
         stats = self.compute_evidence_stats(tumor_type)
-        lines = []
-
-        lines.append("=" * 60)
-        lines.append("EVIDENCE SUMMARY (Pre-processed)")
-        lines.append("=" * 60)
-
-        tier_hint = self.get_tier_hint(tumor_type)
-        lines.append("")
-        lines.append("*** TIER CLASSIFICATION GUIDANCE ***")
-        lines.append(tier_hint)
-        lines.append("=" * 60)
-        lines.append("")
+        lines = [*_SUMMARY_HEADER_LINES, self.get_tier_hint(tumor_type), _RULE, ""]
 
         total = stats['sensitivity_count'] + stats['resistance_count']
         if total > 0:
@@ -552,8 +727,8 @@ class Evidence(VariantAnnotations):
         if tumor_type and self.fda_approvals:
             later_line_approvals = []
             first_line_approvals = []
-            for approval in self.fda_approvals:
-                parsed = approval.parse_indication_for_tumor(tumor_type)
+            for i, approval in enumerate(self.fda_approvals):
+                parsed = self._fda_parse(tumor_type, i)
                 if parsed['tumor_match']:
                     drug = approval.brand_name or approval.generic_name or approval.drug_name
                     if parsed['line_of_therapy'] == 'later-line':
@@ -579,7 +754,7 @@ class Evidence(VariantAnnotations):
                            f"SENSITIVITY in {conflict['sensitivity_context']} ({conflict['sensitivity_count']} entries) "
                            f"vs RESISTANCE in {conflict['resistance_context']} ({conflict['resistance_count']} entries)")
 
-        lines.append("=" * 60)
+        lines.append(_RULE)
         lines.append("")
 
         return "\n".join(lines)
@@ -589,16 +764,13 @@ class Evidence(VariantAnnotations):
         sensitivity = [e for e in self.vicc if e.is_sensitivity]
         resistance = [e for e in self.vicc if e.is_resistance]
 
-        high_quality_levels = {'A', 'B'}
-        low_quality_levels = {'C', 'D'}
-
         sens_levels = {e.evidence_level for e in sensitivity if e.evidence_level}
         res_levels = {e.evidence_level for e in resistance if e.evidence_level}
 
-        sens_has_high = bool(sens_levels & high_quality_levels)
-        sens_only_low = sens_levels and sens_levels <= low_quality_levels
-        res_has_high = bool(res_levels & high_quality_levels)
-        res_only_low = res_levels and res_levels <= low_quality_levels
+        sens_has_high = not _HIGH_QUALITY_LEVELS.isdisjoint(sens_levels)
+        sens_only_low = sens_levels and sens_levels <= _LOW_QUALITY_LEVELS
+        res_has_high = not _HIGH_QUALITY_LEVELS.isdisjoint(res_levels)
+        res_only_low = res_levels and res_levels <= _LOW_QUALITY_LEVELS
 
         if sens_has_high and res_only_low and len(resistance) <= 2:
             return sensitivity, []
@@ -609,52 +781,16 @@ class Evidence(VariantAnnotations):
 
     def aggregate_evidence_by_drug(self, tumor_type: str | None = None) -> list[dict]:
         """Aggregate evidence entries by drug for cleaner LLM presentation."""
-        drug_data: dict[str, dict] = {}
-
-        def add_entry(drug: str, is_sens: bool, level: str | None, disease: str | None):
-            drug_key = drug.lower().strip()
-            if drug_key not in drug_data:
-                drug_data[drug_key] = {
-                    'drug': drug,
-                    'sensitivity_count': 0,
-                    'resistance_count': 0,
-                    'sensitivity_levels': {},
-                    'resistance_levels': {},
-                    'diseases': set(),
-                    'best_level': 'D',
-                }
-            entry = drug_data[drug_key]
-            if is_sens:
-                entry['sensitivity_count'] += 1
-                lvl = level or 'Unknown'
-                entry['sensitivity_levels'][lvl] = entry['sensitivity_levels'].get(lvl, 0) + 1
-            else:
-                entry['resistance_count'] += 1
-                lvl = level or 'Unknown'
-                entry['resistance_levels'][lvl] = entry['resistance_levels'].get(lvl, 0) + 1
-            if disease:
-                entry['diseases'].add(disease[:50])
-            level_priority = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
-            if level and level_priority.get(level, 99) < level_priority.get(entry['best_level'], 99):
-                entry['best_level'] = level
-
-        for ev in self.vicc:
-            for drug in ev.drugs:
-                add_entry(drug, ev.is_sensitivity, ev.evidence_level, ev.disease)
-
-        for ev in self.civic:
-            if ev.evidence_type != "PREDICTIVE":
-                continue
-            sig = (ev.clinical_significance or '').upper()
-            is_sens = 'SENSITIVITY' in sig or 'RESPONSE' in sig
-            is_res = 'RESISTANCE' in sig
-            if not is_sens and not is_res:
-                continue
-            for drug in ev.drugs:
-                add_entry(drug, is_sens, ev.evidence_level, ev.disease)
+        drug_data = self._scan_predictive()['drug_data']
 
         results = []
-        for drug_key, data in drug_data.items():
+        for drug_key, entry in drug_data.items():
+            # Copy so the shared scan is left untouched
+            data = {
+                **entry,
+                'sensitivity_levels': dict(entry['sensitivity_levels']),
+                'resistance_levels': dict(entry['resistance_levels']),
+            }
             sens = data['sensitivity_count']
             res = data['resistance_count']
             if sens > 0 and res == 0:
@@ -672,8 +808,7 @@ class Evidence(VariantAnnotations):
             data['diseases'] = list(data['diseases'])[:5]
             results.append(data)
 
-        level_priority = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
-        results.sort(key=lambda x: (level_priority.get(x['best_level'], 99), -(x['sensitivity_count'] + x['resistance_count'])))
+        results.sort(key=lambda x: (_LEVEL_PRIORITY.get(x['best_level'], 99), -(x['sensitivity_count'] + x['resistance_count'])))
 
         return results
 
@@ -688,12 +823,12 @@ class Evidence(VariantAnnotations):
         for idx, drug in enumerate(aggregated[:10], 1):
             sens_str = f"{drug['sensitivity_count']} sens"
             if drug['sensitivity_levels']:
-                levels = ', '.join(f"{k}:{v}" for k, v in sorted(drug['sensitivity_levels'].items()))
+                levels = ', '.join(f"{k}:{v}" for k, v in drug['sensitivity_levels'].items())
                 sens_str += f" ({levels})"
 
             res_str = f"{drug['resistance_count']} res"
             if drug['resistance_levels']:
-                levels = ', '.join(f"{k}:{v}" for k, v in sorted(drug['resistance_levels'].items()))
+                levels = ', '.join(f"{k}:{v}" for k, v in drug['resistance_levels'].items())
                 res_str += f" ({levels})"
 
             lines.append(f"  {idx}. {drug['drug']}: {sens_str}, {res_str} → {drug['net_signal']} [Level {drug['best_level']}]")
@@ -701,18 +836,34 @@ class Evidence(VariantAnnotations):
         lines.append("")
         return "\n".join(lines)
 
+    def format_full_summary(self, tumor_type: str | None = None) -> str:
+        """Render the full evidence block sent to the LLM, memoized per tumor type.
+
+        Combines the summary header (stats and conflict detection), the drug-level
+        aggregation that replaces detailed VICC/CIViC listings, and the compact
+        FDA/CGI details.
+        """
+        self._fresh_caches()
+        if tumor_type not in self._summary_cache:
+            self._summary_cache[tumor_type] = "".join((
+                self.format_evidence_summary_header(tumor_type=tumor_type),
+                self.format_drug_aggregation_summary(tumor_type=tumor_type),
+                self.summary_compact(tumor_type=tumor_type),
+            ))
+        return self._summary_cache[tumor_type]
+
     def summary_compact(self, tumor_type: str | None = None) -> str:
         """Generate a compact summary - FDA approvals and CGI only."""
         lines = [f"Evidence for {self.gene} {self.variant}:\n"]
 
         if self.fda_approvals:
             lines.append(f"FDA Approved Drugs ({len(self.fda_approvals)}):")
-            for approval in self.fda_approvals[:5]:
+            for i, approval in enumerate(self.fda_approvals[:5]):
                 drug = approval.brand_name or approval.generic_name or approval.drug_name
                 variant_explicit = approval.variant_in_clinical_studies
 
                 if tumor_type:
-                    parsed = approval.parse_indication_for_tumor(tumor_type)
+                    parsed = self._fda_parse(tumor_type, i)
                     if parsed['tumor_match'] or variant_explicit:
                         line_info = parsed['line_of_therapy'].upper() if parsed['tumor_match'] else "UNSPECIFIED"
                         approval_info = parsed['approval_type'].upper() if parsed['tumor_match'] else "UNSPECIFIED"
@@ -725,8 +876,8 @@ class Evidence(VariantAnnotations):
                         lines.append(f"      Approval type: {approval_info}")
 
                         indication = approval.indication or ""
-                        if "[Clinical studies mention" in indication:
-                            cs_start = indication.find("[Clinical studies mention")
+                        cs_start = indication.find("[Clinical studies mention")
+                        if cs_start != -1:
                             cs_excerpt = indication[cs_start:cs_start+400]
                             lines.append(f"      {cs_excerpt}...")
                         else:
@@ -742,8 +893,15 @@ class Evidence(VariantAnnotations):
         if self.cgi_biomarkers:
             approved = [b for b in self.cgi_biomarkers if b.fda_approved]
             if approved:
-                resistance_approved = [b for b in approved if b.association and 'RESIST' in b.association.upper()]
-                sensitivity_approved = [b for b in approved if b.association and 'RESIST' not in b.association.upper()]
+                resistance_approved = []
+                sensitivity_approved = []
+                for b in approved:
+                    if not b.association:
+                        continue
+                    if 'RESIST' in b.association.upper():
+                        resistance_approved.append(b)
+                    else:
+                        sensitivity_approved.append(b)
 
                 if resistance_approved:
                     lines.append(f"CGI FDA-APPROVED RESISTANCE MARKERS ({len(resistance_approved)}):")
@@ -760,11 +918,17 @@ class Evidence(VariantAnnotations):
                     lines.append("")
 
         if self.civic_assertions:
-            predictive_tier_i = [a for a in self.civic_assertions
-                                  if a.amp_tier == "Tier I" and a.assertion_type == "PREDICTIVE"]
-            predictive_tier_ii = [a for a in self.civic_assertions
-                                   if a.amp_tier == "Tier II" and a.assertion_type == "PREDICTIVE"]
-            prognostic = [a for a in self.civic_assertions if a.assertion_type == "PROGNOSTIC"]
+            predictive_tier_i = []
+            predictive_tier_ii = []
+            prognostic = []
+            for a in self.civic_assertions:
+                if a.assertion_type == "PREDICTIVE":
+                    if a.amp_tier == "Tier I":
+                        predictive_tier_i.append(a)
+                    elif a.amp_tier == "Tier II":
+                        predictive_tier_ii.append(a)
+                elif a.assertion_type == "PROGNOSTIC":
+                    prognostic.append(a)
 
             if predictive_tier_i:
                 lines.append(f"CIViC PREDICTIVE TIER I ASSERTIONS ({len(predictive_tier_i)}):")
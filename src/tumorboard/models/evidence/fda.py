@@ -1,8 +1,89 @@
-from pydantic import BaseModel, Field
+import re
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Indication parsing vocabulary, shared by every FDAApproval.parse_indication_for_tumor call
+_TUMOR_KEYWORDS = {
+    'colorectal': ('colorectal', 'colon', 'rectal', 'crc', 'mcrc'),
+    'melanoma': ('melanoma',),
+    'lung': ('lung', 'nsclc', 'non-small cell'),
+    'breast': ('breast',),
+    'thyroid': ('thyroid', 'atc', 'anaplastic thyroid'),
+}
+
+_NEXT_SECTION_MARKERS = (
+    'non-small cell lung cancer',
+    'nsclc)',
+    'melanoma •',
+    'breast cancer',
+    'thyroid cancer',
+    'limitations of use',
+    '1.1 braf',
+    '1.2 braf',
+    '1.3 braf',
+    '1.4 ',
+)
+
+_LATER_LINE_PHRASES = (
+    'after prior therapy',
+    'after progression',
+    'following progression',
+    'following recurrence',
+    'second-line',
+    'second line',
+    'third-line',
+    'third line',
+    'previously treated',
+    'refractory',
+    'who have failed',
+    'after failure',
+    'following prior',
+    'disease progression',
+)
+
+_FIRST_LINE_PHRASES = (
+    'first-line',
+    'first line',
+    'frontline',
+    'initial treatment',
+    'treatment-naive',
+    'previously untreated',
+)
+
+_ACCELERATED_PHRASES = (
+    'accelerated approval',
+    'approved under accelerated',
+    'contingent upon verification',
+    'confirmatory trial',
+)
+
+
+def _phrase_re(phrases: tuple[str, ...]) -> re.Pattern:
+    """One alternation over literal phrases, so a text is scanned once per category."""
+    return re.compile('|'.join(re.escape(phrase) for phrase in phrases))
+
+
+_NEXT_SECTION_RE = _phrase_re(_NEXT_SECTION_MARKERS)
+_LATER_LINE_RE = _phrase_re(_LATER_LINE_PHRASES)
+_FIRST_LINE_RE = _phrase_re(_FIRST_LINE_PHRASES)
+_ACCELERATED_RE = _phrase_re(_ACCELERATED_PHRASES)
+
+
+@lru_cache(maxsize=256)
+def _tumor_keys(tumor_lower: str) -> tuple[str, ...]:
+    """Indication keywords for a tumor type: its keyword group, or the name itself."""
+    for keywords in _TUMOR_KEYWORDS.values():
+        if any(kw in tumor_lower for kw in keywords):
+            return keywords
+    return (tumor_lower,)
+
 
 class FDAApproval(BaseModel):
     """FDA drug approval information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     drug_name: str | None = None
     brand_name: str | None = None
     generic_name: str | None = None
@@ -13,9 +94,33 @@ class FDAApproval(BaseModel):
     variant_in_indications: bool = False
     variant_in_clinical_studies: bool = False
 
+    # (indication, lowercased indication); rebuilt when indication is reassigned or copied with update
+    _indication_lower: tuple[str | None, str] | None = PrivateAttr(default=None)
+
+    @property
+    def indication_lower(self) -> str:
+        """Lowercased indication text, computed once per indication and shared by the evidence checks."""
+        cached = self._indication_lower
+        if cached is None or cached[0] is not self.indication:
+            cached = self._indication_lower = (self.indication, (self.indication or '').lower())
+        return cached[1]
+
     def parse_indication_for_tumor(self, tumor_type: str) -> dict:
         """Parse FDA indication text to extract line-of-therapy and approval type for a specific tumor."""
-        if not self.indication or not tumor_type:
+        # Copy so callers can't mutate the memoized result
+        return dict(self._parse_indication(self.indication, self.indication_lower, tumor_type))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_indication(indication: str | None, indication_lower: str, tumor_type: str) -> dict:
+        """Memoized parser keyed on the label text.
+
+        The same label is checked several times per variant (tier hint, header,
+        compact summary) and recurs across variants of a gene. The lowercased
+        label comes from the approval's cached indication_lower, so checking one
+        label against several tumor types lowercases it only once.
+        """
+        if not indication or not tumor_type:
             return {
                 'tumor_match': False,
                 'line_of_therapy': 'unspecified',
@@ -23,52 +128,21 @@ class FDAApproval(BaseModel):
                 'indication_excerpt': ''
             }
 
-        indication_lower = self.indication.lower()
         tumor_lower = tumor_type.lower()
 
-        # Check for tumor type match (flexible matching)
-        tumor_keywords = {
-            'colorectal': ['colorectal', 'colon', 'rectal', 'crc', 'mcrc'],
-            'melanoma': ['melanoma'],
-            'lung': ['lung', 'nsclc', 'non-small cell'],
-            'breast': ['breast'],
-            'thyroid': ['thyroid', 'atc', 'anaplastic thyroid'],
-        }
-
         tumor_match = False
         matched_section = ""
 
-        tumor_keys = []
-        for key, keywords in tumor_keywords.items():
-            if any(kw in tumor_lower for kw in keywords):
-                tumor_keys = keywords
-                break
-        if not tumor_keys:
-            tumor_keys = [tumor_lower]
-
-        for kw in tumor_keys:
-            if kw in indication_lower:
+        # Check for tumor type match (flexible matching)
+        for kw in _tumor_keys(tumor_lower):
+            idx = indication_lower.find(kw)
+            if idx != -1:
                 tumor_match = True
-                idx = indication_lower.find(kw)
                 start = max(0, idx - 50)
-                next_section_markers = [
-                    'non-small cell lung cancer',
-                    'nsclc)',
-                    'melanoma •',
-                    'breast cancer',
-                    'thyroid cancer',
-                    'limitations of use',
-                    '1.1 braf',
-                    '1.2 braf',
-                    '1.3 braf',
-                    '1.4 ',
-                ]
-                end = len(self.indication)
-                for next_sec in next_section_markers:
-                    next_idx = indication_lower.find(next_sec, idx + len(kw) + 100)
-                    if next_idx > idx and next_idx < end:
-                        end = next_idx
-                matched_section = self.indication[start:end]
+                # Leftmost marker past the keyword ends the section
+                next_sec = _NEXT_SECTION_RE.search(indication_lower, idx + len(kw) + 100)
+                end = next_sec.start() if next_sec else len(indication)
+                matched_section = indication[start:end]
                 break
 
         if not tumor_match:
@@ -79,58 +153,17 @@ class FDAApproval(BaseModel):
                 'indication_excerpt': ''
             }
 
-        later_line_phrases = [
-            'after prior therapy',
-            'after progression',
-            'following progression',
-            'following recurrence',
-            'second-line',
-            'second line',
-            'third-line',
-            'third line',
-            'previously treated',
-            'refractory',
-            'who have failed',
-            'after failure',
-            'following prior',
-            'disease progression',
-        ]
-
-        first_line_phrases = [
-            'first-line',
-            'first line',
-            'frontline',
-            'initial treatment',
-            'treatment-naive',
-            'previously untreated',
-        ]
-
         matched_lower = matched_section.lower()
         line_of_therapy = 'unspecified'
 
-        for phrase in later_line_phrases:
-            if phrase in matched_lower:
-                line_of_therapy = 'later-line'
-                break
-
-        if line_of_therapy == 'unspecified':
-            for phrase in first_line_phrases:
-                if phrase in matched_lower:
-                    line_of_therapy = 'first-line'
-                    break
+        if _LATER_LINE_RE.search(matched_lower):
+            line_of_therapy = 'later-line'
+        elif _FIRST_LINE_RE.search(matched_lower):
+            line_of_therapy = 'first-line'
 
         approval_type = 'full'
-        accelerated_phrases = [
-            'accelerated approval',
-            'approved under accelerated',
-            'contingent upon verification',
-            'confirmatory trial',
-        ]
-
-        for phrase in accelerated_phrases:
-            if phrase in matched_lower:
-                approval_type = 'accelerated'
-                break
+        if _ACCELERATED_RE.search(matched_lower):
+            approval_type = 'accelerated'
 
         return {
             'tumor_match': True,
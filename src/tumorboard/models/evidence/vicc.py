@@ -1,8 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class VICCEvidence(BaseModel):
     """Evidence from VICC MetaKB (harmonized multi-KB interpretations)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     description: str | None = None
     gene: str | None = None
     variant: str | None = None
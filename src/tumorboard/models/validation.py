@@ -32,9 +32,9 @@ This validation framework is essential for clinical deployment - we can't use
 AI for cancer treatment decisions without rigorous validation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from tumorboard.models.assessment import ActionabilityAssessment, ActionabilityTier
+from tumorboard.models.assessment import TIER_ORDER, ActionabilityAssessment, ActionabilityTier
 
 
 class GoldStandardEntry(BaseModel):
@@ -84,15 +84,8 @@ class ValidationResult(BaseModel):
         would be a distance of 3 - a critical error that could lead to inappropriate
         therapy selection or missed treatment opportunities.
         """
-        tier_order = {
-            ActionabilityTier.TIER_I: 0,
-            ActionabilityTier.TIER_II: 1,
-            ActionabilityTier.TIER_III: 2,
-            ActionabilityTier.TIER_IV: 3,
-            ActionabilityTier.UNKNOWN: -1,
-        }
-        expected_idx = tier_order.get(self.expected_tier, -1)
-        predicted_idx = tier_order.get(self.predicted_tier, -1)
+        expected_idx = TIER_ORDER.get(self.expected_tier, -1)
+        predicted_idx = TIER_ORDER.get(self.predicted_tier, -1)
 
         if expected_idx == -1 or predicted_idx == -1:
             return 999  # Unknown tier - flag as invalid
@@ -174,6 +167,9 @@ class ValidationMetrics(BaseModel):
     tier_metrics: dict[str, TierMetrics] = Field(default_factory=dict)
     failure_analysis: list[dict[str, str]] = Field(default_factory=list)
 
+    # Running confidence total so averages can be finalized without keeping results
+    _confidence_total: float = PrivateAttr(default=0.0)
+
     def add_result(self, result: ValidationResult) -> None:
         """Add a validation result and update metrics.
 
@@ -184,6 +180,7 @@ class ValidationMetrics(BaseModel):
         - Failure tracking for error analysis
         """
         self.total_cases += 1
+        self._confidence_total += result.confidence_score
 
         if result.is_correct:
             self.correct_predictions += 1
@@ -231,12 +228,14 @@ class ValidationMetrics(BaseModel):
         for result in results:
             self.add_result(result)
 
+        self.finalize()
+
+    def finalize(self) -> None:
+        """Derive accuracy, average confidence and per-tier scores from the added results."""
         # Calculate overall metrics
         if self.total_cases > 0:
             self.accuracy = self.correct_predictions / self.total_cases
-
-        total_confidence = sum(r.confidence_score for r in results)
-        self.average_confidence = total_confidence / len(results) if results else 0.0
+            self.average_confidence = self._confidence_total / self.total_cases
 
         # Calculate per-tier metrics
         for metrics in self.tier_metrics.values():
@@ -270,14 +269,7 @@ class ValidationMetrics(BaseModel):
         ]
 
         # Sort tiers in order
-        tier_order = [
-            ActionabilityTier.TIER_I,
-            ActionabilityTier.TIER_II,
-            ActionabilityTier.TIER_III,
-            ActionabilityTier.TIER_IV,
-        ]
-
-        for tier in tier_order:
+        for tier in TIER_ORDER:
             if tier.value in self.tier_metrics:
                 metrics = self.tier_metrics[tier.value]
                 lines.append(f"\n{tier.value}:")
@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from tumorboard.utils.variant_normalization import VariantNormalizer, normalize_variant
+
 
 class VariantInput(BaseModel):
     """Input for variant assessment."""
@@ -25,7 +27,6 @@ class VariantInput(BaseModel):
     def validate_variant_type(cls, v: str, info) -> str:
         """Validate that the variant is a SNP or small indel."""
         if 'gene' in info.data:
-            from tumorboard.utils.variant_normalization import normalize_variant, VariantNormalizer
             gene = info.data['gene']
             normalized = normalize_variant(gene, v)
             variant_type = normalized['variant_type']
@@ -3,16 +3,90 @@
 Provides structured logging for LLM interactions, decision tracking, and debugging.
 """
 
-import json
+import atexit
 import logging
+import queue
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+
+class _JSONLFileHandler(logging.Handler):
+    """Appends pre-serialized JSONL records to a file through a large write buffer.
+
+    Records carry their encoded line in a ``jsonl`` attribute (set via ``extra``);
+    a truthy ``flush_now`` attribute flushes the buffer right after the write.
+    """
+
+    def __init__(self, path: Path, buffer_size: int, flush_interval: float):
+        super().__init__()
+        self.stream = open(path, 'ab', buffering=buffer_size)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._dirty = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Attributes from ``extra`` are not declared on LogRecord, so read them from its __dict__
+        fields = record.__dict__
+        self.stream.write(fields["jsonl"])
+        self._dirty = True
+        if fields.get("flush_now") or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._last_flush = time.monotonic()
+            self._dirty = False
+            if not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def flush_if_stale(self) -> None:
+        """Flush buffered records once they have waited flush_interval, even with no new writes."""
+        if self._dirty and time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self.stream.close()
+        finally:
+            self.release()
+        super().close()
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that wakes every flush interval to push an idle buffer to disk."""
+
+    def __init__(self, log_queue: queue.Queue, handler: _JSONLFileHandler):
+        super().__init__(log_queue, handler)
+        self._log_queue = log_queue
+        self._file_handler = handler
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                record: logging.LogRecord = self._log_queue.get(block, timeout=self._file_handler.flush_interval)
+                return record
+            except queue.Empty:
+                # Idle: without this the tail would sit in the buffer until the next record
+                self._file_handler.flush_if_stale()
+
 
 class LLMDecisionLogger:
     """Logger for LLM decisions with structured output."""
 
+    # JSONL records go through a write buffer of this size and are flushed to
+    # disk at least every FLUSH_INTERVAL seconds
+    BUFFER_SIZE = 1 << 20
+    FLUSH_INTERVAL = 1.0
+
     def __init__(self, log_dir: Path | None = None, enable_file_logging: bool = True):
         """Initialize the LLM decision logger.
 
@@ -36,8 +110,16 @@ class LLMDecisionLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
 
-        # File handler for detailed JSON logs
-        self.file_handler = None
+        # Detailed JSON logs are queued and written by a background listener thread,
+        # so LLM calls never wait on disk I/O
+        self._decisions = logging.getLogger("tumorboard.llm.decisions")
+        self._decisions.setLevel(logging.INFO)
+        self._decisions.propagate = False
+        self._decisions.handlers.clear()
+        self._queue: queue.Queue | None = None
+        self._listener: QueueListener | None = None
+        self._file_handler: _JSONLFileHandler | None = None
+        self.log_file: Path | None = None
         if enable_file_logging:
             if log_dir is None:
                 log_dir = Path("./logs")
@@ -47,17 +129,57 @@ class LLMDecisionLogger:
             timestamp = datetime.now().strftime("%Y%m%d")
             log_file = log_dir / f"llm_decisions_{timestamp}.jsonl"
 
-            # Use a separate file handler that only logs DEBUG messages
-            self.file_handler = logging.FileHandler(log_file)
-            self.file_handler.setLevel(logging.DEBUG)
-            self.file_handler.setFormatter(logging.Formatter('%(message)s'))
-            self.file_handler.addFilter(lambda record: record.levelno == logging.DEBUG)
-            self.logger.addHandler(self.file_handler)
+            self._file_handler = _JSONLFileHandler(log_file, self.BUFFER_SIZE, self.FLUSH_INTERVAL)
+            self._queue = queue.Queue()
+            self._listener = _FlushingQueueListener(self._queue, self._file_handler)
+            self._listener.start()
+            self._decisions.addHandler(QueueHandler(self._queue))
 
             self.log_file = log_file
             self.logger.info(f"LLM decision logging enabled: {log_file}")
-        else:
-            self.log_file = None
+            atexit.register(self.close)
+
+    def _emit(self, log_entry: dict[str, Any], flush: bool = False) -> None:
+        """Queue a JSONL record for the background writer.
+
+        With flush=True the writer flushes the file straight after this record;
+        the caller does not wait for it, so the event loop is never blocked.
+        """
+        if self._queue is None:
+            return
+
+        # orjson yields newline-terminated UTF-8 bytes (datetimes included) ready for the binary stream
+        self._decisions.info(
+            log_entry["event_type"],
+            extra={
+                "jsonl": orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE),
+                "flush_now": flush,
+            },
+        )
+
+    def flush(self) -> None:
+        """Wait for queued JSONL records to be written, then flush the log file.
+
+        Blocks until the writer thread catches up, so call it off the event loop.
+        """
+        if self._queue is None or self._file_handler is None:
+            return
+
+        self._queue.join()
+        self._file_handler.flush()
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread and close the JSONL log file."""
+        if self._listener is None or self._file_handler is None:
+            return
+
+        atexit.unregister(self.close)
+        self._listener.stop()
+        self._file_handler.close()
+        self._decisions.handlers.clear()
+        self._queue = None
+        self._listener = None
+        self._file_handler = None
 
     def log_llm_request(
         self,
@@ -73,28 +195,26 @@ class LLMDecisionLogger:
         Returns:
             Request ID for tracking
         """
-        request_id = f"{gene}_{variant}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": "llm_request",
-            "request_id": request_id,
-            "input": {
-                "gene": gene,
-                "variant": variant,
-                "tumor_type": tumor_type,
-                "evidence_summary_length": len(evidence_summary),
-                "model": model,
-                "temperature": temperature,
-            }
-        }
+        now = datetime.now()
+        request_id = f"{gene}_{variant}_{now.strftime('%Y%m%d_%H%M%S_%f')}"
 
         self.logger.info(f"LLM Request: {gene} {variant} (tumor: {tumor_type or 'unspecified'}) using {model}")
 
         # Write JSON to file handler only
-        if self.file_handler:
-            self.file_handler.stream.write(json.dumps(log_entry) + '\n')
-            self.file_handler.flush()
+        if self._queue is not None:
+            self._emit({
+                "timestamp": now,
+                "event_type": "llm_request",
+                "request_id": request_id,
+                "input": {
+                    "gene": gene,
+                    "variant": variant,
+                    "tumor_type": tumor_type,
+                    "evidence_summary_length": len(evidence_summary),
+                    "model": model,
+                    "temperature": temperature,
+                }
+            })
 
         return request_id
 
@@ -114,9 +234,17 @@ class LLMDecisionLogger:
         raw_response: str | None = None,
     ) -> None:
         """Log an LLM assessment response."""
+        self.logger.info(
+            f"LLM Decision: {gene} {variant} → {tier} "
+            f"(confidence: {confidence_score:.1%}, therapies: {len(recommended_therapies)})"
+        )
+
+        # Write JSON to file handler only
+        if self._queue is None:
+            return
 
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "event_type": "llm_response",
             "request_id": request_id,
             "output": {
@@ -136,15 +264,7 @@ class LLMDecisionLogger:
         if raw_response:
             log_entry["raw_response"] = raw_response
 
-        self.logger.info(
-            f"LLM Decision: {gene} {variant} → {tier} "
-            f"(confidence: {confidence_score:.1%}, therapies: {len(recommended_therapies)})"
-        )
-
-        # Write JSON to file handler only
-        if self.file_handler:
-            self.file_handler.stream.write(json.dumps(log_entry) + '\n')
-            self.file_handler.flush()
+        self._emit(log_entry)
 
     def log_llm_error(
         self,
@@ -154,27 +274,23 @@ class LLMDecisionLogger:
         error: Exception,
     ) -> None:
         """Log an LLM assessment error."""
-
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": "llm_error",
-            "request_id": request_id,
-            "input": {
-                "gene": gene,
-                "variant": variant,
-            },
-            "error": {
-                "type": type(error).__name__,
-                "message": str(error),
-            }
-        }
-
         self.logger.error(f"LLM Error: {gene} {variant} - {error}")
 
-        # Write JSON to file handler only
-        if self.file_handler:
-            self.file_handler.stream.write(json.dumps(log_entry) + '\n')
-            self.file_handler.flush()
+        # Write JSON to file handler only; errors are flushed as soon as the writer reaches them
+        if self._queue is not None:
+            self._emit({
+                "timestamp": datetime.now(),
+                "event_type": "llm_error",
+                "request_id": request_id,
+                "input": {
+                    "gene": gene,
+                    "variant": variant,
+                },
+                "error": {
+                    "type": type(error).__name__,
+                    "message": str(error),
+                }
+            }, flush=True)
 
     def log_decision_summary(
         self,
@@ -231,4 +347,6 @@ def get_logger(log_dir: Path | None = None, enable_file_logging: bool = True) ->
 def reset_logger() -> None:
     """Reset the global logger (mainly for testing)."""
     global _global_logger
+    if _global_logger is not None:
+        _global_logger.close()
     _global_logger = None
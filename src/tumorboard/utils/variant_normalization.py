@@ -10,6 +10,7 @@ This module provides tools to normalize variant notations across different forma
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 
 from tumorboard.constants import (
@@ -30,12 +31,34 @@ class VariantNormalizer:
     # Variant type patterns
     MISSENSE_PATTERN = re.compile(r'^([A-Z*])(\d+)([A-Z*])$', re.IGNORECASE)
     MISSENSE_3LETTER_PATTERN = re.compile(r'^([A-Z]{3})(\d+)([A-Z]{3})$', re.IGNORECASE)
+    # One- or three-letter missense in a single match: groups 1-3 or 4-6
+    MISSENSE_ANY_PATTERN = re.compile(
+        r'^(?:([A-Z*])(\d+)([A-Z*])|([A-Z]{3})(\d+)([A-Z]{3}))$', re.IGNORECASE
+    )
     HGVS_PROTEIN_PATTERN = re.compile(r'^p\.([A-Z]{1,3})(\d+)([A-Z*]{1,3})$', re.IGNORECASE)
     DELETION_PATTERN = re.compile(r'del', re.IGNORECASE)
     INSERTION_PATTERN = re.compile(r'ins', re.IGNORECASE)
     DUPLICATION_PATTERN = re.compile(r'dup', re.IGNORECASE)
     FRAMESHIFT_PATTERN = re.compile(r'fs', re.IGNORECASE)
     NONSENSE_PATTERN = re.compile(r'([A-Z*])(\d+)\*', re.IGNORECASE)
+    # Every keyword-classified type in one scan; the lookahead reports overlapping
+    # hits so each type is seen whenever its keyword occurs anywhere in the string
+    KEYWORD_TYPE_PATTERN = re.compile(
+        r'(?=(?P<fusion>fusion|fus|rearrangement)'
+        r'|(?P<amplification>amp|overexpression)'
+        r'|(?P<truncating>truncat)'
+        r'|(?P<splice>splice|exon|skip)'
+        r'|(?P<frameshift>fs)'
+        r'|(?P<deletion>del)'
+        r'|(?P<insertion>ins)'
+        r'|(?P<duplication>dup))',
+        re.IGNORECASE,
+    )
+    # Precedence when a variant mentions several keyword types
+    KEYWORD_TYPE_PRIORITY = (
+        'fusion', 'amplification', 'truncating', 'splice',
+        'frameshift', 'deletion', 'insertion', 'duplication',
+    )
 
     @staticmethod
     def normalize_protein_change(variant: str) -> Dict[str, Optional[str]]:
@@ -58,6 +81,13 @@ class VariantNormalizer:
         p.V600E - >
         {'alt_aa': 'E', 'hgvs_protein': 'p.V600E', 'is_missense': True, 'long_form': 'VAL600GLU', 'position': 600, 'ref_aa': 'V', 'short_form': 'V600E'}
         """
+        # Copy so callers can't mutate the memoized result
+        return dict(VariantNormalizer._normalize_protein_change(variant))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_protein_change(variant: str) -> Dict[str, Optional[str]]:
+        """Memoized body of normalize_protein_change; the same variants recur across a batch."""
         variant = variant.strip()
 
         # Remove common prefixes
@@ -74,10 +104,13 @@ class VariantNormalizer:
             'is_missense': False
         }
 
-        # Try one-letter missense format (V600E)
-        match = VariantNormalizer.MISSENSE_PATTERN.match(variant)
-        if match:
-            ref, pos, alt = match.groups()
+        match = VariantNormalizer.MISSENSE_ANY_PATTERN.match(variant)
+        if not match:
+            return result
+
+        # One-letter missense format (V600E)
+        if match.group(1):
+            ref, pos, alt = match.group(1, 2, 3)
             ref = ref.upper()
             alt = alt.upper()
             result['short_form'] = f"{ref}{pos}{alt}"
@@ -90,28 +123,26 @@ class VariantNormalizer:
                 result['long_form'] = f"{VariantNormalizer.AA_1TO3[ref]}{pos}{VariantNormalizer.AA_1TO3[alt]}"
             return result
 
-        # Try three-letter missense format (Val600Glu)
-        match = VariantNormalizer.MISSENSE_3LETTER_PATTERN.match(variant)
-        if match:
-            ref_3, pos, alt_3 = match.groups()
-            ref_3 = ref_3.upper()
-            alt_3 = alt_3.upper()
-
-            if ref_3 in VariantNormalizer.AA_3TO1 and alt_3 in VariantNormalizer.AA_3TO1:
-                ref = VariantNormalizer.AA_3TO1[ref_3]
-                alt = VariantNormalizer.AA_3TO1[alt_3]
-                result['short_form'] = f"{ref}{pos}{alt}"
-                result['hgvs_protein'] = f"p.{ref}{pos}{alt}"
-                result['long_form'] = f"{ref_3}{pos}{alt_3}"
-                result['position'] = int(pos)
-                result['ref_aa'] = ref
-                result['alt_aa'] = alt
-                result['is_missense'] = alt != '*'
-                return result
+        # Three-letter missense format (Val600Glu)
+        ref_3, pos, alt_3 = match.group(4, 5, 6)
+        ref_3 = ref_3.upper()
+        alt_3 = alt_3.upper()
+
+        if ref_3 in VariantNormalizer.AA_3TO1 and alt_3 in VariantNormalizer.AA_3TO1:
+            ref = VariantNormalizer.AA_3TO1[ref_3]
+            alt = VariantNormalizer.AA_3TO1[alt_3]
+            result['short_form'] = f"{ref}{pos}{alt}"
+            result['hgvs_protein'] = f"p.{ref}{pos}{alt}"
+            result['long_form'] = f"{ref_3}{pos}{alt_3}"
+            result['position'] = int(pos)
+            result['ref_aa'] = ref
+            result['alt_aa'] = alt
+            result['is_missense'] = alt != '*'
 
         return result
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def classify_variant_type(variant: str) -> str:
         """Classify the type of variant.
 
@@ -123,34 +154,19 @@ class VariantNormalizer:
                          'insertion', 'duplication', 'fusion', 'amplification',
                          'splice', 'truncating', or 'unknown'
         """
-        variant_lower = variant.lower()
-
-        # Check for structural variants
-        if any(kw in variant_lower for kw in ['fusion', 'fus', 'rearrangement']):
-            return 'fusion'
-        if any(kw in variant_lower for kw in ['amp', 'amplification', 'overexpression']):
-            return 'amplification'
-        if 'truncat' in variant_lower:
-            return 'truncating'
-        if any(kw in variant_lower for kw in ['splice', 'exon', 'skip']):
-            return 'splice'
-
-        # Check for indels
-        if VariantNormalizer.FRAMESHIFT_PATTERN.search(variant):
-            return 'frameshift'
-        if VariantNormalizer.DELETION_PATTERN.search(variant):
-            return 'deletion'
-        if VariantNormalizer.INSERTION_PATTERN.search(variant):
-            return 'insertion'
-        if VariantNormalizer.DUPLICATION_PATTERN.search(variant):
-            return 'duplication'
+        # Check for structural variants and indels in one pass
+        found = {m.lastgroup for m in VariantNormalizer.KEYWORD_TYPE_PATTERN.finditer(variant)}
+        if found:
+            for variant_type in VariantNormalizer.KEYWORD_TYPE_PRIORITY:
+                if variant_type in found:
+                    return variant_type
 
         # Check for nonsense
         if VariantNormalizer.NONSENSE_PATTERN.search(variant):
             return 'nonsense'
 
         # Check for missense
-        normalized = VariantNormalizer.normalize_protein_change(variant)
+        normalized = VariantNormalizer._normalize_protein_change(variant)
         if normalized['is_missense']:
             return 'missense'
 
@@ -6,22 +6,26 @@ ARCHITECTURE:
 Runs assessments against expert datasets and computes accuracy/precision/recall/F1.
 
 Key Design:
-- Semaphore for concurrency control
+- Fixed worker pool for concurrency control
 - Flexible input: list or dict-wrapped JSON
 - Per-tier confusion matrix + overall statistics
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
+from pydantic import TypeAdapter
+
 from tumorboard.engine import AssessmentEngine
 from tumorboard.models.validation import GoldStandardEntry, ValidationMetrics, ValidationResult
 from tumorboard.models.variant import VariantInput
 
 logger = logging.getLogger(__name__)
 
+_RESULTS_ADAPTER = TypeAdapter(list[ValidationResult])
+
 
 class Validator:
     """Validator for benchmarking assessments against gold standard dataset."""
@@ -55,8 +59,7 @@ class Validator:
         logger.info(f"Loading gold standard from {path}")
 
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            data = orjson.loads(path.read_bytes())
 
             # Handle both list and dict with "entries" key
             if isinstance(data, dict) and "entries" in data:
@@ -81,7 +84,7 @@ class Validator:
 
             return entries
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in gold standard file: {str(e)}")
         except Exception as e:
             raise ValueError(f"Failed to load gold standard: {str(e)}")
@@ -126,6 +129,10 @@ class Validator:
     ) -> ValidationMetrics:
         """Validate all entries in gold standard dataset.
 
+        A fixed pool of ``max_concurrent`` workers pulls entries and hands back
+        results as they finish; results are folded into the metrics in input
+        order, so only out-of-order stragglers are held at any time.
+
         Args:
             gold_standard: List of gold standard entries
             max_concurrent: Maximum concurrent validations
@@ -137,35 +144,57 @@ class Validator:
 
         logger.info(f"Starting validation of {len(gold_standard)} entries")
 
-        # Create semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def validate_with_semaphore(entry: GoldStandardEntry) -> ValidationResult:
-            async with semaphore:
-                return await self.validate_single(entry)
-
-        # Execute all validations with concurrency limit
-        tasks = [validate_with_semaphore(entry) for entry in gold_standard]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        pending_entries = iter(enumerate(gold_standard))
+        completed: asyncio.Queue[tuple[int, ValidationResult | BaseException]] = asyncio.Queue()
 
-        # Filter out exceptions and collect valid results
-        validation_results = []
+        async def worker() -> None:
+            for idx, entry in pending_entries:
+                outcome: ValidationResult | BaseException
+                try:
+                    outcome = await self.validate_single(entry)
+                except BaseException as e:
+                    outcome = e
+                    # Anything beyond an ordinary error also ends the worker
+                    if not isinstance(e, Exception):
+                        raise
+                finally:
+                    # Report every entry, even from a dying worker, so the collector never waits on it
+                    completed.put_nowait((idx, outcome))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrent, len(gold_standard)))]
+
+        # Fold results into the metrics as they arrive, re-ordered by entry index
+        metrics = ValidationMetrics()
         failed_entries = []
-        for idx, result in enumerate(results):
-            if isinstance(result, Exception):
-                entry = gold_standard[idx]
-                failed_entries.append((idx, entry.gene, entry.variant, str(result).split('\n')[0]))
-                logger.error(f"Validation failed for entry {idx}: {str(result)}")
-            else:
-                validation_results.append(result)
+        out_of_order: dict[int, ValidationResult | Exception] = {}
+        next_idx = 0
+        try:
+            for _ in range(len(gold_standard)):
+                idx, outcome = await completed.get()
+                # A worker died from something other than an ordinary error; stop the run
+                if not isinstance(outcome, (ValidationResult, Exception)):
+                    raise outcome
+                out_of_order[idx] = outcome
+                while next_idx in out_of_order:
+                    result = out_of_order.pop(next_idx)
+                    if isinstance(result, Exception):
+                        entry = gold_standard[next_idx]
+                        failed_entries.append((next_idx, entry.gene, entry.variant, str(result).split('\n')[0]))
+                        logger.error(f"Validation failed for entry {next_idx}: {str(result)}")
+                    else:
+                        metrics.add_result(result)
+                    next_idx += 1
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         # Store failed entries count for reporting
         self._last_failed_count = len(failed_entries)
         self._last_failed_entries = failed_entries
 
         # Calculate metrics
-        metrics = ValidationMetrics()
-        metrics.calculate(validation_results)
+        metrics.finalize()
 
         logger.info(
             f"Validation complete: {metrics.correct_predictions}/{metrics.total_cases} "
@@ -206,12 +235,12 @@ class Validator:
         """
         output_path = Path(output_path)
 
+        # Serialize the whole result list in one adapter call and write it in one go
         output_data = {
-            "metrics": metrics.model_dump(),
-            "results": [result.model_dump() for result in results],
+            "metrics": metrics.model_dump(mode="json"),
+            "results": _RESULTS_ADAPTER.dump_python(results, mode="json"),
         }
 
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2)
+        output_path.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved validation results to {output_path}")
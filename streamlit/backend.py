@@ -38,7 +38,7 @@ async def assess_variant(
     """
     try:
         # Create assessment engine
-        engine = AssessmentEngine(llm_model=model, llm_temperature=temperature)
+        engine = AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_llm_cache=True)
 
         # Create variant input
         variant_input = VariantInput(
@@ -125,7 +125,7 @@ async def batch_assess_variants(
     """
     try:
         # Create assessment engine
-        engine = AssessmentEngine(llm_model=model, llm_temperature=temperature)
+        engine = AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_llm_cache=True)
 
         # Create variant inputs
         variant_inputs = [
@@ -214,7 +214,7 @@ async def validate_gold_standard(
     """
     try:
         # Create assessment engine
-        engine = AssessmentEngine(llm_model=model, llm_temperature=temperature)
+        engine = AssessmentEngine(llm_model=model, llm_temperature=temperature, enable_llm_cache=False)
 
         # Create validator
         validator = Validator(engine=engine)
@@ -3,6 +3,27 @@
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep the on-disk LLM cache out of the user's home directory during tests."""
+    from tumorboard.llm.service import LLMService
+
+    monkeypatch.setattr(LLMService, "CACHE_DIR", tmp_path / "llm_cache")
+
+
+@pytest.fixture(autouse=True)
+def isolated_decision_log(tmp_path, monkeypatch):
+    """Keep LLM decision logs out of the working directory during tests."""
+    from tumorboard.utils import logging_config
+
+    logging_config.reset_logger()
+    monkeypatch.setattr(
+        logging_config, "_global_logger", logging_config.LLMDecisionLogger(log_dir=tmp_path / "logs")
+    )
+    yield
+    logging_config.reset_logger()
+
+
 @pytest.fixture
 def sample_variant_input():
     """Sample variant input for testing."""
@@ -95,6 +95,18 @@ class TestMyVariantClient:
         assert parsed[0].evidence_type == "Predictive"
         assert len(parsed[0].drugs) == 2
 
+    def test_parse_civic_evidence_validates_api_values(self):
+        """Raw API values should be coerced or rejected, not stored as-is."""
+        from pydantic import ValidationError
+
+        client = MyVariantClient()
+
+        parsed = client._parse_civic_evidence({"evidence_type": "Predictive", "rating": "4"})
+        assert parsed[0].rating == 4
+
+        with pytest.raises(ValidationError):
+            client._parse_civic_evidence({"evidence_type": "Predictive", "rating": "high"})
+
     @pytest.mark.asyncio
     async def test_parse_clinvar_evidence(self):
         """Test parsing ClinVar evidence."""
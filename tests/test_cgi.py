@@ -1,7 +1,9 @@
 """Tests for CGI (Cancer Genome Interpreter) biomarkers client."""
 
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 from pathlib import Path
 
 from tumorboard.api.cgi import CGIClient, CGIBiomarker, CGIError
@@ -364,6 +366,36 @@ class TestCGIClient:
         assert biomarkers[0].drug == "Binimetinib"
 
 
+    @pytest.mark.asyncio
+    async def test_fetch_biomarkers_async_loads_once(self):
+        """Concurrent async fetches should share a single biomarker load."""
+        client = CGIClient()
+        rows = [
+            {
+                "Gene": "BRAF",
+                "Alteration": "BRAF:V600E",
+                "Drug": "Dabrafenib",
+                "Drug status": "Approved",
+                "Association": "Responsive",
+                "Evidence level": "FDA guidelines",
+                "Source": "FDA",
+                "Primary Tumor type": "MEL",
+                "Primary Tumor type full name": "Melanoma",
+            },
+        ]
+
+        with patch.object(client, "_load_biomarkers_async", new=AsyncMock(return_value=rows)) as mock_load:
+            results = await asyncio.gather(
+                client.fetch_biomarkers_async("BRAF", "V600E", "Melanoma"),
+                client.fetch_biomarkers_async("BRAF", "V600E"),
+                client.fetch_biomarkers_async("EGFR", "L858R"),
+            )
+
+        mock_load.assert_awaited_once()
+        assert [len(r) for r in results] == [1, 1, 0]
+        assert results[0][0].drug == "Dabrafenib"
+
+
 class TestCGIClientIntegration:
     """Integration tests for CGI client (requires network)."""
 
@@ -0,0 +1,307 @@
+"""Tests for the assessment engine."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tumorboard.engine import AssessmentEngine
+from tumorboard.models.assessment import ActionabilityAssessment, ActionabilityTier
+from tumorboard.models.evidence import Evidence
+from tumorboard.models.variant import VariantInput
+
+
+@pytest.fixture
+def engine():
+    """Engine with logging disabled so tests don't write log files."""
+    return AssessmentEngine(
+        enable_logging=False, enable_vicc=False, enable_civic_assertions=False, skip_empty=False
+    )
+
+
+class TestSharedHttpClient:
+    """Tests for the pooled HTTP client shared across API clients."""
+
+    @pytest.mark.asyncio
+    async def test_api_clients_share_one_http_client(self, engine):
+        """All API clients should use the engine's client and leave closing to the engine."""
+        async with engine:
+            assert engine.myvariant_client._get_client() is engine._http_client
+            assert engine.fda_client._get_client() is engine._http_client
+            assert engine.oncotree_client._get_client() is engine._http_client
+            await engine.fda_client.close()
+            assert not engine._http_client.is_closed
+
+        assert engine._http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_api_clients_created_on_first_use(self, engine):
+        """Clients a run never touches should not be constructed."""
+        async with engine:
+            assert "oncotree_client" not in engine.__dict__
+            assert engine.vicc_client is None
+            client = engine.myvariant_client
+            assert engine.myvariant_client is client
+            assert "oncotree_client" not in engine.__dict__
+
+    @pytest.mark.asyncio
+    async def test_http_client_opened_on_first_use(self, engine):
+        """An engine that never makes a request should hold no open HTTP client."""
+        async with engine:
+            pass
+        assert "_http_client" not in engine.__dict__
+
+
+class TestTumorTypeResolution:
+    """Tests for memoized OncoTree tumor type resolution."""
+
+    @pytest.mark.asyncio
+    async def test_resolution_is_cached(self, engine):
+        """Repeated tumor types should only hit OncoTree once."""
+        engine.oncotree_client.resolve_tumor_type = AsyncMock(
+            return_value="Non-Small Cell Lung Cancer"
+        )
+
+        first = await engine._resolve_tumor_type("NSCLC")
+        second = await engine._resolve_tumor_type(" nsclc ")
+
+        assert first == second == "Non-Small Cell Lung Cancer"
+        engine.oncotree_client.resolve_tumor_type.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resolution_coalesces(self, engine):
+        """Concurrent lookups for the same key should share one API call."""
+
+        async def slow_resolve(tumor_type):
+            await asyncio.sleep(0.01)
+            return "Melanoma"
+
+        engine.oncotree_client.resolve_tumor_type = AsyncMock(side_effect=slow_resolve)
+
+        results = await asyncio.gather(*[engine._resolve_tumor_type("MEL") for _ in range(5)])
+
+        assert results == ["Melanoma"] * 5
+        assert engine.oncotree_client.resolve_tumor_type.await_count == 1
+        # The lock is released for good once the result is cached
+        assert engine._tumor_type_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_resolution_not_cached(self, engine):
+        """A failed lookup should be retried on the next call."""
+        engine.oncotree_client.resolve_tumor_type = AsyncMock(
+            side_effect=[RuntimeError("boom"), "Melanoma"]
+        )
+
+        with pytest.raises(RuntimeError):
+            await engine._resolve_tumor_type("MEL")
+
+        assert await engine._resolve_tumor_type("MEL") == "Melanoma"
+
+
+class TestBatchDeduplication:
+    """Tests for coalescing duplicate variants in batch_assess."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_variants_share_one_assessment(self, engine):
+        """Equivalent inputs should trigger a single assess_variant call."""
+        sentinel = object()
+        engine.assess_variant = AsyncMock(return_value=sentinel)
+
+        variants = [
+            VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma"),
+            VariantInput(gene="braf", variant="p.V600E", tumor_type="melanoma"),
+            VariantInput(gene="BRAF", variant="Val600Glu", tumor_type="Melanoma "),
+            VariantInput(gene="KRAS", variant="G12C", tumor_type="Melanoma"),
+        ]
+
+        results = await engine.batch_assess(variants)
+
+        assert len(results) == 4
+        assert engine.assess_variant.await_count == 2
+        assert engine._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_grouped_llm_batches(self):
+        """With llm_batch_size > 1 the LLM step should be packed into groups."""
+        engine = AssessmentEngine(
+            enable_logging=False, enable_vicc=False, enable_civic_assertions=False,
+            llm_batch_size=2, skip_empty=False,
+        )
+        engine._fetch_all_evidence = AsyncMock(return_value=(object(), "Melanoma"))
+
+        async def fake_batch(items):
+            return [
+                ActionabilityAssessment(
+                    gene=gene, variant=variant, tumor_type=tumor_type,
+                    tier=ActionabilityTier.TIER_I, confidence_score=0.9,
+                    summary="s", rationale="r",
+                )
+                for gene, variant, tumor_type, _ in items
+            ]
+
+        engine.llm_service.assess_variants_batch = AsyncMock(side_effect=fake_batch)
+
+        variants = [
+            VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma"),
+            VariantInput(gene="BRAF", variant="V600K", tumor_type="Melanoma"),
+            VariantInput(gene="NRAS", variant="Q61R", tumor_type="Melanoma"),
+            VariantInput(gene="BRAF", variant="p.V600E", tumor_type="Melanoma"),
+        ]
+
+        results = await engine.batch_assess(variants)
+
+        assert [r.variant for r in results] == ["V600E", "V600K", "Q61R", "V600E"]
+        assert engine._fetch_all_evidence.await_count == 3
+        assert engine.llm_service.assess_variants_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_grouped_batch_failure_isolated(self):
+        """A failed fetch or LLM group should only drop its own variants."""
+        engine = AssessmentEngine(
+            enable_logging=False, enable_vicc=False, enable_civic_assertions=False,
+            llm_batch_size=2, skip_empty=False,
+        )
+
+        async def fake_fetch(variant_input):
+            if variant_input.variant == "G12C":
+                raise RuntimeError("MyVariant down")
+            return object(), "Melanoma"
+
+        async def fake_batch(items):
+            if any(variant == "Q61R" for _, variant, _, _ in items):
+                raise RuntimeError("rate limited")
+            return [
+                ActionabilityAssessment(
+                    gene=gene, variant=variant, tumor_type=tumor_type,
+                    tier=ActionabilityTier.TIER_I, confidence_score=0.9,
+                    summary="s", rationale="r",
+                )
+                for gene, variant, tumor_type, _ in items
+            ]
+
+        engine._fetch_all_evidence = AsyncMock(side_effect=fake_fetch)
+        engine.llm_service.assess_variants_batch = AsyncMock(side_effect=fake_batch)
+
+        variants = [
+            VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma"),
+            VariantInput(gene="KRAS", variant="G12C", tumor_type="Melanoma"),
+            VariantInput(gene="BRAF", variant="V600K", tumor_type="Melanoma"),
+            VariantInput(gene="NRAS", variant="Q61R", tumor_type="Melanoma"),
+            VariantInput(gene="BRAF", variant="K601E", tumor_type="Melanoma"),
+        ]
+
+        results = await engine.batch_assess(variants)
+
+        assert [r.variant for r in results] == ["V600E", "V600K"]
+
+    def test_llm_batch_size_bounded_by_output_limit(self):
+        """A batch size whose token budget exceeds the model's output limit should be capped."""
+        engine = AssessmentEngine(llm_model="gpt-4o-mini", enable_logging=False, llm_batch_size=50)
+
+        assert engine.llm_service.max_output_tokens == 16384
+        assert engine.llm_batch_size == 8
+
+
+class TestPipelinedAssessment:
+    """Tests for overlapping evidence prefetch with the LLM step."""
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_variants_during_llm(self, engine, caplog):
+        """Evidence for upcoming variants should be requested before the current LLM call ends."""
+        events = []
+
+        async def fake_fetch(variant_input):
+            events.append(f"fetch {variant_input.variant}")
+            return object(), variant_input.tumor_type
+
+        async def fake_llm(gene, variant, tumor_type, evidence):
+            events.append(f"llm {variant}")
+            await asyncio.sleep(0)
+            if variant == "G12C":
+                raise RuntimeError("llm failure")
+            return variant
+
+        engine._fetch_all_evidence = fake_fetch
+        engine.llm_service.assess_variant = fake_llm
+
+        variants = [
+            VariantInput(gene="BRAF", variant="V600E", tumor_type="Melanoma"),
+            VariantInput(gene="KRAS", variant="G12C", tumor_type="NSCLC"),
+            VariantInput(gene="EGFR", variant="L858R", tumor_type="NSCLC"),
+            VariantInput(gene="NRAS", variant="Q61R", tumor_type="Melanoma"),
+        ]
+
+        results = [a async for a in engine.assess_variants_pipelined(variants, prefetch=2)]
+
+        assert results == ["V600E", "L858R", "Q61R"]
+        assert "Assessment failed for KRAS G12C: llm failure" in caplog.text
+        # With prefetch=2 the fourth variant is already fetching before the first LLM call
+        assert events.index("fetch Q61R") < events.index("llm V600E")
+
+
+class TestEmptyEvidenceShortCircuit:
+    """Tests for skipping the LLM when no source returned evidence."""
+
+    @pytest.mark.asyncio
+    async def test_empty_evidence_skips_llm(self):
+        """A variant with no evidence or annotations gets a stock Tier III assessment."""
+        engine = AssessmentEngine(enable_logging=False, enable_vicc=False, enable_civic_assertions=False)
+        evidence = Evidence(variant_id="ABC1:A1T", gene="ABC1", variant="A1T", dbsnp_id="rs1")
+        engine._fetch_all_evidence = AsyncMock(return_value=(evidence, "Melanoma"))
+        engine.llm_service.assess_variant = AsyncMock()
+
+        assessment = await engine.assess_variant(
+            VariantInput(gene="ABC1", variant="A1T", tumor_type="Melanoma")
+        )
+
+        assert assessment.tier == ActionabilityTier.TIER_III
+        assert assessment.tumor_type == "Melanoma"
+        assert assessment.dbsnp_id == "rs1"
+        engine.llm_service.assess_variant.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_sources_still_use_llm(self):
+        """Empty evidence caused by failed sources must not be reported as "no evidence"."""
+        engine = AssessmentEngine(enable_logging=False, enable_vicc=False, enable_civic_assertions=False)
+        evidence = Evidence(variant_id="ABC1:A1T", gene="ABC1", variant="A1T", failed_sources=["FDA API"])
+        engine._fetch_all_evidence = AsyncMock(return_value=(evidence, "Melanoma"))
+        sentinel = object()
+        engine.llm_service.assess_variant = AsyncMock(return_value=sentinel)
+
+        result = await engine.assess_variant(
+            VariantInput(gene="ABC1", variant="A1T", tumor_type="Melanoma")
+        )
+
+        assert result is sentinel
+
+    @pytest.mark.asyncio
+    async def test_all_sources_failing_still_uses_llm(self):
+        """When every queried source fails the variant is still assessed, not given a canned tier."""
+        engine = AssessmentEngine(enable_logging=False, enable_vicc=False, enable_civic_assertions=False)
+        outage = RuntimeError("network down")
+        engine.myvariant_client.fetch_evidence = AsyncMock(side_effect=outage)
+        engine.fda_client.fetch_drug_approvals = AsyncMock(side_effect=outage)
+        engine.cgi_client.fetch_biomarkers_async = AsyncMock(side_effect=outage)
+        sentinel = object()
+        engine.llm_service.assess_variant = AsyncMock(return_value=sentinel)
+
+        result = await engine.assess_variant(VariantInput(gene="ABC1", variant="A1T"))
+
+        assert result is sentinel
+        evidence = engine.llm_service.assess_variant.await_args.kwargs["evidence"]
+        assert evidence.failed_sources == ["MyVariant API", "FDA API", "CGI biomarkers"]
+
+    @pytest.mark.asyncio
+    async def test_annotation_signal_still_uses_llm(self):
+        """Functional annotations alone are enough to send the variant to the LLM."""
+        engine = AssessmentEngine(enable_logging=False, enable_vicc=False, enable_civic_assertions=False)
+        evidence = Evidence(variant_id="ABC1:A1T", gene="ABC1", variant="A1T", cadd_score=25.0)
+        engine._fetch_all_evidence = AsyncMock(return_value=(evidence, "Melanoma"))
+        sentinel = object()
+        engine.llm_service.assess_variant = AsyncMock(return_value=sentinel)
+
+        result = await engine.assess_variant(
+            VariantInput(gene="ABC1", variant="A1T", tumor_type="Melanoma")
+        )
+
+        assert result is sentinel
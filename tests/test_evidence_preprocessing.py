@@ -11,6 +11,8 @@ evidence for the LLM, particularly around tier-determining features like:
 - Investigational-only detection (NEW)
 """
 
+from unittest.mock import patch
+
 import pytest
 from tumorboard.models.evidence import (
     Evidence,
@@ -68,6 +70,37 @@ class TestFDAApprovalParsing:
         assert approval.parse_indication_for_tumor("Non-Small Cell Lung Cancer")['tumor_match'] is True
         assert approval.parse_indication_for_tumor("lung")['tumor_match'] is True
 
+    def test_memoized_parse_returns_independent_copies(self):
+        """Repeat parses should not share a mutable result."""
+        approval = FDAApproval(
+            drug_name="vemurafenib",
+            indication="indicated for melanoma with BRAF V600E mutation after progression",
+        )
+
+        first = approval.parse_indication_for_tumor("Melanoma")
+        first['line_of_therapy'] = 'mutated'
+
+        assert approval.parse_indication_for_tumor("Melanoma")['line_of_therapy'] == 'later-line'
+
+    def test_indication_lower_cached(self):
+        """Lowercased indication should be computed once and tolerate missing text."""
+        approval = FDAApproval(drug_name="vemurafenib", indication="BRAF V600E Melanoma")
+
+        assert approval.indication_lower == "braf v600e melanoma"
+        assert approval.indication_lower is approval.indication_lower
+        assert FDAApproval(drug_name="x").indication_lower == ""
+
+    def test_indication_lower_follows_indication(self):
+        """Lowercased indication should track reassignment and copies with a new indication."""
+        approval = FDAApproval(drug_name="vemurafenib", indication="BRAF V600E Melanoma")
+        assert approval.indication_lower == "braf v600e melanoma"
+
+        copied = approval.model_copy(update={"indication": "EGFR L858R NSCLC"})
+        approval.indication = "KRAS G12C NSCLC"
+
+        assert copied.indication_lower == "egfr l858r nsclc"
+        assert approval.indication_lower == "kras g12c nsclc"
+
 
 class TestVariantMatchesApprovalClass:
     """Test the new variant-specific approval matching logic."""
@@ -192,6 +225,57 @@ class TestVariantMatchesApprovalClass:
 
         assert result is False
 
+    def test_kit_exon_mention_matches(self):
+        """KIT variants should match approvals naming their exon."""
+        evidence = Evidence(variant_id="KIT:D816V", gene="KIT", variant="D816V")
+
+        result = evidence._variant_matches_approval_class(
+            gene="KIT",
+            variant="D816V",
+            indication_text="indicated for systemic mastocytosis with kit exon 17 mutations",
+            approval=FDAApproval(drug_name="avapritinib"),
+        )
+
+        assert result is True
+
+    def test_egfr_common_class_matches_uncommon_wording(self):
+        """EGFR class keywords keep substring semantics ("uncommon" contains "common")."""
+        evidence = Evidence(variant_id="EGFR:L858R", gene="EGFR", variant="EXON19DEL")
+
+        result = evidence._variant_matches_approval_class(
+            gene="EGFR",
+            variant="EXON19DEL",
+            indication_text="nsclc whose tumors have uncommon egfr alterations",
+            approval=FDAApproval(drug_name="afatinib"),
+        )
+
+        assert result is True
+
+    def test_wildtype_required_drugs_collected(self):
+        """Approvals restricted to wild-type tumors should be reported for mutants."""
+        evidence = Evidence(
+            variant_id="KRAS:G12D",
+            gene="KRAS",
+            variant="G12D",
+            fda_approvals=[
+                FDAApproval(
+                    drug_name="cetuximab",
+                    brand_name="ERBITUX",
+                    indication="indicated for K-Ras wild-type, EGFR-expressing metastatic colorectal cancer (RAS wild-type)",
+                ),
+                FDAApproval(
+                    drug_name="sotorasib",
+                    brand_name="LUMAKRAS",
+                    indication="indicated for KRAS G12C-mutated metastatic colorectal cancer",
+                ),
+            ],
+        )
+
+        requires_wt, drugs = evidence._check_fda_requires_wildtype("Colorectal Cancer")
+
+        assert requires_wt is True
+        assert drugs == ["ERBITUX"]
+
 
 class TestInvestigationalOnly:
     """Test detection of investigational-only gene-tumor combinations."""
@@ -260,6 +344,99 @@ class TestHasFDAForVariantInTumor:
 
         assert evidence.has_fda_for_variant_in_tumor("Melanoma") is True
 
+    def test_fda_parses_shared_across_checks(self):
+        """Tier checks and the summary header should parse each indication once per tumor type."""
+        evidence = Evidence(
+            variant_id="BRAF:V600E",
+            gene="BRAF",
+            variant="V600E",
+            fda_approvals=[
+                FDAApproval(
+                    drug_name="vemurafenib",
+                    brand_name="ZELBORAF",
+                    indication="indicated for melanoma with BRAF V600E mutation",
+                )
+            ],
+        )
+
+        with patch.object(FDAApproval, "parse_indication_for_tumor", autospec=True,
+                          side_effect=FDAApproval.parse_indication_for_tumor) as parse:
+            evidence.format_full_summary("Melanoma")
+            assert evidence.has_fda_for_variant_in_tumor("Melanoma") is True
+
+        assert parse.call_count == 1
+
+    def test_fda_tier_checks_parse_only_matching_labels(self):
+        """Labels that fail the cheap text filter should never be parsed by the tier checks."""
+        evidence = Evidence(
+            variant_id="BRAF:V600E",
+            gene="BRAF",
+            variant="V600E",
+            fda_approvals=[
+                FDAApproval(drug_name="osimertinib", indication="indicated for NSCLC with EGFR mutations"),
+                FDAApproval(
+                    drug_name="vemurafenib",
+                    brand_name="ZELBORAF",
+                    indication="indicated for melanoma with BRAF V600E mutation",
+                ),
+            ],
+        )
+
+        with patch.object(FDAApproval, "parse_indication_for_tumor", autospec=True,
+                          side_effect=FDAApproval.parse_indication_for_tumor) as parse:
+            assert evidence.has_fda_for_variant_in_tumor("Melanoma") is True
+            assert evidence._check_fda_requires_wildtype("Melanoma") == (False, [])
+
+        assert [call.args[0].drug_name for call in parse.call_args_list] == ["vemurafenib"]
+
+    def test_memoized_views_follow_evidence_changes(self):
+        """Adding or reassigning evidence after a summary was built must not serve stale results."""
+        evidence = Evidence(variant_id="BRAF:V600E", gene="BRAF", variant="V600E")
+        assert evidence.has_fda_for_variant_in_tumor("Melanoma") is False
+        assert "FDA Approved" not in evidence.format_full_summary("Melanoma")
+
+        approval = FDAApproval(
+            drug_name="vemurafenib",
+            brand_name="ZELBORAF",
+            indication="indicated for melanoma with BRAF V600E mutation",
+        )
+        evidence.fda_approvals.append(approval)
+        assert evidence.has_fda_for_variant_in_tumor("Melanoma") is True
+        assert "ZELBORAF" in evidence.format_full_summary("Melanoma")
+
+        evidence.fda_approvals = []
+        assert evidence.has_fda_for_variant_in_tumor("Melanoma") is False
+        assert "ZELBORAF" not in evidence.format_full_summary("Melanoma")
+
+    def test_model_copy_with_update_rebuilds_summary(self):
+        """A copy with updated evidence must not reuse or share the original's memoized summary or stats."""
+        def predictive(drug, significance):
+            return CIViCEvidence(
+                evidence_type="PREDICTIVE",
+                evidence_level="A",
+                clinical_significance=significance,
+                disease="Melanoma",
+                drugs=[drug],
+            )
+
+        evidence = Evidence(
+            variant_id="BRAF:V600E",
+            gene="BRAF",
+            variant="V600E",
+            civic=[predictive("Vemurafenib", "SENSITIVITYRESPONSE")],
+        )
+        assert "Vemurafenib" in evidence.format_full_summary("Melanoma")
+        assert evidence.compute_evidence_stats("Melanoma")["dominant_signal"] == "sensitivity_only"
+
+        copied = evidence.model_copy(update={"civic": [predictive("Dabrafenib", "RESISTANCE")]})
+        assert copied.compute_evidence_stats("Melanoma")["dominant_signal"] == "resistance_only"
+        assert copied._stats_cache is not evidence._stats_cache
+        summary = copied.format_full_summary("Melanoma")
+        assert "Dabrafenib" in summary
+        assert "Vemurafenib" not in summary
+        assert copied._summary_cache is not evidence._summary_cache
+        assert "Dabrafenib" not in evidence.format_full_summary("Melanoma")
+
     def test_kras_g12d_pancreatic_no_fda(self):
         """KRAS G12D in pancreatic is investigational, no FDA."""
         evidence = Evidence(
@@ -360,6 +537,40 @@ class TestResistanceMarkerWithoutTargetedTherapy:
         assert is_resistance is False
 
 
+class TestPrognosticOrDiagnosticOnly:
+    """Test detection of variants without any therapeutic evidence."""
+
+    def test_prognostic_civic_only(self):
+        """Only prognostic CIViC evidence means no therapeutic impact."""
+        evidence = Evidence(
+            variant_id="TP53:R175H",
+            gene="TP53",
+            variant="R175H",
+            civic=[CIViCEvidence(evidence_type="PROGNOSTIC", disease="Breast Cancer")],
+            vicc=[VICCEvidence(drugs=["cisplatin"], disease="Ovarian Cancer")],
+        )
+
+        assert evidence.is_prognostic_or_diagnostic_only() is True
+
+    def test_predictive_vicc_or_fda_is_therapeutic(self):
+        """Drug-linked VICC signals or FDA approvals count as therapeutic evidence."""
+        evidence = Evidence(
+            variant_id="TP53:R175H",
+            gene="TP53",
+            variant="R175H",
+            vicc=[VICCEvidence(drugs=["cisplatin"], is_resistance=True, disease="Ovarian Cancer")],
+        )
+        assert evidence.is_prognostic_or_diagnostic_only() is False
+
+        evidence = Evidence(
+            variant_id="TP53:R175H",
+            gene="TP53",
+            variant="R175H",
+            fda_approvals=[FDAApproval(drug_name="eprenetapopt")],
+        )
+        assert evidence.is_prognostic_or_diagnostic_only() is False
+
+
 class TestGetTierHint:
     """Test the tier hint computation - core of preprocessing logic."""
 
@@ -414,6 +625,24 @@ class TestGetTierHint:
         assert "TIER II" in hint
         assert "RESISTANCE" in hint.upper() or "EXCLUDES" in hint.upper()
 
+    def test_fda_for_variant_checked_once(self):
+        """The FDA-for-variant lookup is shared with the resistance-marker check."""
+        evidence = Evidence(
+            variant_id="EGFR:C797S",
+            gene="EGFR",
+            variant="C797S",
+            vicc=[
+                VICCEvidence(drugs=["osimertinib"], is_resistance=True, disease="Lung Non-small Cell Carcinoma"),
+            ],
+        )
+
+        with patch.object(Evidence, "_find_fda_for_variant", autospec=True,
+                          side_effect=Evidence._find_fda_for_variant) as find:
+            hint = evidence.get_tier_hint("Non-Small Cell Lung Cancer")
+
+        assert "TIER II" in hint
+        assert find.call_count == 1
+
     def test_tier_iii_for_investigational_only(self):
         """Known investigational-only combinations = Tier III hint."""
         evidence = Evidence(
@@ -1,13 +1,30 @@
 """Tests for LLM service."""
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from tumorboard.llm.service import LLMService
+from tumorboard.llm.service import LLMService, _strip_md_fence
 from tumorboard.models.assessment import ActionabilityTier
 
 
+class TestStripMdFence:
+    """Tests for markdown code fence stripping."""
+
+    @pytest.mark.parametrize("raw", [
+        '{"tier": "Tier I"}',
+        '```json\n{"tier": "Tier I"}\n```',
+        '```JSON\n{"tier": "Tier I"}```',
+        '```\n{"tier": "Tier I"}\n```',
+        '```json {"tier": "Tier I"}```',
+        '```json\n{"tier": "Tier I"}',
+    ])
+    def test_strips_fence_variants(self, raw):
+        """Fenced and unfenced payloads should all yield the bare JSON."""
+        assert json.loads(_strip_md_fence(raw)) == {"tier": "Tier I"}
+
+
 class TestLLMService:
     """Tests for LLMService."""
 
@@ -102,3 +119,205 @@ class TestLLMService:
             call_kwargs = mock_call.call_args[1]
             assert call_kwargs["temperature"] == custom_temp
             assert call_kwargs["model"] == "gpt-4o-mini"
+
+    def test_build_assessment_coerces_loose_llm_output(self, sample_evidence):
+        """String-typed values are coerced and omitted fields fall back to defaults."""
+        data = {"tier": "Tier II", "confidence_score": "0.8", "clinical_trials_available": "true"}
+
+        assessment = LLMService.build_assessment(data, "BRAF", "V600E", "Melanoma", sample_evidence)
+
+        assert assessment.tier == ActionabilityTier.TIER_II
+        assert assessment.confidence_score == 0.8
+        assert assessment.clinical_trials_available is True
+        assert assessment.summary == "No summary provided."
+        assert assessment.gene == "BRAF"
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, False),
+        ("Yes, several", True),
+        ("No", False),
+        ("none found", False),
+        ("false", False),
+        (1, True),
+    ])
+    def test_build_assessment_lenient_trials_flag(self, sample_evidence, value, expected):
+        """Null and free-text trial answers should not fail the assessment."""
+        data = {"tier": "Tier II", "confidence_score": None, "summary": None, "clinical_trials_available": value}
+
+        assessment = LLMService.build_assessment(data, "BRAF", "V600E", "Melanoma", sample_evidence)
+
+        assert assessment.clinical_trials_available is expected
+        assert assessment.confidence_score == 0.5
+        assert assessment.summary == "No summary provided."
+
+    def test_build_assessment_percentage_confidence(self, sample_evidence):
+        """A percentage confidence is scaled; an unparseable one falls back to the default."""
+        build = LLMService.build_assessment
+        assert build({"confidence_score": "85%"}, "BRAF", "V600E", None, sample_evidence).confidence_score == 0.85
+        assert build({"confidence_score": "high"}, "BRAF", "V600E", None, sample_evidence).confidence_score == 0.5
+
+    @pytest.mark.asyncio
+    async def test_repeat_prompt_served_from_cache(self, sample_evidence, mock_llm_response):
+        """Identical prompts should reuse the cached assessment instead of calling the LLM."""
+        service = LLMService(enable_logging=False)
+
+        with patch("tumorboard.llm.service.acompletion", new_callable=AsyncMock) as mock_call:
+            mock_response = AsyncMock()
+            mock_response.choices = [AsyncMock()]
+            mock_response.choices[0].message.content = mock_llm_response
+            mock_call.return_value = mock_response
+
+            first = await service.assess_variant(
+                gene="BRAF", variant="V600E", tumor_type="Melanoma", evidence=sample_evidence,
+            )
+            second = await service.assess_variant(
+                gene="BRAF", variant="V600E", tumor_type="Melanoma", evidence=sample_evidence,
+            )
+
+            mock_call.assert_called_once()
+            assert second == first
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, sample_evidence, mock_llm_response):
+        """With caching disabled every request should reach the LLM."""
+        service = LLMService(enable_logging=False, enable_cache=False)
+
+        with patch("tumorboard.llm.service.acompletion", new_callable=AsyncMock) as mock_call:
+            mock_response = AsyncMock()
+            mock_response.choices = [AsyncMock()]
+            mock_response.choices[0].message.content = mock_llm_response
+            mock_call.return_value = mock_response
+
+            for _ in range(2):
+                await service.assess_variant(
+                    gene="BRAF", variant="V600E", tumor_type="Melanoma", evidence=sample_evidence,
+                )
+
+            assert mock_call.call_count == 2
+            assert not LLMService.CACHE_DIR.exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_completions_are_capped(self, sample_evidence, mock_llm_response):
+        """No more than max_concurrency completions should be in flight at once."""
+        service = LLMService(enable_logging=False, enable_cache=False, max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def slow_completion(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = AsyncMock()
+            response.choices = [AsyncMock()]
+            response.choices[0].message.content = mock_llm_response
+            return response
+
+        with patch("tumorboard.llm.service.acompletion", side_effect=slow_completion):
+            await asyncio.gather(*[
+                service.assess_variant(
+                    gene="BRAF", variant="V600E", tumor_type="Melanoma", evidence=sample_evidence,
+                )
+                for _ in range(5)
+            ])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_assess_variants_batch(self, sample_evidence):
+        """One completion should yield one assessment per item, in order."""
+        service = LLMService(enable_logging=False)
+
+        response_json = {
+            "assessments": [
+                {"index": 1, "gene": "BRAF", "variant": "V600E",
+                 "tier": "Tier I", "confidence_score": 0.9, "summary": "a", "rationale": "a"},
+                {"index": 2, "gene": "BRAF", "variant": "G469A",
+                 "tier": "Tier III", "confidence_score": 0.6, "summary": "b", "rationale": "b"},
+            ]
+        }
+
+        with patch("tumorboard.llm.service.acompletion", new_callable=AsyncMock) as mock_call:
+            mock_response = AsyncMock()
+            mock_response.choices = [AsyncMock()]
+            mock_response.choices[0].message.content = json.dumps(response_json)
+            mock_call.return_value = mock_response
+
+            results = await service.assess_variants_batch([
+                ("BRAF", "V600E", "Melanoma", sample_evidence),
+                ("BRAF", "G469A", "Melanoma", sample_evidence),
+                ("BRAF", "K601E", "Melanoma", sample_evidence),
+            ])
+
+            mock_call.assert_called_once()
+            assert results[0].tier == ActionabilityTier.TIER_I
+            assert results[1].tier == ActionabilityTier.TIER_III
+            assert results[1].variant == "G469A"
+            # Missing third entry is isolated to its own slot
+            assert isinstance(results[2], Exception)
+
+    def test_max_tokens_clamped_to_model_limit(self):
+        """Completion requests never ask for more output tokens than the model allows."""
+        service = LLMService(model="gpt-4o-mini", enable_logging=False)
+        unknown = LLMService(model="someprovider/unlisted-model", enable_logging=False)
+
+        assert service._completion_kwargs([], max_tokens=2000 * 20)["max_tokens"] == 16384
+        assert unknown._completion_kwargs([], max_tokens=2000 * 20)["max_tokens"] == LLMService.DEFAULT_MAX_OUTPUT_TOKENS
+        assert unknown.max_batch_size == 2
+
+    @pytest.mark.asyncio
+    async def test_assess_variants_batch_matches_by_label(self, sample_evidence):
+        """Reordered entries land on their own variant; mislabelled or missing ones fail their slot."""
+        service = LLMService(enable_logging=False)
+
+        response_json = {
+            "assessments": [
+                # Reordered: item 2 first
+                {"index": 2, "gene": "BRAF", "variant": "G469A",
+                 "tier": "Tier III", "confidence_score": 0.6, "summary": "b", "rationale": "b"},
+                {"index": 1, "gene": "braf", "variant": "v600e",
+                 "tier": "Tier I", "confidence_score": 0.9, "summary": "a", "rationale": "a"},
+                # Index 3 echoes the wrong variant
+                {"index": 3, "gene": "BRAF", "variant": "V600E",
+                 "tier": "Tier I", "confidence_score": 0.9, "summary": "c", "rationale": "c"},
+            ]
+        }
+
+        with patch("tumorboard.llm.service.acompletion", new_callable=AsyncMock) as mock_call:
+            mock_response = AsyncMock()
+            mock_response.choices = [AsyncMock()]
+            mock_response.choices[0].message.content = json.dumps(response_json)
+            mock_call.return_value = mock_response
+
+            results = await service.assess_variants_batch([
+                ("BRAF", "V600E", "Melanoma", sample_evidence),
+                ("BRAF", "G469A", "Melanoma", sample_evidence),
+                ("BRAF", "K601E", "Melanoma", sample_evidence),
+                ("BRAF", "D594G", "Melanoma", sample_evidence),
+            ])
+
+        assert results[0].tier == ActionabilityTier.TIER_I
+        assert results[0].variant == "V600E"
+        assert results[1].tier == ActionabilityTier.TIER_III
+        assert results[1].variant == "G469A"
+        assert "expected BRAF K601E" in str(results[2])
+        assert isinstance(results[3], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_claude_system_prompt_marked_cacheable(self, sample_evidence, mock_llm_response):
+        """Claude models should receive the system prompt as a cache_control block."""
+        service = LLMService(model="anthropic/claude-3-5-sonnet", enable_logging=False)
+
+        with patch("tumorboard.llm.service.acompletion", new_callable=AsyncMock) as mock_call:
+            mock_response = AsyncMock()
+            mock_response.choices = [AsyncMock()]
+            mock_response.choices[0].message.content = mock_llm_response
+            mock_call.return_value = mock_response
+
+            await service.assess_variant(
+                gene="BRAF", variant="V600E", tumor_type="Melanoma", evidence=sample_evidence,
+            )
+
+            system = mock_call.call_args[1]["messages"][0]
+            assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
@@ -0,0 +1,82 @@
+"""Tests for LLM decision logging."""
+
+import gc
+import json
+import time
+import weakref
+from datetime import datetime
+from unittest.mock import patch
+
+from tumorboard.utils.logging_config import LLMDecisionLogger
+
+
+def _records(logger):
+    return [json.loads(line) for line in logger.log_file.read_text().splitlines()]
+
+
+class TestLLMDecisionLogger:
+    """Tests for buffered JSONL decision logs."""
+
+    def test_records_buffered_until_flush(self, tmp_path, monkeypatch):
+        """Request records should be written together rather than one write per event."""
+        monkeypatch.setattr(LLMDecisionLogger, "FLUSH_INTERVAL", 60)
+        logger = LLMDecisionLogger(log_dir=tmp_path)
+
+        request_id = logger.log_llm_request("BRAF", "V600E", "Melanoma", "evidence", "gpt-4o-mini", 0.1)
+        assert _records(logger) == []
+
+        logger.flush()
+        records = _records(logger)
+        assert [r["event_type"] for r in records] == ["llm_request"]
+        assert records[0]["request_id"] == request_id
+        assert datetime.fromisoformat(records[0]["timestamp"])
+
+    def test_idle_buffer_flushed_on_interval(self, tmp_path, monkeypatch):
+        """Buffered records should reach disk after FLUSH_INTERVAL even if nothing else is logged."""
+        monkeypatch.setattr(LLMDecisionLogger, "FLUSH_INTERVAL", 0.05)
+        logger = LLMDecisionLogger(log_dir=tmp_path)
+
+        logger.log_llm_request("BRAF", "V600E", "Melanoma", "evidence", "gpt-4o-mini", 0.1)
+
+        deadline = time.monotonic() + 2
+        while not _records(logger) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [r["event_type"] for r in _records(logger)] == ["llm_request"]
+        logger.close()
+
+    def test_error_flushes_pending_records(self, tmp_path, monkeypatch):
+        """An error should reach disk as soon as it is written, along with anything buffered before it."""
+        monkeypatch.setattr(LLMDecisionLogger, "FLUSH_INTERVAL", 60)
+        logger = LLMDecisionLogger(log_dir=tmp_path)
+
+        request_id = logger.log_llm_request("BRAF", "V600E", "Melanoma", "evidence", "gpt-4o-mini", 0.1)
+        with patch.object(logger, "flush", side_effect=AssertionError("error path must not block")):
+            logger.log_llm_error(request_id, "BRAF", "V600E", RuntimeError("boom"))
+
+        # Wait for the writer thread only; the file is not flushed from this side
+        logger._queue.join()
+        records = _records(logger)
+        assert [r["event_type"] for r in records] == ["llm_request", "llm_error"]
+        assert records[1]["error"] == {"type": "RuntimeError", "message": "boom"}
+
+    def test_close_drains_queue(self, tmp_path):
+        """Closing should write everything still queued and stop the writer thread."""
+        logger = LLMDecisionLogger(log_dir=tmp_path)
+
+        for i in range(50):
+            logger.log_llm_request("BRAF", f"V{i}E", None, "evidence", "gpt-4o-mini", 0.1)
+        logger.close()
+
+        assert len(_records(logger)) == 50
+        logger.log_llm_request("BRAF", "V600E", None, "evidence", "gpt-4o-mini", 0.1)
+        assert len(_records(logger)) == 50
+
+    def test_close_releases_exit_hook(self, tmp_path):
+        """A closed logger should not be kept alive by its interpreter-exit hook."""
+        logger = LLMDecisionLogger(log_dir=tmp_path)
+        logger.close()
+
+        ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+        assert ref() is None
@@ -86,6 +86,24 @@ class TestEvidence:
         assert civic.evidence_type == "Predictive"
         assert "Vemurafenib" in civic.drugs
 
+    def test_civic_evidence_is_frozen_dataclass(self):
+        """Test CIViC evidence is an immutable slotted dataclass."""
+        civic = CIViCEvidence(evidence_type="Predictive", drugs=["Vemurafenib"], rating=4)
+        assert not hasattr(civic, "__dict__")
+        assert civic.to_dict()["drugs"] == ["Vemurafenib"]
+        with pytest.raises(AttributeError):
+            civic.rating = 5
+
+    def test_evidence_validates_nested_dicts(self):
+        """Test Evidence still builds nested dataclass evidence from dicts."""
+        evidence = Evidence(
+            variant_id="BRAF:V600E",
+            gene="BRAF",
+            variant="V600E",
+            civic=[{"evidence_type": "Predictive", "drugs": ["Vemurafenib"]}],
+        )
+        assert evidence.civic == [CIViCEvidence(evidence_type="Predictive", drugs=["Vemurafenib"])]
+
     def test_evidence_has_evidence(self):
         """Test has_evidence method."""
         evidence = Evidence(
@@ -120,6 +138,24 @@ class TestEvidence:
         assert evidence.hgvs_protein == "NP_004324.2:p.Val600Glu"
         assert evidence.hgvs_transcript == "NM_004333.4:c.1799T>A"
 
+    def test_full_summary_memoized_per_tumor_type(self):
+        """Test format_full_summary renders once per tumor type."""
+        evidence = Evidence(
+            variant_id="BRAF:V600E",
+            gene="BRAF",
+            variant="V600E",
+            civic=[CIViCEvidence(evidence_type="Predictive", disease="Melanoma", drugs=["Vemurafenib"])],
+        )
+
+        summary = evidence.format_full_summary("Melanoma")
+        assert summary == (
+            evidence.format_evidence_summary_header(tumor_type="Melanoma")
+            + evidence.format_drug_aggregation_summary(tumor_type="Melanoma")
+            + evidence.summary_compact(tumor_type="Melanoma")
+        )
+        assert evidence.format_full_summary("Melanoma") is summary
+        assert evidence.format_full_summary(None) is not summary
+
 
 class TestActionabilityAssessment:
     """Tests for ActionabilityAssessment model."""
@@ -204,6 +240,97 @@ class TestActionabilityAssessment:
         assert "Not specified" in report
         assert "Tier III" in report
 
+    def test_assessment_is_immutable(self):
+        """Test assessments cannot be mutated after construction."""
+        assessment = ActionabilityAssessment(
+            gene="KRAS",
+            variant="G12C",
+            tumor_type=None,
+            tier=ActionabilityTier.TIER_III,
+            confidence_score=0.6,
+            summary="Test summary",
+            rationale="Test rationale",
+        )
+        with pytest.raises(ValidationError):
+            assessment.tier = ActionabilityTier.TIER_I
+
+    def test_report_rendered_once(self):
+        """Test repeat to_report calls reuse the rendered text."""
+        assessment = ActionabilityAssessment(
+            gene="KRAS",
+            variant="G12C",
+            tumor_type=None,
+            tier=ActionabilityTier.TIER_III,
+            confidence_score=0.6,
+            summary="Test summary",
+            rationale="Test rationale",
+        )
+        twin = assessment.model_copy()
+
+        report = assessment.to_report()
+
+        assert assessment.to_report() is report
+        assert assessment.report is report
+        assert assessment == twin
+        assert "report" not in assessment.model_dump()
+
+    def test_report_follows_copy_update(self):
+        """Test a copy with updated fields renders its own report."""
+        assessment = ActionabilityAssessment(
+            gene="KRAS",
+            variant="G12C",
+            tumor_type=None,
+            tier=ActionabilityTier.TIER_III,
+            confidence_score=0.6,
+            summary="Old summary",
+            rationale="Test rationale",
+        )
+        assert "Old summary" in assessment.to_report()
+
+        updated = assessment.model_copy(update={"summary": "New summary"})
+
+        assert "New summary" in updated.to_report()
+        assert "Old summary" not in updated.report
+        assert "Old summary" in assessment.report
+
+    def test_from_records_round_trip(self):
+        """Test serialized assessments can be rebuilt in bulk."""
+        original = ActionabilityAssessment(
+            gene="BRAF",
+            variant="V600E",
+            tumor_type="Melanoma",
+            tier=ActionabilityTier.TIER_I,
+            confidence_score=0.9,
+            summary="Test summary",
+            rationale="Test rationale",
+            recommended_therapies=[RecommendedTherapy(drug_name="Vemurafenib")],
+        )
+
+        rebuilt = ActionabilityAssessment.from_records([original.model_dump(mode="json")] * 2)
+
+        assert rebuilt == [original, original]
+        assert isinstance(rebuilt[0].recommended_therapies[0], RecommendedTherapy)
+
+        with pytest.raises(ValidationError):
+            ActionabilityAssessment.from_records([{"gene": "BRAF"}])
+
+    def test_to_json_round_trip(self):
+        """Test JSON bytes validate back to an equal assessment."""
+        assessment = ActionabilityAssessment(
+            gene="BRAF",
+            variant="V600E",
+            tumor_type="Melanoma",
+            tier=ActionabilityTier.TIER_I,
+            confidence_score=0.9,
+            summary="Test summary",
+            rationale="Test rationale",
+        )
+
+        data = assessment.to_json()
+
+        assert isinstance(data, bytes)
+        assert ActionabilityAssessment.model_validate_json(data) == assessment
+
 
 class TestValidationModels:
     """Tests for validation models."""
@@ -314,6 +441,47 @@ class TestEvidenceStats:
         assert stats['dominant_signal'] == 'sensitivity_only'
         assert stats['conflicts'] == []
 
+    def test_compute_stats_memoized_per_tumor_type(self):
+        """Test stats are computed once per tumor type."""
+        evidence = Evidence(
+            variant_id="EGFR:L858R",
+            gene="EGFR",
+            variant="L858R",
+            vicc=[VICCEvidence(drugs=["Erlotinib"], evidence_level="A", is_sensitivity=True, disease="NSCLC")],
+        )
+
+        stats = evidence.compute_evidence_stats("NSCLC")
+
+        assert evidence.compute_evidence_stats("NSCLC") is stats
+        assert evidence.compute_evidence_stats(None) is not stats
+
+    def test_stats_and_drug_aggregation_share_one_scan(self):
+        """Test stats and drug aggregation agree and leave the shared scan intact."""
+        evidence = Evidence(
+            variant_id="EGFR:T790M",
+            gene="EGFR",
+            variant="T790M",
+            vicc=[
+                VICCEvidence(drugs=["Erlotinib"], evidence_level="A", is_resistance=True, disease="NSCLC"),
+                VICCEvidence(drugs=["Osimertinib"], evidence_level="A", is_sensitivity=True, disease="NSCLC"),
+            ],
+            civic=[
+                CIViCEvidence(
+                    evidence_type="PREDICTIVE", evidence_level="B",
+                    clinical_significance="Resistance", drugs=["Erlotinib"],
+                ),
+            ],
+        )
+
+        stats = evidence.compute_evidence_stats()
+        first = evidence.aggregate_evidence_by_drug()
+        second = evidence.aggregate_evidence_by_drug()
+
+        assert stats['resistance_count'] == 2
+        assert {d['drug']: d['resistance_count'] for d in first} == {"Erlotinib": 2, "Osimertinib": 0}
+        assert first == second
+        assert first[0] is not second[0]
+
     def test_compute_stats_resistance_only(self):
         """Test stats when all evidence is resistance."""
         evidence = Evidence(
@@ -687,3 +855,20 @@ class TestDrugAggregation:
 
         summary = evidence.format_drug_aggregation_summary()
         assert summary == ""  # No summary for empty evidence
+
+    def test_aggregate_diseases_keep_first_seen_order(self):
+        """Test aggregated diseases are deduplicated in first-seen order."""
+        diseases = ["Melanoma", "Colorectal Cancer", "Melanoma", "Thyroid Cancer"]
+        evidence = Evidence(
+            variant_id="BRAF:V600E",
+            gene="BRAF",
+            variant="V600E",
+            vicc=[
+                VICCEvidence(drugs=["Vemurafenib"], evidence_level="A", is_sensitivity=True, disease=d)
+                for d in diseases
+            ],
+        )
+
+        aggregated = evidence.aggregate_evidence_by_drug()
+
+        assert aggregated[0]['diseases'] == ["Melanoma", "Colorectal Cancer", "Thyroid Cancer"]
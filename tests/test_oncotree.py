@@ -1,5 +1,6 @@
 """Tests for OncoTree API client."""
 
+import orjson
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -32,7 +33,7 @@ class TestOncoTreeClient:
             mock_http_client = AsyncMock()
             mock_http_client.get = AsyncMock()
             mock_http_client.get.return_value.raise_for_status = lambda: None
-            mock_http_client.get.return_value.json = lambda: mock_response
+            mock_http_client.get.return_value.content = orjson.dumps(mock_response)
             mock_get_client.return_value = mock_http_client
 
             # First call should fetch from API
@@ -203,3 +203,117 @@ class TestValidator:
             assert metrics.correct_predictions == 1
             assert metrics.accuracy == 0.5
             assert len(metrics.failure_analysis) == 1
+
+    @pytest.mark.asyncio
+    async def test_validate_dataset_caps_concurrency_and_keeps_order(self):
+        """At most max_concurrent assessments run at once; failures are reported in input order."""
+        import asyncio
+
+        from tumorboard.engine import AssessmentEngine
+
+        engine = AssessmentEngine()
+        validator = Validator(engine)
+        gold_standard = [
+            GoldStandardEntry(
+                gene="BRAF",
+                variant=f"V{600 + i}E",
+                tumor_type="Melanoma",
+                expected_tier=ActionabilityTier.TIER_I,
+            )
+            for i in range(6)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def slow_assess(variant_input):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier entries finish last
+            idx = int(variant_input.variant[1:4]) - 600
+            await asyncio.sleep(0.001 * (6 - idx))
+            in_flight -= 1
+            if variant_input.variant in ("V601E", "V604E"):
+                raise ValueError("unsupported")
+            return ActionabilityAssessment(
+                gene=variant_input.gene,
+                variant=variant_input.variant,
+                tumor_type=variant_input.tumor_type,
+                tier=ActionabilityTier.TIER_II,
+                confidence_score=0.5,
+                summary="Test",
+                rationale="Test",
+            )
+
+        with patch.object(engine, "assess_variant", side_effect=slow_assess):
+            metrics = await validator.validate_dataset(gold_standard, max_concurrent=2)
+
+        assert peak == 2
+        assert metrics.total_cases == 4
+        assert metrics.average_confidence == 0.5
+        assert [f["variant"] for f in metrics.failure_analysis] == [
+            "BRAF V600E", "BRAF V602E", "BRAF V603E", "BRAF V605E",
+        ]
+        assert [idx for idx, *_ in validator._last_failed_entries] == [1, 4]
+
+    @pytest.mark.asyncio
+    async def test_validate_dataset_surfaces_fatal_worker_errors(self):
+        """A non-Exception error in a worker should propagate instead of hanging the run."""
+        import asyncio
+
+        from tumorboard.engine import AssessmentEngine
+
+        class Fatal(BaseException):
+            pass
+
+        engine = AssessmentEngine()
+        validator = Validator(engine)
+        gold_standard = [
+            GoldStandardEntry(
+                gene="BRAF",
+                variant="V600E",
+                tumor_type="Melanoma",
+                expected_tier=ActionabilityTier.TIER_I,
+            )
+        ]
+
+        with patch.object(engine, "assess_variant", new_callable=AsyncMock, side_effect=Fatal()):
+            with pytest.raises(Fatal):
+                await asyncio.wait_for(validator.validate_dataset(gold_standard), timeout=5)
+
+    def test_save_results_round_trip(self, tmp_path, sample_gold_standard_entry):
+        """Saved results should be plain JSON with enums written as their values."""
+        from tumorboard.engine import AssessmentEngine
+        from tumorboard.models.validation import ValidationMetrics, ValidationResult
+
+        validator = Validator(AssessmentEngine())
+        assessment = ActionabilityAssessment(
+            gene="BRAF",
+            variant="V600E",
+            tumor_type="Melanoma",
+            tier=ActionabilityTier.TIER_II,
+            confidence_score=0.7,
+            summary="Test",
+            rationale="Test",
+        )
+        result = ValidationResult(
+            gene="BRAF",
+            variant="V600E",
+            tumor_type="Melanoma",
+            expected_tier=ActionabilityTier.TIER_I,
+            predicted_tier=ActionabilityTier.TIER_II,
+            is_correct=False,
+            confidence_score=0.7,
+            assessment=assessment,
+        )
+        metrics = ValidationMetrics()
+        metrics.calculate([result])
+
+        output_path = tmp_path / "results.json"
+        validator.save_results(metrics, [result], output_path)
+
+        saved = json.loads(output_path.read_text())
+        assert saved["metrics"]["total_cases"] == 1
+        assert saved["metrics"]["failure_analysis"][0]["expected"] == "Tier I"
+        assert saved["results"][0]["predicted_tier"] == "Tier II"
+        assert saved["results"][0]["assessment"]["tier"] == "Tier II"
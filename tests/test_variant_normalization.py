@@ -37,6 +37,13 @@ class TestVariantNormalizer:
         assert result['alt_aa'] == "E"
         assert result['is_missense'] is True
 
+    def test_memoized_normalization_returns_independent_copies(self):
+        """Repeat normalizations should not share a mutable result."""
+        first = VariantNormalizer.normalize_protein_change("V600E")
+        first['short_form'] = "mutated"
+
+        assert VariantNormalizer.normalize_protein_change("V600E")['short_form'] == "V600E"
+
     def test_hgvs_protein_normalization(self):
         """Test normalization of HGVS protein notation."""
         # p.V600E format
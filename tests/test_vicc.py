@@ -1,5 +1,6 @@
 """Tests for VICC (Variant Interpretation for Cancer Consortium) MetaKB client."""
 
+import orjson
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
@@ -307,7 +308,7 @@ class TestVICCClient:
         with patch.object(client, "_get_client") as mock_get_client:
             mock_http_client = AsyncMock()
             mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = orjson.dumps(mock_response)
             mock_response_obj.raise_for_status = MagicMock()
             mock_http_client.get.return_value = mock_response_obj
             mock_get_client.return_value = mock_http_client
@@ -357,7 +358,7 @@ class TestVICCClient:
         with patch.object(client, "_get_client") as mock_get_client:
             mock_http_client = AsyncMock()
             mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = orjson.dumps(mock_response)
             mock_response_obj.raise_for_status = MagicMock()
             mock_http_client.get.return_value = mock_response_obj
             mock_get_client.return_value = mock_http_client
@@ -405,7 +406,7 @@ class TestVICCClient:
         with patch.object(client, "_get_client") as mock_get_client:
             mock_http_client = AsyncMock()
             mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = orjson.dumps(mock_response)
             mock_response_obj.raise_for_status = MagicMock()
             mock_http_client.get.return_value = mock_response_obj
             mock_get_client.return_value = mock_http_client
@@ -445,7 +446,7 @@ class TestVICCClient:
         with patch.object(client, "_get_client") as mock_get_client:
             mock_http_client = AsyncMock()
             mock_response_obj = MagicMock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = orjson.dumps(mock_response)
             mock_response_obj.raise_for_status = MagicMock()
             mock_http_client.get.return_value = mock_response_obj
             mock_get_client.return_value = mock_http_client